@@ -5,12 +5,16 @@ NIKAN DRILL MASTER - Complete Drilling Reporting System
 Single File Implementation with SQLite Database
 """
 
+import os
+import re
 import sys
 import sqlite3
+from array import array
+from collections import OrderedDict
 import json
 import hashlib
+from functools import lru_cache, partial
 import pandas as pd
-from pathlib import Path
 from datetime import datetime, date, time, timedelta
 from dataclasses import dataclass, asdict, field
 from typing import List, Dict, Any, Optional, Tuple, Union
@@ -22,6 +26,111 @@ from PySide6.QtCore import *
 from PySide6.QtGui import *
 from PySide6.QtPrintSupport import QPrinter, QPrintDialog
 
+# Numba is optional: without it the kernels below run as plain NumPy
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# ============================================
+# CALCULATION HELPERS SECTION
+# ============================================
+
+def duration_seconds(sh, sm, eh, em):
+    """Seconds from sh:sm to eh:em, wrapping past midnight"""
+    start_secs = sh * 3600 + sm * 60
+    end_secs = eh * 3600 + em * 60
+    if end_secs < start_secs:
+        end_secs += 24 * 3600  # Next day
+    return end_secs - start_secs
+
+@njit(cache=True)
+def compute_durations(sh, sm, eh, em):
+    """Time log durations in seconds, wrapping past midnight (int32 arrays)"""
+    start_secs = sh * 3600 + sm * 60
+    end_secs = eh * 3600 + em * 60
+    durations = end_secs - start_secs
+    return np.where(durations < 0, durations + 86400, durations).astype(np.int32)
+
+@njit(cache=True)
+def rop_depth_bins(end_depth, footage, hours, bin_size):
+    """Average ROP (m/h) per depth interval of bin_size metres, keyed by interval top.
+    
+    Rows with a NaN/inf value (NULL depths) or a negative end depth are skipped.
+    """
+    max_depth = -1.0
+    for i in range(end_depth.size):
+        depth = end_depth[i]
+        if np.isfinite(depth) and depth > max_depth:
+            max_depth = depth
+    bin_count = int(max_depth // bin_size) + 1 if max_depth >= 0 else 0
+    bin_footage = np.zeros(bin_count)
+    bin_hours = np.zeros(bin_count)
+    for i in range(end_depth.size):
+        depth = end_depth[i]
+        if not (np.isfinite(depth) and depth >= 0 and np.isfinite(footage[i]) and np.isfinite(hours[i])):
+            continue
+        b = int(depth // bin_size)
+        bin_footage[b] += footage[i]
+        bin_hours[b] += hours[i]
+    tops = np.arange(bin_count) * bin_size
+    rop = np.zeros(bin_count)
+    for b in range(bin_count):
+        if bin_hours[b] > 0:
+            rop[b] = bin_footage[b] / bin_hours[b]
+    return tops, rop
+
+@njit(cache=True)
+def npt_breakdown(code_ids, minutes, code_count):
+    """Event count and total minutes per NPT code id"""
+    counts = np.zeros(code_count, dtype=np.int64)
+    totals = np.zeros(code_count)
+    for i in range(code_ids.size):
+        counts[code_ids[i]] += 1
+        totals[code_ids[i]] += minutes[i]
+    return counts, totals
+
+def warm_up_kernels():
+    """Run each kernel once on tiny inputs so (numba) compilation happens early"""
+    compute_durations(*(np.zeros(1, dtype=np.int32) for _ in range(4)))
+    rop_depth_bins(np.ones(1), np.ones(1), np.ones(1), 100.0)
+    npt_breakdown(np.zeros(1, dtype=np.int64), np.ones(1), 1)
+
+def minimum_curvature(md, inc, azi, vs_azimuth=0.0):
+    """Minimum-curvature positions for survey stations (MD in m, angles in degrees).
+    
+    The surface (MD 0, vertical) is used as tie-on point. Returns arrays of
+    TVD, North, East, VS, HD and DLS (°/30m), one value per station.
+    """
+    md = np.concatenate(([0.0], np.asarray(md, dtype=np.float64)))
+    inc = np.radians(np.concatenate(([0.0], np.asarray(inc, dtype=np.float64))))
+    azi = np.radians(np.concatenate(([0.0], np.asarray(azi, dtype=np.float64))))
+    
+    dmd = np.diff(md)
+    inc1, inc2 = inc[:-1], inc[1:]
+    azi1, azi2 = azi[:-1], azi[1:]
+    
+    cos_beta = np.cos(inc2 - inc1) - np.sin(inc1) * np.sin(inc2) * (1.0 - np.cos(azi2 - azi1))
+    beta = np.arccos(np.clip(cos_beta, -1.0, 1.0))
+    safe_beta = np.where(beta > 1e-9, beta, 1.0)
+    rf = np.where(beta > 1e-9, 2.0 / safe_beta * np.tan(safe_beta / 2.0), 1.0)
+    
+    half = dmd / 2.0 * rf
+    tvd = np.cumsum(half * (np.cos(inc1) + np.cos(inc2)))
+    north = np.cumsum(half * (np.sin(inc1) * np.cos(azi1) + np.sin(inc2) * np.cos(azi2)))
+    east = np.cumsum(half * (np.sin(inc1) * np.sin(azi1) + np.sin(inc2) * np.sin(azi2)))
+    
+    vs_rad = np.radians(vs_azimuth)
+    vs = north * np.cos(vs_rad) + east * np.sin(vs_rad)
+    hd = np.hypot(north, east)
+    safe_dmd = np.where(dmd > 0, dmd, 1.0)
+    dls = np.where(dmd > 0, np.degrees(beta) * 30.0 / safe_dmd, 0.0)
+    return tvd, north, east, vs, hd, dls
+
 # ============================================
 # DATA MODELS SECTION
 # ============================================
@@ -67,11 +176,10 @@ class WellInfo:
     created_at: str = ""
     updated_at: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class TimeLogEntry:
     """Time log entry model"""
-    id: int = 0
-    report_id: int = 0
+    # Row fields first so entries can be built positionally from the dialog
     start_time: str = "00:00"
     end_time: str = "00:00"
     duration: str = "00:00"
@@ -81,6 +189,86 @@ class TimeLogEntry:
     is_npt: bool = False
     status: str = "In Progress"
     remarks: str = ""
+    id: int = 0
+    report_id: int = 0
+
+class TimeLogColumns:
+    """Column-wise (SoA) time log storage; deletes tombstone a slot until compact() drops them"""
+    __slots__ = (
+        "start_time", "end_time", "duration", "main_code", "sub_code",
+        "description", "is_npt", "status", "remarks", "alive", "_live"
+    )
+    
+    def __init__(self):
+        self.clear()
+    
+    def clear(self):
+        self.start_time = []
+        self.end_time = []
+        self.duration = []
+        self.main_code = []
+        self.sub_code = []
+        self.description = []
+        self.is_npt = array("b")
+        self.status = []
+        self.remarks = []
+        self.alive = array("b")
+        self._live = 0
+    
+    def __len__(self):
+        return self._live
+    
+    def dead_count(self) -> int:
+        """Number of tombstoned slots still held"""
+        return len(self.alive) - self._live
+    
+    def compact(self) -> List[int]:
+        """Drop tombstoned slots; returns the new index of every old slot (-1 if dead)"""
+        alive = self.alive
+        remap = []
+        live = 0
+        for flag in alive:
+            remap.append(live if flag else -1)
+            live += flag
+        
+        for name in self.__slots__[:-2]:
+            column = getattr(self, name)
+            kept = [value for value, flag in zip(column, alive) if flag]
+            setattr(self, name, array("b", kept) if name == "is_npt" else kept)
+        self.alive = array("b", [1]) * live
+        return remap
+    
+    def append(self, entry: TimeLogEntry) -> int:
+        """Store entry and return its slot index"""
+        self.start_time.append(entry.start_time)
+        self.end_time.append(entry.end_time)
+        self.duration.append(entry.duration)
+        self.main_code.append(entry.main_code)
+        self.sub_code.append(entry.sub_code)
+        self.description.append(entry.description)
+        self.is_npt.append(1 if entry.is_npt else 0)
+        self.status.append(entry.status)
+        self.remarks.append(entry.remarks)
+        self.alive.append(1)
+        self._live += 1
+        return len(self.alive) - 1
+    
+    def delete(self, index: int) -> None:
+        """Tombstone the slot at index"""
+        if 0 <= index < len(self.alive) and self.alive[index]:
+            self.alive[index] = 0
+            self._live -= 1
+    
+    def entries(self) -> List[TimeLogEntry]:
+        """Live entries in insertion order"""
+        return [
+            TimeLogEntry(
+                self.start_time[i], self.end_time[i], self.duration[i],
+                self.main_code[i], self.sub_code[i], self.description[i],
+                bool(self.is_npt[i]), self.status[i], self.remarks[i]
+            )
+            for i, alive in enumerate(self.alive) if alive
+        ]
 
 @dataclass
 class DailyReport:
@@ -209,7 +397,7 @@ class BitRecord:
     photo_after: str = ""
     created_date: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class BHAComponent:
     """BHA component model"""
     id: int = 0
@@ -222,7 +410,7 @@ class BHAComponent:
     weight: float = 0.0  # kg
     remarks: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class BHARun:
     """BHA run model"""
     id: int = 0
@@ -273,7 +461,7 @@ class Personnel:
     contact: str = ""
     emergency_contact: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     """Inventory item model"""
     id: int = 0
@@ -528,13 +716,21 @@ class Preferences:
 # DATABASE MANAGER SECTION
 # ============================================
 
-class DatabaseManager:
+class DatabaseManager(QObject):
     """SQLite database manager for Nikan Drill Master"""
+    wells_changed = Signal()
     
     def __init__(self, db_path="nikan_drill_master.db"):
+        super().__init__()
         self.db_path = db_path
         self.connection = None
         self.cursor = None
+        # Well lists cached until save_well_info() changes the wells table
+        self._wells_cache = None
+        self._well_choices_cache = None
+        # Long-lived GUI-thread connection for frequent loads, so sqlite3's
+        # per-connection statement cache keeps their compiled SQL
+        self._read_connection = None
         self.init_database()
     
     def connect(self):
@@ -543,6 +739,10 @@ class DatabaseManager:
             self.connection = sqlite3.connect(self.db_path)
             self.cursor = self.connection.cursor()
             self.connection.execute("PRAGMA foreign_keys = ON")
+            # WAL lets readers run alongside a writer and avoids an fsync per insert
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+            self.connection.execute("PRAGMA temp_store = MEMORY")
             return True
         except Exception as e:
             print(f"Database connection error: {e}")
@@ -552,6 +752,9 @@ class DatabaseManager:
         """Close database connection"""
         if self.connection:
             self.connection.close()
+        if self._read_connection is not None:
+            self._read_connection.close()
+            self._read_connection = None
     
     def init_database(self):
         """Initialize database with all required tables"""
@@ -798,7 +1001,7 @@ class DatabaseManager:
                 run_id INTEGER NOT NULL,
                 tool_type TEXT,
                 od REAL,
-                id REAL,
+                inner_diameter REAL,
                 length REAL,
                 serial_no TEXT,
                 weight REAL,
@@ -994,7 +1197,7 @@ class DatabaseManager:
                 weight REAL,
                 grade TEXT,
                 connection TEXT,
-                id REAL,
+                inner_diameter REAL,
                 tj_od REAL,
                 tj_id REAL,
                 std_no_in_derrick INTEGER,
@@ -1164,11 +1367,10 @@ class DatabaseManager:
                     ("Repair", "RP", "REPR", "Repair", "Equipment repair", 1, "#F44336"),
                     ("Maintenance", "MT", "MNT", "Maintenance", "Scheduled maintenance", 1, "#9C27B0"),
                 ]
-                for code in default_codes:
-                    self.cursor.execute("""
-                    INSERT INTO code_definitions (main_phase, main_code, sub_code, code_name, description, is_npt, color, created_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
-                    """, code)
+                self.cursor.executemany("""
+                INSERT INTO code_definitions (main_phase, main_code, sub_code, code_name, description, is_npt, color, created_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+                """, default_codes)
             
             self.connection.commit()
             print("Database initialized successfully")
@@ -1186,89 +1388,70 @@ class DatabaseManager:
             return -1
         
         try:
-            # Check if well already exists
-            self.cursor.execute(
-                "SELECT id FROM wells WHERE name = ?",
-                (well_info.name,)
-            )
-            existing = self.cursor.fetchone()
-            
-            if existing:
-                # Update existing well
-                self.cursor.execute("""
-                UPDATE wells SET
-                    rig_name=?, operator=?, field=?, project=?,
-                    well_type=?, rig_type=?, well_shape=?,
-                    derrick_height=?, gle=?, rte=?, msl=?, kop1=?, kop2=?,
-                    latitude=?, longitude=?, northing=?, easting=?,
-                    hole_size=?, final_depth=?, water_depth=?,
-                    spud_date=?, start_hole_date=?, rig_move_date=?,
-                    report_date=?, supervisor_day=?, supervisor_night=?,
-                    toolpusher_day=?, toolpusher_night=?, operation_manager=?,
-                    geologist1=?, geologist2=?, client_rep=?, objectives=?,
-                    updated_at=CURRENT_TIMESTAMP
-                WHERE name=?
-                """, (
-                    well_info.rig_name, well_info.operator, well_info.field,
-                    well_info.project, well_info.well_type, well_info.rig_type,
-                    well_info.well_shape, well_info.derrick_height,
-                    well_info.gle, well_info.rte, well_info.msl,
-                    well_info.kop1, well_info.kop2,
-                    well_info.latitude, well_info.longitude,
-                    well_info.northing, well_info.easting,
-                    well_info.hole_size, well_info.final_depth,
-                    well_info.water_depth, well_info.spud_date,
-                    well_info.start_hole_date, well_info.rig_move_date,
-                    well_info.report_date, well_info.supervisor_day,
-                    well_info.supervisor_night, well_info.toolpusher_day,
-                    well_info.toolpusher_night, well_info.operation_manager,
-                    well_info.geologist1, well_info.geologist2,
-                    well_info.client_rep, well_info.objectives,
-                    well_info.name
-                ))
-                well_id = existing[0]
-            else:
-                # Insert new well
-                self.cursor.execute("""
-                INSERT INTO wells (
-                    name, rig_name, operator, field, project,
-                    well_type, rig_type, well_shape, derrick_height,
-                    gle, rte, msl, kop1, kop2, latitude, longitude,
-                    northing, easting, hole_size, final_depth, water_depth,
-                    spud_date, start_hole_date, rig_move_date, report_date,
-                    supervisor_day, supervisor_night, toolpusher_day,
-                    toolpusher_night, operation_manager, geologist1,
-                    geologist2, client_rep, objectives
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                         ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                         ?, ?, ?, ?)
-                """, (
-                    well_info.name, well_info.rig_name, well_info.operator,
-                    well_info.field, well_info.project, well_info.well_type,
-                    well_info.rig_type, well_info.well_shape,
-                    well_info.derrick_height, well_info.gle, well_info.rte,
-                    well_info.msl, well_info.kop1, well_info.kop2,
-                    well_info.latitude, well_info.longitude,
-                    well_info.northing, well_info.easting,
-                    well_info.hole_size, well_info.final_depth,
-                    well_info.water_depth, well_info.spud_date,
-                    well_info.start_hole_date, well_info.rig_move_date,
-                    well_info.report_date, well_info.supervisor_day,
-                    well_info.supervisor_night, well_info.toolpusher_day,
-                    well_info.toolpusher_night, well_info.operation_manager,
-                    well_info.geologist1, well_info.geologist2,
-                    well_info.client_rep, well_info.objectives
-                ))
-                well_id = self.cursor.lastrowid
+            # Insert, or update the well with the same name, in one statement
+            self.cursor.execute("""
+            INSERT INTO wells (
+                name, rig_name, operator, field, project,
+                well_type, rig_type, well_shape, derrick_height,
+                gle, rte, msl, kop1, kop2, latitude, longitude,
+                northing, easting, hole_size, final_depth, water_depth,
+                spud_date, start_hole_date, rig_move_date, report_date,
+                supervisor_day, supervisor_night, toolpusher_day,
+                toolpusher_night, operation_manager, geologist1,
+                geologist2, client_rep, objectives
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                     ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                     ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                rig_name=excluded.rig_name, operator=excluded.operator,
+                field=excluded.field, project=excluded.project,
+                well_type=excluded.well_type, rig_type=excluded.rig_type,
+                well_shape=excluded.well_shape, derrick_height=excluded.derrick_height,
+                gle=excluded.gle, rte=excluded.rte, msl=excluded.msl,
+                kop1=excluded.kop1, kop2=excluded.kop2,
+                latitude=excluded.latitude, longitude=excluded.longitude,
+                northing=excluded.northing, easting=excluded.easting,
+                hole_size=excluded.hole_size, final_depth=excluded.final_depth,
+                water_depth=excluded.water_depth, spud_date=excluded.spud_date,
+                start_hole_date=excluded.start_hole_date, rig_move_date=excluded.rig_move_date,
+                report_date=excluded.report_date, supervisor_day=excluded.supervisor_day,
+                supervisor_night=excluded.supervisor_night, toolpusher_day=excluded.toolpusher_day,
+                toolpusher_night=excluded.toolpusher_night, operation_manager=excluded.operation_manager,
+                geologist1=excluded.geologist1, geologist2=excluded.geologist2,
+                client_rep=excluded.client_rep, objectives=excluded.objectives,
+                updated_at=CURRENT_TIMESTAMP
+            RETURNING id
+            """, (
+                well_info.name, well_info.rig_name, well_info.operator,
+                well_info.field, well_info.project, well_info.well_type,
+                well_info.rig_type, well_info.well_shape,
+                well_info.derrick_height, well_info.gle, well_info.rte,
+                well_info.msl, well_info.kop1, well_info.kop2,
+                well_info.latitude, well_info.longitude,
+                well_info.northing, well_info.easting,
+                well_info.hole_size, well_info.final_depth,
+                well_info.water_depth, well_info.spud_date,
+                well_info.start_hole_date, well_info.rig_move_date,
+                well_info.report_date, well_info.supervisor_day,
+                well_info.supervisor_night, well_info.toolpusher_day,
+                well_info.toolpusher_night, well_info.operation_manager,
+                well_info.geologist1, well_info.geologist2,
+                well_info.client_rep, well_info.objectives
+            ))
+            well_id = self.cursor.fetchone()[0]
             
             self.connection.commit()
-            return well_id
             
         except Exception as e:
             print(f"Save well info error: {e}")
             return -1
         finally:
             self.disconnect()
+        
+        self._wells_cache = None
+        self._well_choices_cache = None
+        self.wells_changed.emit()
+        return well_id
     
     def get_well_info(self, well_id: int) -> Optional[WellInfo]:
         """Retrieve well information by ID"""
@@ -1303,7 +1486,10 @@ class DatabaseManager:
             self.disconnect()
     
     def get_all_wells(self) -> List[WellInfo]:
-        """Retrieve all wells from database"""
+        """Retrieve all wells from database (cached until wells change)"""
+        if self._wells_cache is not None:
+            return list(self._wells_cache)
+        
         if not self.connect():
             return []
         
@@ -1327,7 +1513,8 @@ class DatabaseManager:
                     geologist1=row[31], geologist2=row[32], client_rep=row[33],
                     objectives=row[34], created_at=row[35], updated_at=row[36]
                 ))
-            return wells
+            self._wells_cache = wells
+            return list(wells)
             
         except Exception as e:
             print(f"Get all wells error: {e}")
@@ -1335,69 +1522,65 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
+    def get_well_choices(self) -> List[tuple]:
+        """(well_id, "name - field") pairs for well selection combos"""
+        if self._well_choices_cache is None:
+            self._well_choices_cache = [(well.id, f"{well.name} - {well.field}") for well in self.get_all_wells()]
+        return self._well_choices_cache
+    
     def save_daily_report(self, report: DailyReport) -> int:
         """Save daily report to database"""
+        return self.save_daily_report_batched(report)
+    
+    def save_daily_report_batched(self, report: DailyReport) -> int:
+        """Save daily report and its time logs in a single transaction"""
         if not self.connect():
             return -1
         
         try:
-            # Check if report already exists for this date
-            self.cursor.execute(
-                "SELECT id FROM daily_reports WHERE well_id = ? AND report_date = ?",
-                (report.well_id, report.report_date)
-            )
-            existing = self.cursor.fetchone()
-            
-            if existing:
-                # Update existing report
-                self.cursor.execute("""
-                UPDATE daily_reports SET
-                    rig_day=?, depth_0000=?, depth_0600=?, depth_2400=?,
-                    pit_gain=?, operations_done=?, work_summary=?,
-                    problems=?, general_notes=?, updated_at=CURRENT_TIMESTAMP
-                WHERE id=?
-                """, (
-                    report.rig_day, report.depth_0000, report.depth_0600,
-                    report.depth_2400, report.pit_gain, report.operations_done,
-                    report.work_summary, report.problems, report.general_notes,
-                    existing[0]
-                ))
-                report_id = existing[0]
-            else:
-                # Insert new report
+            with self.connection:
+                # Insert, or update the report for this well and date, in one statement
                 self.cursor.execute("""
                 INSERT INTO daily_reports (
                     well_id, report_date, rig_day, depth_0000, depth_0600,
                     depth_2400, pit_gain, operations_done, work_summary,
                     problems, general_notes
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(well_id, report_date) DO UPDATE SET
+                    rig_day=excluded.rig_day, depth_0000=excluded.depth_0000,
+                    depth_0600=excluded.depth_0600, depth_2400=excluded.depth_2400,
+                    pit_gain=excluded.pit_gain, operations_done=excluded.operations_done,
+                    work_summary=excluded.work_summary, problems=excluded.problems,
+                    general_notes=excluded.general_notes, updated_at=CURRENT_TIMESTAMP
+                RETURNING id
                 """, (
                     report.well_id, report.report_date, report.rig_day,
                     report.depth_0000, report.depth_0600, report.depth_2400,
                     report.pit_gain, report.operations_done, report.work_summary,
                     report.problems, report.general_notes
                 ))
-                report_id = self.cursor.lastrowid
-            
-            # Save time logs
-            if report.time_logs:
-                # Delete existing time logs for this report
-                self.cursor.execute("DELETE FROM time_logs WHERE report_id = ?", (report_id,))
+                report_id = self.cursor.fetchone()[0]
                 
-                # Insert new time logs
-                for log in report.time_logs:
-                    self.cursor.execute("""
+                # Save time logs
+                if report.time_logs:
+                    # Delete existing time logs for this report
+                    self.cursor.execute("DELETE FROM time_logs WHERE report_id = ?", (report_id,))
+                    
+                    # Insert new time logs in one batch
+                    self.cursor.executemany("""
                     INSERT INTO time_logs (
                         report_id, start_time, end_time, duration,
                         main_code, sub_code, description, is_npt, status, remarks
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        report_id, log.start_time, log.end_time, log.duration,
-                        log.main_code, log.sub_code, log.description,
-                        1 if log.is_npt else 0, log.status, log.remarks
-                    ))
+                    """, [
+                        (
+                            report_id, log.start_time, log.end_time, log.duration,
+                            log.main_code, log.sub_code, log.description,
+                            1 if log.is_npt else 0, log.status, log.remarks
+                        )
+                        for log in report.time_logs
+                    ])
             
-            self.connection.commit()
             return report_id
             
         except Exception as e:
@@ -1406,27 +1589,351 @@ class DatabaseManager:
         finally:
             self.disconnect()
     
-    def authenticate_user(self, username: str, password: str) -> Optional[User]:
-        """Authenticate user with username and password"""
+    def get_daily_report(self, well_id: int, report_date: str) -> Optional[DailyReport]:
+        """Retrieve daily report and time logs for a well/date.
+        
+        Uses its own short-lived connection so it can run on a worker thread.
+        """
+        try:
+            connection = sqlite3.connect(self.db_path)
+        except Exception as e:
+            print(f"Database connection error: {e}")
+            return None
+        
+        try:
+            cursor = connection.cursor()
+            cursor.execute("""
+            SELECT id, well_id, report_date, rig_day, depth_0000, depth_0600,
+                   depth_2400, pit_gain, operations_done, work_summary,
+                   problems, general_notes
+            FROM daily_reports WHERE well_id = ? AND report_date = ?
+            """, (well_id, report_date))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            
+            report = DailyReport(
+                id=row[0], well_id=row[1], report_date=row[2], rig_day=row[3] or 1,
+                depth_0000=row[4] or 0.0, depth_0600=row[5] or 0.0,
+                depth_2400=row[6] or 0.0, pit_gain=row[7] or 0.0,
+                operations_done=row[8] or "", work_summary=row[9] or "",
+                problems=row[10] or "", general_notes=row[11] or ""
+            )
+            
+            cursor.execute("""
+            SELECT id, report_id, start_time, end_time, duration, main_code,
+                   sub_code, description, is_npt, status, remarks
+            FROM time_logs WHERE report_id = ? ORDER BY id
+            """, (report.id,))
+            for log in cursor.fetchall():
+                report.time_logs.append(TimeLogEntry(
+                    start_time=log[2] or "00:00", end_time=log[3] or "00:00",
+                    duration=log[4] or "00:00", main_code=log[5] or "",
+                    sub_code=log[6] or "", description=log[7] or "",
+                    is_npt=bool(log[8]), status=log[9] or "",
+                    remarks=log[10] or "", id=log[0], report_id=log[1]
+                ))
+            return report
+            
+        except Exception as e:
+            print(f"Get daily report error: {e}")
+            return None
+        finally:
+            connection.close()
+    
+    def _worker_query(self, sql, params=()):
+        """Run a SELECT on a short-lived connection (safe on worker threads)"""
+        connection = sqlite3.connect(self.db_path)
+        try:
+            return connection.execute(sql, params).fetchall()
+        finally:
+            connection.close()
+    
+    def get_drilling_progress(self, well_id: int = -1) -> List[tuple]:
+        """(depth_0000, depth_2400, drilling minutes) per daily report; all wells if well_id < 0"""
+        try:
+            return self._worker_query("""
+            SELECT dr.depth_0000, dr.depth_2400,
+                   COALESCE(SUM(CASE WHEN tl.main_code = 'Drilling'
+                       THEN CAST(substr(tl.duration, 1, 2) AS INTEGER) * 60
+                            + CAST(substr(tl.duration, 4, 2) AS INTEGER) END), 0)
+            FROM daily_reports dr LEFT JOIN time_logs tl ON tl.report_id = dr.id
+            WHERE ? < 0 OR dr.well_id = ?
+            GROUP BY dr.id ORDER BY dr.report_date
+            """, (well_id, well_id))
+        except Exception as e:
+            print(f"Get drilling progress error: {e}")
+            return []
+    
+    def get_npt_durations(self, well_id: int = -1) -> List[tuple]:
+        """(main_code, minutes) for every NPT time log; all wells if well_id < 0"""
+        try:
+            return self._worker_query("""
+            SELECT tl.main_code,
+                   CAST(substr(tl.duration, 1, 2) AS INTEGER) * 60
+                   + CAST(substr(tl.duration, 4, 2) AS INTEGER)
+            FROM time_logs tl JOIN daily_reports dr ON dr.id = tl.report_id
+            WHERE tl.is_npt = 1 AND (? < 0 OR dr.well_id = ?)
+            """, (well_id, well_id))
+        except Exception as e:
+            print(f"Get NPT durations error: {e}")
+            return []
+    
+    def iter_daily_report_rows(self, well_id: int = -1, batch_size: int = 500):
+        """Yield daily report summary rows in batches; all wells if well_id < 0"""
+        connection = sqlite3.connect(self.db_path)
+        try:
+            cursor = connection.execute("""
+            SELECT w.name, dr.report_date, dr.rig_day, dr.depth_0000, dr.depth_2400,
+                   dr.depth_2400 - dr.depth_0000, dr.work_summary
+            FROM daily_reports dr JOIN wells w ON w.id = dr.well_id
+            WHERE ? < 0 OR dr.well_id = ?
+            ORDER BY w.name, dr.report_date
+            """, (well_id, well_id))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            connection.close()
+    
+    def _read_query(self, sql, params=()):
+        """Run a SELECT on the shared read connection (statement cache reused)"""
+        if self._read_connection is None:
+            self._read_connection = sqlite3.connect(self.db_path, cached_statements=256)
+        return self._read_connection.execute(sql, params).fetchall()
+    
+    def get_personnel(self, well_id: int) -> List[Personnel]:
+        """Retrieve the crew list of a well"""
+        try:
+            rows = self._read_query("""
+            SELECT id, well_id, company, name, position, arrival_date,
+                   departure_date, pob_status, contact, emergency_contact
+            FROM personnel WHERE well_id = ? ORDER BY company, name
+            """, (well_id,))
+        except Exception as e:
+            print(f"Get personnel error: {e}")
+            return []
+        
+        return [
+            Personnel(
+                id=row[0], well_id=row[1], company=row[2], name=row[3],
+                position=row[4], arrival_date=row[5], departure_date=row[6],
+                pob_status=bool(row[7]), contact=row[8], emergency_contact=row[9]
+            )
+            for row in rows
+        ]
+    
+    def get_formation_tops(self, well_id: int) -> List[FormationTop]:
+        """Retrieve formation tops of a well ordered by depth"""
+        try:
+            rows = self._read_query("""
+            SELECT id, well_id, name, lithology, md, tvd, description
+            FROM formation_tops WHERE well_id = ? ORDER BY md
+            """, (well_id,))
+        except Exception as e:
+            print(f"Get formation tops error: {e}")
+            return []
+        
+        return [
+            FormationTop(
+                id=row[0], well_id=row[1], name=row[2], lithology=row[3],
+                md=row[4], tvd=row[5], description=row[6]
+            )
+            for row in rows
+        ]
+    
+    def get_weather_history(self, well_id: int, hours: int = 24) -> List[tuple]:
+        """Retrieve weather observations of a well recorded in the last hours"""
+        try:
+            return self._read_query("""
+            SELECT wd.recorded_time, wd.wind_speed, wd.wind_direction,
+                   wd.temperature, wd.visibility, wd.sea_state
+            FROM weather_data wd JOIN daily_reports dr ON dr.id = wd.report_id
+            WHERE dr.well_id = ? AND wd.recorded_time >= datetime('now', ?)
+            ORDER BY wd.recorded_time DESC
+            """, (well_id, f"-{hours} hours"))
+        except Exception as e:
+            print(f"Get weather history error: {e}")
+            return []
+    
+    def get_inventory_many(self, well_id: int) -> List[InventoryItem]:
+        """Retrieve all inventory items of a well in one query (safe on worker threads)"""
+        try:
+            rows = self._worker_query("""
+            SELECT id, well_id, item, opening, received, used, remaining,
+                   unit, category, last_updated
+            FROM inventory WHERE well_id = ? ORDER BY id
+            """, (well_id,))
+        except Exception as e:
+            print(f"Get inventory error: {e}")
+            return []
+        
+        return [
+            InventoryItem(
+                id=row[0], well_id=row[1], item=row[2], opening=row[3],
+                received=row[4], used=row[5], remaining=row[6], unit=row[7],
+                category=row[8], last_updated=row[9]
+            )
+            for row in rows
+        ]
+    
+    def bulk_upsert_inventory(self, well_id: int, items: List[InventoryItem]) -> Optional[List[int]]:
+        """Replace a well's inventory with items in one transaction; returns their ids (None on error)"""
+        connection = sqlite3.connect(self.db_path)
+        try:
+            with connection:
+                existing = [item for item in items if item.id]
+                
+                # Drop rows deleted from the list since the last save
+                connection.execute(
+                    "DELETE FROM inventory WHERE well_id = ? AND id NOT IN (SELECT value FROM json_each(?))",
+                    (well_id, json.dumps([item.id for item in existing]))
+                )
+                # Rows owned by another well are never moved over to this one
+                connection.executemany("""
+                INSERT INTO inventory (
+                    id, well_id, item, opening, received, used,
+                    remaining, unit, category, last_updated
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    item=excluded.item,
+                    opening=excluded.opening, received=excluded.received,
+                    used=excluded.used, remaining=excluded.remaining,
+                    unit=excluded.unit, category=excluded.category,
+                    last_updated=excluded.last_updated
+                WHERE inventory.well_id = excluded.well_id
+                """, [
+                    (
+                        item.id, well_id, item.item, item.opening, item.received,
+                        item.used, item.remaining, item.unit, item.category,
+                        item.last_updated
+                    )
+                    for item in existing
+                ])
+                
+                # New items take their ids from AUTOINCREMENT
+                ids = []
+                for item in items:
+                    if item.id:
+                        ids.append(item.id)
+                        continue
+                    cursor = connection.execute("""
+                    INSERT INTO inventory (
+                        well_id, item, opening, received, used,
+                        remaining, unit, category, last_updated
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        well_id, item.item, item.opening, item.received,
+                        item.used, item.remaining, item.unit, item.category,
+                        item.last_updated
+                    ))
+                    ids.append(cursor.lastrowid)
+            
+            return ids
+            
+        except Exception as e:
+            print(f"Save inventory error: {e}")
+            return None
+        finally:
+            connection.close()
+    
+    def save_weather_record(self, well_id: int, weather: WeatherData) -> int:
+        """Save a weather observation under the well's latest daily report (-1 if it has none)"""
+        if not self.connect():
+            return -1
+        
+        try:
+            with self.connection:
+                row = self.cursor.execute("""
+                SELECT id FROM daily_reports WHERE well_id = ?
+                ORDER BY report_date DESC LIMIT 1
+                """, (well_id,)).fetchone()
+                if row is None:
+                    return -1
+                
+                # recorded_time uses datetime('now') so it compares with the history window
+                self.cursor.execute("""
+                INSERT INTO weather_data (
+                    report_id, wind_speed, wind_direction, temperature,
+                    visibility, sea_state, wave_height, recorded_time
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+                """, (
+                    row[0], weather.wind_speed, weather.wind_direction,
+                    weather.temperature, weather.visibility, weather.sea_state,
+                    weather.wave_height
+                ))
+                return self.cursor.lastrowid
+            
+        except Exception as e:
+            print(f"Save weather error: {e}")
+            return -1
+        finally:
+            self.disconnect()
+    
+    def save_bha_run(self, bha_run: BHARun) -> int:
+        """Save a BHA run and its components in a single transaction"""
         if not self.connect():
+            return -1
+        
+        try:
+            with self.connection:
+                self.cursor.execute(
+                    "INSERT INTO bha_runs (well_id, run_no, run_date) VALUES (?, ?, ?)",
+                    (bha_run.well_id, bha_run.run_no, bha_run.run_date)
+                )
+                run_id = self.cursor.lastrowid
+                
+                self.cursor.executemany("""
+                INSERT INTO bha_components (
+                    run_id, tool_type, od, inner_diameter, length,
+                    serial_no, weight, remarks
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (
+                        run_id, c.tool_type, c.od, c.id, c.length,
+                        c.serial_no, c.weight, c.remarks
+                    )
+                    for c in bha_run.components
+                ])
+            
+            return run_id
+            
+        except Exception as e:
+            print(f"Save BHA run error: {e}")
+            return -1
+        finally:
+            self.disconnect()
+    
+    def authenticate_user(self, username: str, password: str) -> Optional[User]:
+        """Authenticate user with username and password.
+        
+        Uses its own short-lived connection so it can run on a worker thread.
+        """
+        try:
+            connection = sqlite3.connect(self.db_path)
+        except Exception as e:
+            print(f"Database connection error: {e}")
             return None
         
         try:
             password_hash = hashlib.sha256(password.encode()).hexdigest()
-            self.cursor.execute("""
+            cursor = connection.cursor()
+            cursor.execute("""
             SELECT id, username, password_hash, full_name, role, email, phone, 
                    is_active, created_at, last_login
             FROM users WHERE username = ? AND password_hash = ? AND is_active = 1
             """, (username, password_hash))
             
-            row = self.cursor.fetchone()
+            row = cursor.fetchone()
             if row:
                 # Update last login time
-                self.cursor.execute(
-                    "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?",
-                    (row[0],)
-                )
-                self.connection.commit()
+                with connection:
+                    cursor.execute(
+                        "UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?",
+                        (row[0],)
+                    )
                 
                 return User(
                     id=row[0], username=row[1], password_hash=row[2],
@@ -1440,12 +1947,580 @@ class DatabaseManager:
             print(f"Authenticate user error: {e}")
             return None
         finally:
-            self.disconnect()
+            connection.close()
             
 # ============================================
 # UI COMPONENTS SECTION
 # ============================================
 
+# Enum values used in model data() and widget setup, resolved once
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+_DISPLAY_EDIT_ROLES = [_DISPLAY_ROLE, _EDIT_ROLE]
+
+def emoji_icon(emoji):
+    """Icon drawn once from an emoji glyph and kept in QPixmapCache"""
+    key = f"emoji:{emoji}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(24, 24)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        font = QFont()
+        font.setFamilies(["Segoe UI Emoji", "Apple Color Emoji", "Noto Color Emoji"])
+        font.setPixelSize(18)
+        painter.setFont(font)
+        painter.drawText(pixmap.rect(), _ALIGN_CENTER, emoji)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
+
+def add_icon_tab(tabs, widget, label):
+    """Add a tab, drawing a leading emoji as a cached icon instead of shaping it as text"""
+    emoji, _, text = label.partition(" ")
+    if text and not emoji.isascii():
+        return tabs.addTab(widget, emoji_icon(emoji), text)
+    return tabs.addTab(widget, label)
+
+def make_placeholder_page(title, description):
+    """Page shown for modules scheduled for a later phase"""
+    page = QWidget()
+    layout = QVBoxLayout()
+    
+    label = QLabel(f"{title}\n\n{description}\n\n(This module will be implemented in the next phase)")
+    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    label.setObjectName("placeholderPage")
+    
+    layout.addWidget(label)
+    page.setLayout(layout)
+    return page
+
+def build_lazy_tab(tabs, builders, index):
+    """Swap a placeholder tab for its real widget the first time it is shown"""
+    builder = builders.pop(index, None)
+    if builder is None:
+        return
+    
+    placeholder = tabs.widget(index)
+    label = tabs.tabText(index)
+    icon = tabs.tabIcon(index)
+    blocker = QSignalBlocker(tabs)
+    tabs.removeTab(index)
+    tabs.insertTab(index, builder(), icon, label)
+    tabs.setCurrentIndex(index)
+    blocker.unblock()
+    placeholder.deleteLater()
+
+# Application-wide stylesheet; widgets opt in by object name so the QSS is parsed once
+APP_STYLESHEET = """
+    QPushButton#saveDrilling {
+        background-color: #27ae60;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#saveDrilling:hover {
+        background-color: #219653;
+    }
+    QPushButton#saveMud {
+        background-color: #9b59b6;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#saveMud:hover {
+        background-color: #8e44ad;
+    }
+    QPushButton#saveBit {
+        background-color: #e67e22;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#saveBit:hover {
+        background-color: #d35400;
+    }
+    QPushButton#saveBHA {
+        background-color: #16a085;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#saveBHA:hover {
+        background-color: #138d75;
+    }
+    QPushButton#saveSurvey {
+        background-color: #34495e;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#saveSurvey:hover {
+        background-color: #2c3e50;
+    }
+    QPushButton#saveLogistics {
+        background-color: #7f8c8d;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#saveLogistics:hover {
+        background-color: #6c7b7d;
+    }
+    QPushButton#saveInventory {
+        background-color: #f39c12;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#saveInventory:hover {
+        background-color: #e67e22;
+    }
+    QLabel#inventoryTitle {
+        font-size: 18px;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    QWidget#lowStockAlert {
+        background-color: #fff3cd;
+        border: 1px solid #ffeaa7;
+        padding: 5px;
+    }
+    QLabel#photoDrop {
+        border: 2px dashed #cccccc;
+        padding: 20px;
+        background-color: #f8f9fa;
+    }
+    #vizArea {
+        border: 2px solid #cccccc;
+        padding: 50px;
+        background-color: #f8f9fa;
+        font-size: 14px;
+    }
+    QTabWidget#ribbonTabs::pane {
+        border: 1px solid #cccccc;
+        background-color: #f8f9fa;
+    }
+    #ribbonTabs QTabBar::tab {
+        padding: 8px 16px;
+        background-color: #e9ecef;
+        border: 1px solid #dee2e6;
+        border-bottom: none;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    #ribbonTabs QTabBar::tab:selected {
+        background-color: #f8f9fa;
+        border-bottom: 2px solid #007bff;
+    }
+    #ribbonTabs QTabBar::tab:hover {
+        background-color: #dee2e6;
+    }
+    QGroupBox#ribbonGroup {
+        font-weight: bold;
+        border: 1px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox#ribbonGroup::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton#ribbonButton {
+        padding: 8px;
+        margin: 2px;
+        border: 1px solid #ddd;
+        border-radius: 3px;
+        background-color: #f8f9fa;
+    }
+    QPushButton#ribbonButton:hover {
+        background-color: #e9ecef;
+        border-color: #adb5bd;
+    }
+    QPushButton#ribbonButton:pressed {
+        background-color: #dee2e6;
+    }
+    QLabel#loginTitle {
+        font-size: 24px;
+        font-weight: bold;
+        color: #2c3e50;
+        padding: 20px;
+    }
+    QLabel#loginError {
+        color: #e74c3c;
+    }
+    QPushButton#loginPrimary {
+        background-color: #27ae60;
+        color: white;
+        padding: 10px 20px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+    QPushButton#loginPrimary:hover {
+        background-color: #219653;
+    }
+    QLabel#loginVersion {
+        color: #95a5a6;
+        font-size: 10px;
+    }
+    QLabel#placeholderPage {
+        font-size: 16px;
+        color: #7f8c8d;
+    }
+"""
+
+# Application palette colors (light theme)
+PALETTE_COLORS = (
+    (QPalette.ColorRole.Window, (240, 240, 240)),
+    (QPalette.ColorRole.WindowText, (0, 0, 0)),
+    (QPalette.ColorRole.Base, (255, 255, 255)),
+    (QPalette.ColorRole.AlternateBase, (240, 240, 240)),
+    (QPalette.ColorRole.ToolTipBase, (255, 255, 255)),
+    (QPalette.ColorRole.ToolTipText, (0, 0, 0)),
+    (QPalette.ColorRole.Text, (0, 0, 0)),
+    (QPalette.ColorRole.Button, (240, 240, 240)),
+    (QPalette.ColorRole.ButtonText, (0, 0, 0)),
+    (QPalette.ColorRole.BrightText, (255, 255, 255)),
+    (QPalette.ColorRole.Link, (41, 128, 185)),
+    (QPalette.ColorRole.Highlight, (41, 128, 185)),
+    (QPalette.ColorRole.HighlightedText, (255, 255, 255)),
+)
+
+@lru_cache(maxsize=1)
+def build_palette():
+    """Application palette shared by the main window and dialogs (built on first use)"""
+    palette = QPalette()
+    for role, rgb in PALETTE_COLORS:
+        palette.setColor(role, QColor(*rgb))
+    return palette
+
+# Static combo contents shared by every widget instance through one model each
+COMBO_ITEMS = {
+    "main_codes": ("Drilling", "Tripping", "Circulation", "Casing", "Cementing", "Waiting", "Repair"),
+    "time_log_status": ("In Progress", "Completed", "Suspended", "Cancelled"),
+    "mud_types": ("Water Based", "Oil Based", "Synthetic Based", "KCl Polymer", "PHPA", "Sulfonated"),
+    "solid_control_equipment": ("Shale Shaker", "Desander", "Desilter", "Centrifuge", "Degasser", "Mud Cleaner"),
+    "bit_manufacturers": ("Baker Hughes", "Halliburton", "Schlumberger", "Weatherford", "NOV", "Varel", "Other"),
+    "bit_types": ("PDC", "Tricone", "Diamond", "Impregnated", "Roller Cone", "Fixed Cutter", "Hybrid"),
+    "dull_grades": (
+        "1-1-1", "1-2-1", "2-1-1", "2-2-1", "3-1-1", "3-2-1",
+        "4-1-1", "4-2-1", "5-1-1", "5-2-1", "6-1-1", "6-2-1",
+        "7-1-1", "7-2-1", "8-1-1", "8-2-1"
+    ),
+    "reasons_pulled": (
+        "TD Reached", "ROP Drop", "Torque Increase", "WOB Increase",
+        "Bearing Failure", "Cutter Damage", "Gauge Wear", "Other"
+    ),
+    "lithologies": (
+        "Sandstone", "Shale", "Limestone", "Dolomite",
+        "Claystone", "Siltstone", "Conglomerate", "Evaporite"
+    ),
+    "bha_tool_types": (
+        "Bit", "Stabilizer", "Drill Collar", "Heavy Weight Drill Pipe",
+        "MWD", "LWD", "Motor", "RSS", "Cross Over", "Float Valve",
+        "Jar", "Shock Sub", "Reamer", "Underreamer", "Other"
+    ),
+    "survey_tools": ("Gyro", "MEMS", "MWD", "Single Shot", "Multi Shot", "Other"),
+    "survey_view_types": ("Vertical Section", "Plan View", "3D View", "TVD vs MD", "Dogleg Plot"),
+    "survey_color_schemes": ("Rainbow", "Blue-Red", "Green-Brown", "Grayscale"),
+    "wind_directions": ("N", "NE", "E", "SE", "S", "SW", "W", "NW"),
+    "sea_states": ("Calm", "Smooth", "Slight", "Moderate", "Rough", "Very Rough", "High", "Very High"),
+}
+@lru_cache(maxsize=64)
+def cached_icon(source):
+    """Shared QIcon per file/resource path so repeated buttons reuse one pixmap set"""
+    return QIcon(source)
+
+_COMBO_MODELS = {}
+
+def shared_combo_model(key):
+    """Return the shared QStringListModel for key, creating it on first use"""
+    model = _COMBO_MODELS.get(key)
+    if model is None:
+        model = QStringListModel(list(COMBO_ITEMS[key]))
+        _COMBO_MODELS[key] = model
+    return model
+
+class _UnfocusedWheelFilter(QObject):
+    """Pass wheel events over unfocused widgets on to the parent (e.g. a scroll area)"""
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Wheel and not obj.hasFocus():
+            event.ignore()
+            return True
+        return False
+
+_WHEEL_FILTER = None
+
+def make_double_spin(lo, hi, suffix="", value=None, decimals=None):
+    """Create a QDoubleSpinBox with range, suffix and optional value/decimals"""
+    global _WHEEL_FILTER
+    spin = QDoubleSpinBox()
+    # Emit valueChanged on commit rather than per keystroke
+    spin.setKeyboardTracking(False)
+    # No wheel focus, and the filter keeps stray scrolls from changing an unfocused value
+    spin.setFocusPolicy(Qt.StrongFocus)
+    if _WHEEL_FILTER is None:
+        _WHEEL_FILTER = _UnfocusedWheelFilter()
+    spin.installEventFilter(_WHEEL_FILTER)
+    if decimals is not None:
+        spin.setDecimals(decimals)
+    spin.setRange(lo, hi)
+    if suffix:
+        spin.setSuffix(suffix)
+    if value is not None:
+        spin.setValue(value)
+    return spin
+
+def make_scroll_form():
+    """Resizable scroll area around a QFormLayout; returns (scroll, form_layout)"""
+    scroll = QScrollArea()
+    scroll.setWidgetResizable(True)
+    container = QWidget()
+    form_layout = QFormLayout(container)
+    scroll.setWidget(container)
+    return scroll, form_layout
+
+def make_form_columns(rows, columns=2):
+    """Lay out (label, widget) pairs row-major across side-by-side QFormLayouts"""
+    layout = QHBoxLayout()
+    forms = [QFormLayout() for _ in range(columns)]
+    for i, (label, widget) in enumerate(rows):
+        forms[i % columns].addRow(label, widget)
+    for form in forms:
+        layout.addLayout(form)
+    return layout
+
+def add_spin_grid(owner, grid, fields, columns, start_row=0):
+    """Create spin boxes from (attr, label, lo, hi, suffix, default) rows into a grid"""
+    for i, (attr_name, label, lo, hi, suffix, default) in enumerate(fields):
+        row, col = divmod(i, columns)
+        spin = make_double_spin(lo, hi, suffix, default)
+        setattr(owner, attr_name, spin)
+        grid.addWidget(QLabel(label), start_row + row, col * 2)
+        grid.addWidget(spin, start_row + row, col * 2 + 1)
+
+class RowTableModel(QAbstractTableModel):
+    """Read-only table model over a list of row tuples"""
+    def __init__(self, headers, parent=None, intern_columns=()):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._rows = []
+        # Low-cardinality text columns (company, position, status...) whose
+        # values are interned so repeated names share one string object
+        self._intern_columns = tuple(intern_columns)
+        self._feed_generation = 0
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        return row[column] if column < len(row) else None
+    
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def set_rows(self, rows):
+        """Replace all rows with one model reset"""
+        self._feed_generation += 1
+        self.beginResetModel()
+        self._rows = self._prepare_rows(rows)
+        self.endResetModel()
+    
+    def _prepare_rows(self, rows):
+        if not self._intern_columns:
+            return list(rows)
+        intern = sys.intern
+        columns = self._intern_columns
+        prepared = []
+        for row in rows:
+            row = list(row)
+            for column in columns:
+                if column < len(row) and type(row[column]) is str:
+                    row[column] = intern(row[column])
+            prepared.append(tuple(row))
+        return prepared
+    
+    def remove_row(self, row):
+        if 0 <= row < len(self._rows):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+    
+    def rows(self):
+        """Copy of the current rows"""
+        return list(self._rows)
+    
+    def row(self, row):
+        return self._rows[row]
+    
+    def append_rows(self, rows):
+        """Append a batch of rows with one insert notification"""
+        rows = self._prepare_rows(rows)
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+    
+    def feed_rows(self, rows, batch=100):
+        """Replace all rows, inserting them in batches across event-loop turns"""
+        self.set_rows(())
+        self._feed(list(rows), 0, batch, self._feed_generation)
+    
+    def _feed(self, rows, start, batch, generation):
+        if generation != self._feed_generation:
+            return  # superseded by a newer set_rows/feed_rows
+        end = min(len(rows), start + batch)
+        self.append_rows(rows[start:end])
+        if end < len(rows):
+            QTimer.singleShot(0, lambda: self._feed(rows, end, batch, generation))
+
+def make_table_view(model):
+    """QTableView over model with row selection and fixed-height rows"""
+    view = QTableView()
+    view.setModel(model)
+    view.setSelectionBehavior(QAbstractItemView.SelectRows)
+    header = view.verticalHeader()
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    header.setDefaultSectionSize(22)
+    return view
+
+def fill_well_combo(combo, db_manager):
+    """Fill a combo with the cached (well_id, label) choices, keeping the selected well"""
+    previous_id = combo.currentData()
+    # One currentIndexChanged at most instead of one per clear/addItem
+    blocker = QSignalBlocker(combo)
+    try:
+        combo.clear()
+        for well_id, label in db_manager.get_well_choices():
+            combo.addItem(label, well_id)
+        if previous_id is not None:
+            combo.setCurrentIndex(max(combo.findData(previous_id), 0))
+    finally:
+        blocker.unblock()
+    # Compare wells, not indexes: index 0 can now hold a different well
+    if combo.currentData() != previous_id:
+        combo.currentIndexChanged.emit(combo.currentIndex())
+
+def replace_view_rows(view, rows):
+    """Swap all rows of a RowTableModel-backed view with repaints and selection signals held"""
+    viewport = view.viewport()
+    view.setUpdatesEnabled(False)
+    viewport.setUpdatesEnabled(False)
+    blocker = QSignalBlocker(view.selectionModel())
+    try:
+        view.model().set_rows(rows)
+    finally:
+        blocker.unblock()
+        viewport.setUpdatesEnabled(True)
+        view.setUpdatesEnabled(True)
+
+class _TaskSignals(QObject):
+    """Signals for FunctionTask (QRunnable is not a QObject)"""
+    finished = Signal(object)
+    failed = Signal(str)
+
+class FunctionTask(QRunnable):
+    """Run fn(*args) on a pool thread and report the result or error via signals"""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+    
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+def start_task(fn, *args, on_finished=None, on_failed=None):
+    """Start fn(*args) on the global thread pool; callbacks run on the GUI thread"""
+    task = FunctionTask(fn, *args)
+    if on_finished is not None:
+        task.signals.finished.connect(on_finished)
+    if on_failed is not None:
+        task.signals.failed.connect(on_failed)
+    QThreadPool.globalInstance().start(task)
+    return task
+
+def read_csv_rows(path, column_count):
+    """Read a CSV with a header row into a list of string tuples (first column_count columns)"""
+    frame = pd.read_csv(path, dtype=str, keep_default_na=False, engine="c")
+    return list(frame.iloc[:, :column_count].itertuples(index=False, name=None))
+
+def write_csv_rows(path, headers, rows):
+    """Write row tuples to a CSV with a header row"""
+    pd.DataFrame(rows, columns=list(headers)).to_csv(path, index=False)
+
+def write_table_pdf(path, title, headers, rows, column_weights=None):
+    """Paint rows into a landscape A4 PDF table page by page as they are iterated"""
+    writer = QPdfWriter(path)
+    writer.setPageSize(QPageSize(QPageSize.PageSizeId.A4))
+    writer.setPageOrientation(QPageLayout.Orientation.Landscape)
+    writer.setResolution(96)
+    writer.setTitle(title)
+    
+    painter = QPainter(writer)
+    try:
+        page = painter.viewport()
+        metrics = painter.fontMetrics()
+        row_height = metrics.height() + 6
+        weights = column_weights or [1] * len(headers)
+        total = sum(weights)
+        widths = [page.width() * weight / total for weight in weights]
+        lefts = [sum(widths[:i]) for i in range(len(widths))]
+        
+        def draw_row(y, values, bold=False):
+            font = painter.font()
+            font.setBold(bold)
+            painter.setFont(font)
+            for left, width, value in zip(lefts, widths, values):
+                text = "" if value is None else str(value)
+                painter.drawText(
+                    QRectF(left + 3, y, width - 6, row_height),
+                    Qt.AlignVCenter | Qt.AlignLeft,
+                    metrics.elidedText(text, Qt.ElideRight, int(width - 6)),
+                )
+            painter.drawLine(QPointF(0, y + row_height), QPointF(page.width(), y + row_height))
+        
+        def start_page():
+            painter.drawText(QRectF(3, 0, page.width() - 6, row_height), Qt.AlignVCenter | Qt.AlignLeft, title)
+            draw_row(row_height, headers, bold=True)
+            return row_height * 2
+        
+        y = start_page()
+        for row in rows:
+            if y + row_height > page.height():
+                writer.newPage()
+                y = start_page()
+            draw_row(y, row)
+            y += row_height
+    finally:
+        painter.end()
+
 class RibbonTab(QWidget):
     """Ribbon style tab widget"""
     def __init__(self, title="", parent=None):
@@ -1462,24 +2537,61 @@ class RibbonTab(QWidget):
         self.groups[group_name] = widget
         self.layout.addWidget(widget)
 
+class RibbonButton(QPushButton):
+    """Ribbon push button that reuses rendered bitmaps while at rest"""
+    CACHE_LIMIT = 64
+    _bitmaps = OrderedDict()
+    
+    def paintEvent(self, event):
+        # Hovered/pressed buttons change every frame, so only idle states are cached
+        if self.underMouse() or self.isDown():
+            super().paintEvent(event)
+            return
+        
+        ratio = self.devicePixelRatioF()
+        palette = self.palette()
+        # Palette and font keep bitmaps apart across themes, stylesheets and platform styles
+        key = (
+            self.width(), self.height(), ratio, self.isEnabled(), self.isChecked(),
+            self.hasFocus(), self.text(), self.icon().cacheKey(), self.iconSize().width(),
+            palette.cacheKey(), self.font().key(),
+        )
+        bitmaps = self._bitmaps
+        pixmap = bitmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            # Start from the button background so rounded corners have no stale pixels
+            pixmap.fill(palette.button().color())
+            # Draw through the style rather than render(), which would end this paint pass
+            option = QStyleOptionButton()
+            self.initStyleOption(option)
+            pixmap_painter = QPainter(pixmap)
+            self.style().drawControl(QStyle.CE_PushButton, option, pixmap_painter, self)
+            pixmap_painter.end()
+            bitmaps[key] = pixmap
+            if len(bitmaps) > self.CACHE_LIMIT:
+                bitmaps.popitem(last=False)
+        else:
+            bitmaps.move_to_end(key)
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+    
+    def enterEvent(self, event):
+        self.update()
+        super().enterEvent(event)
+    
+    def leaveEvent(self, event):
+        self.update()
+        super().leaveEvent(event)
+
 class RibbonGroup(QGroupBox):
     """Ribbon group with icon buttons"""
     def __init__(self, title="", parent=None):
         super().__init__(title, parent)
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        self.setObjectName("ribbonGroup")
         
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
@@ -1487,30 +2599,14 @@ class RibbonGroup(QGroupBox):
     
     def add_button(self, text, icon=None, callback=None, tooltip=""):
         """Add a ribbon button"""
-        btn = QPushButton(text)
+        btn = RibbonButton(text)
         if icon:
-            btn.setIcon(QIcon(icon))
+            btn.setIcon(cached_icon(icon) if isinstance(icon, str) else icon)
         if callback:
             btn.clicked.connect(callback)
         if tooltip:
             btn.setToolTip(tooltip)
-        
-        btn.setStyleSheet("""
-            QPushButton {
-                padding: 8px;
-                margin: 2px;
-                border: 1px solid #ddd;
-                border-radius: 3px;
-                background-color: #f8f9fa;
-            }
-            QPushButton:hover {
-                background-color: #e9ecef;
-                border-color: #adb5bd;
-            }
-            QPushButton:pressed {
-                background-color: #dee2e6;
-            }
-        """)
+        btn.setObjectName("ribbonButton")
         
         self.layout.addWidget(btn)
         self.buttons.append(btn)
@@ -1690,22 +2786,23 @@ class WellInfoWidget(QWidget):
         # Dates Section
         dates_group = QGroupBox("Important Dates")
         dates_layout = QFormLayout()
+        today = QDate.currentDate()
         
         self.spud_date_edit = QDateEdit()
         self.spud_date_edit.setCalendarPopup(True)
-        self.spud_date_edit.setDate(QDate.currentDate())
+        self.spud_date_edit.setDate(today)
         
         self.start_hole_date_edit = QDateEdit()
         self.start_hole_date_edit.setCalendarPopup(True)
-        self.start_hole_date_edit.setDate(QDate.currentDate())
+        self.start_hole_date_edit.setDate(today)
         
         self.rig_move_date_edit = QDateEdit()
         self.rig_move_date_edit.setCalendarPopup(True)
-        self.rig_move_date_edit.setDate(QDate.currentDate())
+        self.rig_move_date_edit.setDate(today)
         
         self.report_date_edit = QDateEdit()
         self.report_date_edit.setCalendarPopup(True)
-        self.report_date_edit.setDate(QDate.currentDate())
+        self.report_date_edit.setDate(today)
         
         dates_layout.addRow("Spud Date:", self.spud_date_edit)
         dates_layout.addRow("Start Hole Date:", self.start_hole_date_edit)
@@ -2026,13 +3123,130 @@ class WellInfoWidget(QWidget):
         
         self.objectives_text.clear()
 
+class TimeLogModel(QAbstractTableModel):
+    """Table model over TimeLogColumns; each row maps to a live storage slot"""
+    FIELDS = ("start_time", "end_time", "duration", "main_code", "sub_code", "description", "is_npt", "status")
+    NPT_COLUMN = 6
+    # Storage is compacted once it holds more dead slots than this and than live ones
+    COMPACT_THRESHOLD = 64
+    
+    def __init__(self, headers, columns, parent=None):
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._columns = columns
+        self._slots = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._slots)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.FIELDS)
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if column == self.NPT_COLUMN:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self._columns.is_npt[self._slots[index.row()]] else Qt.Unchecked
+            if role == Qt.TextAlignmentRole:
+                return _ALIGN_CENTER
+            return None
+        if role != _DISPLAY_ROLE:
+            return None
+        return getattr(self._columns, self.FIELDS[column])[self._slots[index.row()]]
+    
+    def setData(self, index, value, role=Qt.CheckStateRole):
+        if not index.isValid() or index.column() != self.NPT_COLUMN or role != Qt.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.Checked
+        self._columns.is_npt[self._slots[index.row()]] = 1 if checked else 0
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if index.column() == self.NPT_COLUMN:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+    
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def append_entries(self, entries):
+        """Store entries and show them with one insert notification"""
+        entries = list(entries)
+        if not entries:
+            return
+        first = len(self._slots)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        self._slots.extend(self._columns.append(entry) for entry in entries)
+        self.endInsertRows()
+    
+    def remove_row(self, row):
+        if 0 <= row < len(self._slots):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._columns.delete(self._slots.pop(row))
+            self.endRemoveRows()
+            dead = self._columns.dead_count()
+            if dead > self.COMPACT_THRESHOLD and dead > len(self._columns):
+                # Rows keep their order, only the slots they point at move
+                remap = self._columns.compact()
+                self._slots = [remap[slot] for slot in self._slots]
+    
+    def clear(self):
+        self.beginResetModel()
+        self._columns.clear()
+        self._slots = []
+        self.endResetModel()
+
+class _ReportLoaderSignals(QObject):
+    """Signals for _ReportLoader (QRunnable is not a QObject)"""
+    loaded = Signal(int, object)
+
+class _ReportLoader(QRunnable):
+    """Fetch a daily report on a pool thread and hand it back via a signal"""
+    def __init__(self, db_manager, well_id, report_date, token):
+        super().__init__()
+        self.db = db_manager
+        self.well_id = well_id
+        self.report_date = report_date
+        self.token = token
+        self.signals = _ReportLoaderSignals()
+    
+    def run(self):
+        report = self.db.get_daily_report(self.well_id, self.report_date)
+        self.signals.loaded.emit(self.token, report)
+
 class DailyReportWidget(QWidget):
     """Daily operations report widget"""
+    TIME_LOG_HEADERS = (
+        "From", "To", "Duration", "Main Code", "Sub Code",
+        "Description", "NPT", "Status"
+    )
+    TIME_COLUMN_WIDTH = 70
+    
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
         self.current_report_id = -1
-        self.time_logs = []
+        self.time_logs = TimeLogColumns()
+        self.time_log_model = TimeLogModel(self.TIME_LOG_HEADERS, self.time_logs, self)
+        self._well_ids = []
+        self._wells_by_id = {}
+        
+        # Background report loading, debounced so arrow-key scrolling coalesces
+        self._loader_pool = QThreadPool.globalInstance()
+        self._load_token = 0
+        self._report_load_timer = QTimer(self)
+        self._report_load_timer.setSingleShot(True)
+        self._report_load_timer.setInterval(100)
+        self._report_load_timer.timeout.connect(self._start_report_load)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -2073,6 +3287,7 @@ class DailyReportWidget(QWidget):
         self.report_date_edit = QDateEdit()
         self.report_date_edit.setCalendarPopup(True)
         self.report_date_edit.setDate(QDate.currentDate())
+        self.report_date_edit.dateChanged.connect(self._report_load_timer.start)
         
         self.rig_day_spin = QSpinBox()
         self.rig_day_spin.setRange(1, 365)
@@ -2169,12 +3384,13 @@ class DailyReportWidget(QWidget):
         time_log_layout = QVBoxLayout()
         
         # Time log table
-        self.time_log_table = QTableWidget()
-        self.time_log_table.setColumnCount(8)
-        self.time_log_table.setHorizontalHeaderLabels([
-            "From", "To", "Duration", "Main Code", "Sub Code", 
-            "Description", "NPT", "Status"
-        ])
+        self.time_log_table = make_table_view(self.time_log_model)
+        
+        # HH:MM columns are fixed width by construction; never measure their text
+        time_log_header = self.time_log_table.horizontalHeader()
+        for column in range(3):
+            time_log_header.setSectionResizeMode(column, QHeaderView.Fixed)
+            time_log_header.resizeSection(column, self.TIME_COLUMN_WIDTH)
         
         # Time log buttons
         time_log_buttons = QHBoxLayout()
@@ -2187,9 +3403,13 @@ class DailyReportWidget(QWidget):
         delete_log_button = QPushButton("Delete Selected")
         delete_log_button.clicked.connect(self.delete_time_log)
         
+        import_log_button = QPushButton("Import CSV")
+        import_log_button.clicked.connect(self.import_time_logs_csv)
+        
         time_log_buttons.addWidget(add_log_button)
         time_log_buttons.addWidget(edit_log_button)
         time_log_buttons.addWidget(delete_log_button)
+        time_log_buttons.addWidget(import_log_button)
         time_log_buttons.addStretch()
         
         time_log_layout.addWidget(self.time_log_table)
@@ -2229,14 +3449,62 @@ class DailyReportWidget(QWidget):
         self.well_combo.clear()
         wells = self.db.get_all_wells()
         
+        # Python-side lookups so selection handling avoids itemData() calls
+        self._well_ids = [well.id for well in wells]
+        self._wells_by_id = {well.id: well for well in wells}
+        
         for well in wells:
             self.well_combo.addItem(f"{well.name} - {well.field}", well.id)
     
+    def _well_id_at(self, index):
+        """Well ID for a combo index, or None"""
+        return self._well_ids[index] if 0 <= index < len(self._well_ids) else None
+    
     def on_well_selected(self, index):
         """Handle well selection change"""
-        if index >= 0:
-            well_id = self.well_combo.itemData(index)
-            # TODO: Load existing report for this well/date
+        if self._well_id_at(index) is not None:
+            self._report_load_timer.start()
+    
+    def _start_report_load(self):
+        """Load the report for the selected well/date off the GUI thread"""
+        well_id = self._well_id_at(self.well_combo.currentIndex())
+        if well_id is None:
+            return
+        
+        report_date = self.report_date_edit.date().toString("yyyy-MM-dd")
+        
+        # Bumping the token cancels any in-flight loader: its result is ignored
+        self._load_token += 1
+        loader = _ReportLoader(self.db, well_id, report_date, self._load_token)
+        loader.signals.loaded.connect(self._on_report_loaded)
+        self._loader_pool.start(loader)
+    
+    def _on_report_loaded(self, token, report):
+        """Populate the form with a report fetched by _ReportLoader"""
+        if token != self._load_token:
+            return
+        if report is None:
+            # Don't leave the previous well's report on screen to be saved under this one
+            self.clear_form()
+            return
+        
+        blockers = self._block_form_signals()
+        self.current_report_id = report.id
+        self.rig_day_spin.setValue(report.rig_day)
+        self.depth_0000_spin.setValue(report.depth_0000)
+        self.depth_0600_spin.setValue(report.depth_0600)
+        self.depth_2400_spin.setValue(report.depth_2400)
+        self.pit_gain_spin.setValue(report.pit_gain)
+        self.operations_text.setPlainText(report.operations_done)
+        self.summary_text.setPlainText(report.work_summary)
+        self.problems_text.setPlainText(report.problems)
+        self.notes_text.setPlainText(report.general_notes)
+        
+        self.time_log_model.clear()
+        for blocker in blockers:
+            blocker.unblock()
+        
+        self.bulk_add_time_logs(report.time_logs)
     
     def add_time_log_dialog(self):
         """Show dialog to add time log entry"""
@@ -2257,6 +3525,10 @@ class DailyReportWidget(QWidget):
         
         self.duration_label = QLabel("00:00")
         
+        # Connected after the initial setTime calls so they don't fire the slot
+        self.start_time_edit.timeChanged.connect(self._update_duration_label)
+        self.end_time_edit.timeChanged.connect(self._update_duration_label)
+        
         time_layout.addWidget(QLabel("From:"))
         time_layout.addWidget(self.start_time_edit)
         time_layout.addWidget(QLabel("To:"))
@@ -2265,15 +3537,16 @@ class DailyReportWidget(QWidget):
         time_layout.addWidget(self.duration_label)
         time_layout.addStretch()
         
-        form.addRow("Time:", QWidget())
-        form.itemAt(form.rowCount()-1, QFormLayout.LabelRole).widget().setLayout(time_layout)
+        time_container = QWidget()
+        time_container.setLayout(time_layout)
+        form.addRow("Time:", time_container)
         
         # Code selection
         self.main_code_combo = QComboBox()
         self.sub_code_combo = QComboBox()
         
         # TODO: Load codes from database
-        self.main_code_combo.addItems(["Drilling", "Tripping", "Circulation", "Casing", "Cementing", "Waiting", "Repair"])
+        self.main_code_combo.setModel(shared_combo_model("main_codes"))
         
         form.addRow("Main Code:", self.main_code_combo)
         form.addRow("Sub Code:", self.sub_code_combo)
@@ -2289,7 +3562,7 @@ class DailyReportWidget(QWidget):
         
         # Status
         self.status_combo = QComboBox()
-        self.status_combo.addItems(["In Progress", "Completed", "Suspended", "Cancelled"])
+        self.status_combo.setModel(shared_combo_model("time_log_status"))
         form.addRow("Status:", self.status_combo)
         
         layout.addLayout(form)
@@ -2309,63 +3582,121 @@ class DailyReportWidget(QWidget):
         dialog.setLayout(layout)
         dialog.exec()
     
+    def _update_duration_label(self, _time=None):
+        """Refresh the dialog's duration label from the From/To editors"""
+        st = self.start_time_edit.time()
+        et = self.end_time_edit.time()
+        duration_secs = duration_seconds(st.hour(), st.minute(), et.hour(), et.minute())
+        self.duration_label.setText(f"{duration_secs // 3600:02d}:{(duration_secs % 3600) // 60:02d}")
+    
     def add_time_log_entry(self, dialog):
         """Add time log entry to table"""
-        start_time = self.start_time_edit.time().toString("HH:mm")
-        end_time = self.end_time_edit.time().toString("HH:mm")
-        
-        # Calculate duration
-        start_qtime = self.start_time_edit.time()
-        end_qtime = self.end_time_edit.time()
-        
-        start_secs = start_qtime.hour() * 3600 + start_qtime.minute() * 60
-        end_secs = end_qtime.hour() * 3600 + end_qtime.minute() * 60
-        
-        if end_secs < start_secs:
-            end_secs += 24 * 3600  # Next day
+        main_code = self.main_code_combo.currentText()
+        sub_code = self.sub_code_combo.currentText()
+        desc = self.log_description.text()
+        is_npt = self.npt_checkbox.isChecked()
+        status = self.status_combo.currentText()
+        
+        # One QTime fetch per editor; everything else is integer math
+        st = self.start_time_edit.time()
+        et = self.end_time_edit.time()
+        sh, sm = st.hour(), st.minute()
+        eh, em = et.hour(), et.minute()
+        
+        duration_secs = duration_seconds(sh, sm, eh, em)
+        start_time = f"{sh:02d}:{sm:02d}"
+        end_time = f"{eh:02d}:{em:02d}"
+        duration_str = f"{duration_secs // 3600:02d}:{(duration_secs % 3600) // 60:02d}"
+        
+        # Stored column-wise; the model shows it as the last row
+        self.time_log_model.append_entries([TimeLogEntry(
+            start_time, end_time, duration_str, main_code, sub_code, desc, is_npt, status
+        )])
         
-        duration_secs = end_secs - start_secs
-        hours = duration_secs // 3600
-        minutes = (duration_secs % 3600) // 60
-        duration_str = f"{hours:02d}:{minutes:02d}"
+        dialog.accept()
+    
+    def import_time_logs_csv(self):
+        """Read time log rows (start, end, main, sub, desc, npt, status) from a CSV in the background"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import Time Logs", "", "CSV Files (*.csv)")
+        if not file_path:
+            return
         
-        # Add to table
-        row = self.time_log_table.rowCount()
-        self.time_log_table.insertRow(row)
-        
-        self.time_log_table.setItem(row, 0, QTableWidgetItem(start_time))
-        self.time_log_table.setItem(row, 1, QTableWidgetItem(end_time))
-        self.time_log_table.setItem(row, 2, QTableWidgetItem(duration_str))
-        self.time_log_table.setItem(row, 3, QTableWidgetItem(self.main_code_combo.currentText()))
-        self.time_log_table.setItem(row, 4, QTableWidgetItem(self.sub_code_combo.currentText()))
-        self.time_log_table.setItem(row, 5, QTableWidgetItem(self.log_description.text()))
-        
-        # NPT checkbox in table
-        npt_widget = QWidget()
-        npt_layout = QHBoxLayout()
-        npt_checkbox = QCheckBox()
-        npt_checkbox.setChecked(self.npt_checkbox.isChecked())
-        npt_layout.addWidget(npt_checkbox)
-        npt_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        npt_widget.setLayout(npt_layout)
-        self.time_log_table.setCellWidget(row, 6, npt_widget)
-        
-        self.time_log_table.setItem(row, 7, QTableWidgetItem(self.status_combo.currentText()))
-        
-        # Add to internal list
-        time_log = TimeLogEntry(
-            start_time=start_time,
-            end_time=end_time,
-            duration=duration_str,
-            main_code=self.main_code_combo.currentText(),
-            sub_code=self.sub_code_combo.currentText(),
-            description=self.log_description.text(),
-            is_npt=self.npt_checkbox.isChecked(),
-            status=self.status_combo.currentText()
+        start_task(
+            read_csv_rows, file_path, 7,
+            on_finished=self._on_time_logs_read,
+            on_failed=lambda message: QMessageBox.warning(
+                self, "Import Error", f"Could not import time logs:\n{message}"
+            ),
         )
-        self.time_logs.append(time_log)
+    
+    def _on_time_logs_read(self, rows):
+        skipped = self.bulk_import_time_logs(rows)
+        if skipped:
+            QMessageBox.warning(
+                self, "Import Warning",
+                f"Skipped {skipped} row(s) with missing columns or invalid HH:MM times."
+            )
+    
+    @staticmethod
+    def _parse_hhmm(value):
+        """Return (hours, minutes) for an "HH:MM" string, or None if it is malformed"""
+        parts = str(value).strip().split(":")
+        if len(parts) < 2 or not parts[0].isdigit() or not parts[1].isdigit():
+            return None
+        hours, minutes = int(parts[0]), int(parts[1])
+        if hours > 23 or minutes > 59:
+            return None
+        return hours, minutes
+    
+    def bulk_import_time_logs(self, rows):
+        """Import parsed time log rows (start, end, main, sub, desc, npt, status); returns the number skipped"""
+        parsed = []
+        skipped = 0
+        for row in rows:
+            start = self._parse_hhmm(row[0]) if len(row) >= 7 else None
+            end = self._parse_hhmm(row[1]) if start else None
+            if end is None:
+                skipped += 1
+                continue
+            parsed.append((start, end, row))
+        if not parsed:
+            return skipped
+        
+        # Four int arrays so all durations are computed at once
+        sh = np.array([start[0] for start, _, _ in parsed], dtype=np.int32)
+        sm = np.array([start[1] for start, _, _ in parsed], dtype=np.int32)
+        eh = np.array([end[0] for _, end, _ in parsed], dtype=np.int32)
+        em = np.array([end[1] for _, end, _ in parsed], dtype=np.int32)
+        
+        durations = compute_durations(sh, sm, eh, em)
+        
+        entries = []
+        for i, (_, _, row) in enumerate(parsed):
+            main_code, sub_code, description, is_npt, status = row[2:7]
+            if isinstance(is_npt, str):
+                is_npt = is_npt.strip().lower() in ("1", "true", "yes", "y")
+            duration_secs = int(durations[i])
+            start_time = f"{sh[i]:02d}:{sm[i]:02d}"
+            end_time = f"{eh[i]:02d}:{em[i]:02d}"
+            duration_str = f"{duration_secs // 3600:02d}:{(duration_secs % 3600) // 60:02d}"
+            entries.append(TimeLogEntry(
+                start_time, end_time, duration_str, main_code, sub_code,
+                description, bool(is_npt), status
+            ))
+        
+        self.bulk_add_time_logs(entries)
+        return skipped
+    
+    def bulk_add_time_logs(self, entries):
+        """Append many time log entries with a single insert notification"""
+        entries = list(entries)
+        if not entries:
+            return
         
-        dialog.accept()
+        self.time_log_model.append_entries(entries)
+        table = self.time_log_table
+        for column in range(3, self.time_log_model.columnCount()):
+            table.resizeColumnToContents(column)
     
     def edit_time_log(self):
         """Edit selected time log entry"""
@@ -2374,22 +3705,16 @@ class DailyReportWidget(QWidget):
     
     def delete_time_log(self):
         """Delete selected time log entry"""
-        selected = self.time_log_table.currentRow()
-        if selected >= 0:
-            self.time_log_table.removeRow(selected)
-            if selected < len(self.time_logs):
-                del self.time_logs[selected]
+        self.time_log_model.remove_row(self.time_log_table.currentIndex().row())
     
     def save_daily_report(self):
         """Save daily report to database"""
         # Get selected well
-        well_index = self.well_combo.currentIndex()
-        if well_index < 0:
+        well_id = self._well_id_at(self.well_combo.currentIndex())
+        if well_id is None:
             QMessageBox.warning(self, "Error", "Please select a well.")
             return
         
-        well_id = self.well_combo.itemData(well_index)
-        
         # Create report object
         report = DailyReport(
             well_id=well_id,
@@ -2403,11 +3728,11 @@ class DailyReportWidget(QWidget):
             work_summary=self.summary_text.toPlainText(),
             problems=self.problems_text.toPlainText(),
             general_notes=self.notes_text.toPlainText(),
-            time_logs=self.time_logs
+            time_logs=self.time_logs.entries()
         )
         
         # Save to database
-        report_id = self.db.save_daily_report(report)
+        report_id = self.db.save_daily_report_batched(report)
         if report_id > 0:
             self.current_report_id = report_id
             QMessageBox.information(self, "Success", f"Daily report saved successfully! (ID: {report_id})")
@@ -2417,8 +3742,18 @@ class DailyReportWidget(QWidget):
         else:
             QMessageBox.warning(self, "Error", "Failed to save daily report.")
     
+    def _block_form_signals(self):
+        """Block signals of the report inputs; call unblock() on each to release"""
+        return [QSignalBlocker(widget) for widget in (
+            self.rig_day_spin, self.depth_0000_spin, self.depth_0600_spin,
+            self.depth_2400_spin, self.pit_gain_spin, self.operations_text,
+            self.summary_text, self.problems_text, self.notes_text,
+        )]
+    
     def clear_form(self):
         """Clear the form for new entry"""
+        blockers = self._block_form_signals()
+        
         self.current_report_id = -1
         self.rig_day_spin.setValue(self.rig_day_spin.value() + 1)
         self.depth_0000_spin.setValue(0)
@@ -2431,14 +3766,17 @@ class DailyReportWidget(QWidget):
         self.notes_text.clear()
         
         # Clear time logs
-        self.time_log_table.setRowCount(0)
-        self.time_logs.clear()
+        self.time_log_model.clear()
+        
+        for blocker in blockers:
+            blocker.unblock()
 
 class DrillingParametersWidget(QWidget):
     """Drilling parameters widget"""
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
+        self._groups_built = False
         self.init_ui()
     
     def init_ui(self):
@@ -2449,267 +3787,138 @@ class DrillingParametersWidget(QWidget):
         title_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
         layout.addWidget(title_label)
         
-        # Scroll area
+        # Scroll area; parameter groups are added on first show
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         
         container = QWidget()
-        form_layout = QFormLayout()
+        self.params_form_layout = QFormLayout()
+        container.setLayout(self.params_form_layout)
+        scroll.setWidget(container)
+        layout.addWidget(scroll)
         
-        # WOB section
-        wob_group = QGroupBox("Weight on Bit (WOB)")
-        wob_layout = QGridLayout()
-        
-        self.wob_min_spin = QDoubleSpinBox()
-        self.wob_min_spin.setRange(0, 100)
-        self.wob_min_spin.setSuffix(" klb")
-        
-        self.wob_max_spin = QDoubleSpinBox()
-        self.wob_max_spin.setRange(0, 100)
-        self.wob_max_spin.setSuffix(" klb")
-        
-        self.wob_avg_spin = QDoubleSpinBox()
-        self.wob_avg_spin.setRange(0, 100)
-        self.wob_avg_spin.setSuffix(" klb")
-        
-        wob_layout.addWidget(QLabel("Min:"), 0, 0)
-        wob_layout.addWidget(self.wob_min_spin, 0, 1)
-        wob_layout.addWidget(QLabel("Max:"), 0, 2)
-        wob_layout.addWidget(self.wob_max_spin, 0, 3)
-        wob_layout.addWidget(QLabel("Average:"), 0, 4)
-        wob_layout.addWidget(self.wob_avg_spin, 0, 5)
-        
-        wob_group.setLayout(wob_layout)
-        form_layout.addRow(wob_group)
-        
-        # RPM section
-        rpm_group = QGroupBox("Rotary Speed (RPM)")
-        rpm_layout = QGridLayout()
-        
-        self.surface_rpm_min_spin = QDoubleSpinBox()
-        self.surface_rpm_min_spin.setRange(0, 500)
-        self.surface_rpm_min_spin.setSuffix(" rpm")
-        
-        self.surface_rpm_max_spin = QDoubleSpinBox()
-        self.surface_rpm_max_spin.setRange(0, 500)
-        self.surface_rpm_max_spin.setSuffix(" rpm")
-        
-        self.motor_rpm_min_spin = QDoubleSpinBox()
-        self.motor_rpm_min_spin.setRange(0, 500)
-        self.motor_rpm_min_spin.setSuffix(" rpm")
-        
-        self.motor_rpm_max_spin = QDoubleSpinBox()
-        self.motor_rpm_max_spin.setRange(0, 500)
-        self.motor_rpm_max_spin.setSuffix(" rpm")
-        
-        rpm_layout.addWidget(QLabel("Surface Min:"), 0, 0)
-        rpm_layout.addWidget(self.surface_rpm_min_spin, 0, 1)
-        rpm_layout.addWidget(QLabel("Surface Max:"), 0, 2)
-        rpm_layout.addWidget(self.surface_rpm_max_spin, 0, 3)
-        rpm_layout.addWidget(QLabel("Motor Min:"), 1, 0)
-        rpm_layout.addWidget(self.motor_rpm_min_spin, 1, 1)
-        rpm_layout.addWidget(QLabel("Motor Max:"), 1, 2)
-        rpm_layout.addWidget(self.motor_rpm_max_spin, 1, 3)
-        
-        rpm_group.setLayout(rpm_layout)
-        form_layout.addRow(rpm_group)
-        
-        # Torque section
-        torque_group = QGroupBox("Torque")
-        torque_layout = QGridLayout()
-        
-        self.torque_min_spin = QDoubleSpinBox()
-        self.torque_min_spin.setRange(0, 100)
-        self.torque_min_spin.setSuffix(" kft-lb")
-        
-        self.torque_max_spin = QDoubleSpinBox()
-        self.torque_max_spin.setRange(0, 100)
-        self.torque_max_spin.setSuffix(" kft-lb")
-        
-        torque_layout.addWidget(QLabel("Min:"), 0, 0)
-        torque_layout.addWidget(self.torque_min_spin, 0, 1)
-        torque_layout.addWidget(QLabel("Max:"), 0, 2)
-        torque_layout.addWidget(self.torque_max_spin, 0, 3)
-        
-        torque_group.setLayout(torque_layout)
-        form_layout.addRow(torque_group)
-        
-        # Pump parameters section
-        pump_group = QGroupBox("Pump Parameters")
-        pump_layout = QGridLayout()
+        # Save button
+        save_button = QPushButton("Save Drilling Parameters")
+        save_button.setObjectName("saveDrilling")
+        layout.addWidget(save_button)
         
-        self.pump_pressure_min_spin = QDoubleSpinBox()
-        self.pump_pressure_min_spin.setRange(0, 5000)
-        self.pump_pressure_min_spin.setSuffix(" psi")
-        
-        self.pump_pressure_max_spin = QDoubleSpinBox()
-        self.pump_pressure_max_spin.setRange(0, 5000)
-        self.pump_pressure_max_spin.setSuffix(" psi")
-        
-        self.pump_output_min_spin = QDoubleSpinBox()
-        self.pump_output_min_spin.setRange(0, 2000)
-        self.pump_output_min_spin.setSuffix(" gpm")
-        
-        self.pump_output_max_spin = QDoubleSpinBox()
-        self.pump_output_max_spin.setRange(0, 2000)
-        self.pump_output_max_spin.setSuffix(" gpm")
-        
-        pump_layout.addWidget(QLabel("Pressure Min:"), 0, 0)
-        pump_layout.addWidget(self.pump_pressure_min_spin, 0, 1)
-        pump_layout.addWidget(QLabel("Pressure Max:"), 0, 2)
-        pump_layout.addWidget(self.pump_pressure_max_spin, 0, 3)
-        pump_layout.addWidget(QLabel("Output Min:"), 1, 0)
-        pump_layout.addWidget(self.pump_output_min_spin, 1, 1)
-        pump_layout.addWidget(QLabel("Output Max:"), 1, 2)
-        pump_layout.addWidget(self.pump_output_max_spin, 1, 3)
-        
-        pump_group.setLayout(pump_layout)
-        form_layout.addRow(pump_group)
-        
-        # Additional parameters
-        params_group = QGroupBox("Additional Parameters")
-        params_layout = QGridLayout()
-        
-        self.hsi_spin = QDoubleSpinBox()
-        self.hsi_spin.setRange(0, 10)
-        self.hsi_spin.setSuffix(" hp/in²")
-        
-        self.annular_velocity_spin = QDoubleSpinBox()
-        self.annular_velocity_spin.setRange(0, 500)
-        self.annular_velocity_spin.setSuffix(" ft/min")
-        
-        self.tfa_spin = QDoubleSpinBox()
-        self.tfa_spin.setRange(0, 5)
-        self.tfa_spin.setSuffix(" in²")
-        
-        self.bit_revolution_spin = QDoubleSpinBox()
-        self.bit_revolution_spin.setRange(0, 1000000)
-        
-        params_layout.addWidget(QLabel("HSI:"), 0, 0)
-        params_layout.addWidget(self.hsi_spin, 0, 1)
-        params_layout.addWidget(QLabel("Annular Velocity:"), 0, 2)
-        params_layout.addWidget(self.annular_velocity_spin, 0, 3)
-        params_layout.addWidget(QLabel("TFA:"), 1, 0)
-        params_layout.addWidget(self.tfa_spin, 1, 1)
-        params_layout.addWidget(QLabel("Bit Revolution:"), 1, 2)
-        params_layout.addWidget(self.bit_revolution_spin, 1, 3)
-        
-        params_group.setLayout(params_layout)
-        form_layout.addRow(params_group)
+        self.setLayout(layout)
+    
+    def showEvent(self, event):
+        """Build the parameter groups the first time the widget is shown"""
+        if not self._groups_built:
+            self.build_parameter_groups()
+        super().showEvent(event)
+    
+    def build_parameter_groups(self):
+        """Create WOB, RPM, torque, pump, additional and SCR groups"""
+        self._groups_built = True
+        form_layout = self.params_form_layout
+        
+        # (attribute, label, min, max, suffix, default) per group
+        groups = [
+            ("Weight on Bit (WOB)", 3, [
+                ("wob_min_spin", "Min:", 0, 100, " klb", None),
+                ("wob_max_spin", "Max:", 0, 100, " klb", None),
+                ("wob_avg_spin", "Average:", 0, 100, " klb", None),
+            ]),
+            ("Rotary Speed (RPM)", 2, [
+                ("surface_rpm_min_spin", "Surface Min:", 0, 500, " rpm", None),
+                ("surface_rpm_max_spin", "Surface Max:", 0, 500, " rpm", None),
+                ("motor_rpm_min_spin", "Motor Min:", 0, 500, " rpm", None),
+                ("motor_rpm_max_spin", "Motor Max:", 0, 500, " rpm", None),
+            ]),
+            ("Torque", 2, [
+                ("torque_min_spin", "Min:", 0, 100, " kft-lb", None),
+                ("torque_max_spin", "Max:", 0, 100, " kft-lb", None),
+            ]),
+            ("Pump Parameters", 2, [
+                ("pump_pressure_min_spin", "Pressure Min:", 0, 5000, " psi", None),
+                ("pump_pressure_max_spin", "Pressure Max:", 0, 5000, " psi", None),
+                ("pump_output_min_spin", "Output Min:", 0, 2000, " gpm", None),
+                ("pump_output_max_spin", "Output Max:", 0, 2000, " gpm", None),
+            ]),
+            ("Additional Parameters", 2, [
+                ("hsi_spin", "HSI:", 0, 10, " hp/in²", None),
+                ("annular_velocity_spin", "Annular Velocity:", 0, 500, " ft/min", None),
+                ("tfa_spin", "TFA:", 0, 5, " in²", None),
+                ("bit_revolution_spin", "Bit Revolution:", 0, 1000000, "", None),
+            ]),
+        ]
+        
+        for title, columns, fields in groups:
+            group = QGroupBox(title)
+            grid = QGridLayout()
+            add_spin_grid(self, grid, fields, columns)
+            group.setLayout(grid)
+            form_layout.addRow(group)
         
         # SCR Pumps section
         scr_group = QGroupBox("SCR Pumps")
         scr_layout = QGridLayout()
         
-        # Pump 1
-        scr_layout.addWidget(QLabel("Pump 1:"), 0, 0)
-        self.pump1_spm_spin = QDoubleSpinBox()
-        self.pump1_spm_spin.setRange(0, 200)
-        self.pump1_spm_spin.setSuffix(" spm")
-        scr_layout.addWidget(self.pump1_spm_spin, 0, 1)
-        
-        self.pump1_spp_spin = QDoubleSpinBox()
-        self.pump1_spp_spin.setRange(0, 5000)
-        self.pump1_spp_spin.setSuffix(" psi")
-        scr_layout.addWidget(self.pump1_spp_spin, 0, 2)
-        
-        # Pump 2
-        scr_layout.addWidget(QLabel("Pump 2:"), 1, 0)
-        self.pump2_spm_spin = QDoubleSpinBox()
-        self.pump2_spm_spin.setRange(0, 200)
-        self.pump2_spm_spin.setSuffix(" spm")
-        scr_layout.addWidget(self.pump2_spm_spin, 1, 1)
-        
-        self.pump2_spp_spin = QDoubleSpinBox()
-        self.pump2_spp_spin.setRange(0, 5000)
-        self.pump2_spp_spin.setSuffix(" psi")
-        scr_layout.addWidget(self.pump2_spp_spin, 1, 2)
-        
-        # Pump 3
-        scr_layout.addWidget(QLabel("Pump 3:"), 2, 0)
-        self.pump3_spm_spin = QDoubleSpinBox()
-        self.pump3_spm_spin.setRange(0, 200)
-        self.pump3_spm_spin.setSuffix(" spm")
-        scr_layout.addWidget(self.pump3_spm_spin, 2, 1)
-        
-        self.pump3_spp_spin = QDoubleSpinBox()
-        self.pump3_spp_spin.setRange(0, 5000)
-        self.pump3_spp_spin.setSuffix(" psi")
-        scr_layout.addWidget(self.pump3_spp_spin, 2, 2)
+        for pump in (1, 2, 3):
+            row = pump - 1
+            spm_spin = make_double_spin(0, 200, " spm")
+            spp_spin = make_double_spin(0, 5000, " psi")
+            setattr(self, f"pump{pump}_spm_spin", spm_spin)
+            setattr(self, f"pump{pump}_spp_spin", spp_spin)
+            
+            scr_layout.addWidget(QLabel(f"Pump {pump}:"), row, 0)
+            scr_layout.addWidget(spm_spin, row, 1)
+            scr_layout.addWidget(spp_spin, row, 2)
         
         scr_group.setLayout(scr_layout)
         form_layout.addRow(scr_group)
-        
-        container.setLayout(form_layout)
-        scroll.setWidget(container)
-        layout.addWidget(scroll)
-        
-        # Save button
-        save_button = QPushButton("Save Drilling Parameters")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #219653;
-            }
-        """)
-        layout.addWidget(save_button)
-        
-        self.setLayout(layout)
 
 class MudReportWidget(QWidget):
     """Mud report widget"""
+    CHEMICALS_HEADERS = ("Product Type", "Received", "Used", "Stock", "Unit")
+    TANKS = (
+        ("Suction Tank", "suction_tank_spin"),
+        ("Reserve Tank", "reserve_tank_spin"),
+        ("Degasser", "degasser_spin"),
+        ("Desander", "desander_spin"),
+        ("Desilter", "desilter_spin"),
+        ("Middle Tank", "middle_tank_spin"),
+        ("T-Tank", "total_tank_spin"),
+        ("Sand Trap", "sand_trap_spin"),
+    )
+    
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
         self.init_ui()
     
     def init_ui(self):
-        # Tab widget for different mud report sections
-        tabs = QTabWidget()
-        
-        # Properties tab
-        properties_tab = self.create_properties_tab()
-        tabs.addTab(properties_tab, "Properties")
-        
-        # Volumes tab
-        volumes_tab = self.create_volumes_tab()
-        tabs.addTab(volumes_tab, "Volumes")
-        
-        # Chemicals tab
-        chemicals_tab = self.create_chemicals_tab()
-        tabs.addTab(chemicals_tab, "Chemicals")
-        
-        # Solid Control tab
-        solid_control_tab = self.create_solid_control_tab()
-        tabs.addTab(solid_control_tab, "Solid Control")
+        # Tab widget for different mud report sections, built on first visit
+        self.tabs = QTabWidget()
+        self._tab_builders = {
+            0: self.create_properties_tab,
+            1: self.create_volumes_tab,
+            2: self.create_chemicals_tab,
+            3: self.create_solid_control_tab,
+        }
+        for label in ("Properties", "Volumes", "Chemicals", "Solid Control"):
+            self.tabs.addTab(QWidget(), label)
+        
+        self.tabs.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(0)
         
         main_layout = QVBoxLayout()
-        main_layout.addWidget(tabs)
+        main_layout.addWidget(self.tabs)
         
         # Save button
         save_button = QPushButton("Save Mud Report")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #8e44ad;
-            }
-        """)
+        save_button.setObjectName("saveMud")
         main_layout.addWidget(save_button)
         
         self.setLayout(main_layout)
     
+    def _ensure_tab(self, index):
+        """Build the tab at index if it is still a placeholder"""
+        build_lazy_tab(self.tabs, self._tab_builders, index)
+    
     def create_properties_tab(self):
         """Create mud properties tab"""
         tab = QWidget()
@@ -2726,10 +3935,7 @@ class MudReportWidget(QWidget):
         basic_layout = QFormLayout()
         
         self.mud_type_combo = QComboBox()
-        self.mud_type_combo.addItems([
-            "Water Based", "Oil Based", "Synthetic Based", 
-            "KCl Polymer", "PHPA", "Sulfonated"
-        ])
+        self.mud_type_combo.setModel(shared_combo_model("mud_types"))
         
         self.sample_time_edit = QTimeEdit()
         self.sample_time_edit.setTime(QTime.currentTime())
@@ -2743,63 +3949,17 @@ class MudReportWidget(QWidget):
         # Rheology properties
         rheology_group = QGroupBox("Rheology Properties")
         rheology_layout = QGridLayout()
-        
-        # Row 1
-        rheology_layout.addWidget(QLabel("MW (ppg):"), 0, 0)
-        self.mw_spin = QDoubleSpinBox()
-        self.mw_spin.setRange(8, 20)
-        self.mw_spin.setValue(10.5)
-        rheology_layout.addWidget(self.mw_spin, 0, 1)
-        
-        rheology_layout.addWidget(QLabel("PV (cp):"), 0, 2)
-        self.pv_spin = QDoubleSpinBox()
-        self.pv_spin.setRange(0, 100)
-        self.pv_spin.setValue(15)
-        rheology_layout.addWidget(self.pv_spin, 0, 3)
-        
-        rheology_layout.addWidget(QLabel("YP (lb/100ft²):"), 0, 4)
-        self.yp_spin = QDoubleSpinBox()
-        self.yp_spin.setRange(0, 50)
-        self.yp_spin.setValue(10)
-        rheology_layout.addWidget(self.yp_spin, 0, 5)
-        
-        # Row 2
-        rheology_layout.addWidget(QLabel("Funnel Visc (sec/qt):"), 1, 0)
-        self.funnel_visc_spin = QDoubleSpinBox()
-        self.funnel_visc_spin.setRange(0, 200)
-        self.funnel_visc_spin.setValue(45)
-        rheology_layout.addWidget(self.funnel_visc_spin, 1, 1)
-        
-        rheology_layout.addWidget(QLabel("Gel 10s:"), 1, 2)
-        self.gel_10s_spin = QDoubleSpinBox()
-        self.gel_10s_spin.setRange(0, 50)
-        self.gel_10s_spin.setValue(5)
-        rheology_layout.addWidget(self.gel_10s_spin, 1, 3)
-        
-        rheology_layout.addWidget(QLabel("Gel 10m:"), 1, 4)
-        self.gel_10m_spin = QDoubleSpinBox()
-        self.gel_10m_spin.setRange(0, 50)
-        self.gel_10m_spin.setValue(8)
-        rheology_layout.addWidget(self.gel_10m_spin, 1, 5)
-        
-        # Row 3
-        rheology_layout.addWidget(QLabel("Gel 30m:"), 2, 0)
-        self.gel_30m_spin = QDoubleSpinBox()
-        self.gel_30m_spin.setRange(0, 50)
-        self.gel_30m_spin.setValue(10)
-        rheology_layout.addWidget(self.gel_30m_spin, 2, 1)
-        
-        rheology_layout.addWidget(QLabel("Fluid Loss (cc/30min):"), 2, 2)
-        self.fluid_loss_spin = QDoubleSpinBox()
-        self.fluid_loss_spin.setRange(0, 50)
-        self.fluid_loss_spin.setValue(6)
-        rheology_layout.addWidget(self.fluid_loss_spin, 2, 3)
-        
-        rheology_layout.addWidget(QLabel("Cake Thickness (mm):"), 2, 4)
-        self.cake_thickness_spin = QDoubleSpinBox()
-        self.cake_thickness_spin.setRange(0, 10)
-        self.cake_thickness_spin.setValue(1.5)
-        rheology_layout.addWidget(self.cake_thickness_spin, 2, 5)
+        add_spin_grid(self, rheology_layout, [
+            ("mw_spin", "MW (ppg):", 8, 20, "", 10.5),
+            ("pv_spin", "PV (cp):", 0, 100, "", 15),
+            ("yp_spin", "YP (lb/100ft²):", 0, 50, "", 10),
+            ("funnel_visc_spin", "Funnel Visc (sec/qt):", 0, 200, "", 45),
+            ("gel_10s_spin", "Gel 10s:", 0, 50, "", 5),
+            ("gel_10m_spin", "Gel 10m:", 0, 50, "", 8),
+            ("gel_30m_spin", "Gel 30m:", 0, 50, "", 10),
+            ("fluid_loss_spin", "Fluid Loss (cc/30min):", 0, 50, "", 6),
+            ("cake_thickness_spin", "Cake Thickness (mm):", 0, 10, "", 1.5),
+        ], columns=3)
         
         rheology_group.setLayout(rheology_layout)
         form_layout.addRow(rheology_group)
@@ -2807,79 +3967,23 @@ class MudReportWidget(QWidget):
         # Chemical properties
         chemical_group = QGroupBox("Chemical Properties")
         chemical_layout = QGridLayout()
-        
-        # Row 1
-        chemical_layout.addWidget(QLabel("Ca (ppm):"), 0, 0)
-        self.ca_spin = QDoubleSpinBox()
-        self.ca_spin.setRange(0, 5000)
-        chemical_layout.addWidget(self.ca_spin, 0, 1)
-        
-        chemical_layout.addWidget(QLabel("Cl (ppm):"), 0, 2)
-        self.cl_spin = QDoubleSpinBox()
-        self.cl_spin.setRange(0, 200000)
-        chemical_layout.addWidget(self.cl_spin, 0, 3)
-        
-        chemical_layout.addWidget(QLabel("KCl (ppm):"), 0, 4)
-        self.kcl_spin = QDoubleSpinBox()
-        self.kcl_spin.setRange(0, 50000)
-        chemical_layout.addWidget(self.kcl_spin, 0, 5)
-        
-        # Row 2
-        chemical_layout.addWidget(QLabel("pH:"), 1, 0)
-        self.ph_spin = QDoubleSpinBox()
-        self.ph_spin.setRange(0, 14)
-        self.ph_spin.setValue(9.5)
-        chemical_layout.addWidget(self.ph_spin, 1, 1)
-        
-        chemical_layout.addWidget(QLabel("Hardness:"), 1, 2)
-        self.hardness_spin = QDoubleSpinBox()
-        self.hardness_spin.setRange(0, 1000)
-        chemical_layout.addWidget(self.hardness_spin, 1, 3)
-        
-        chemical_layout.addWidget(QLabel("MBT (lb/bbl):"), 1, 4)
-        self.mbt_spin = QDoubleSpinBox()
-        self.mbt_spin.setRange(0, 50)
-        chemical_layout.addWidget(self.mbt_spin, 1, 5)
-        
-        # Row 3
-        chemical_layout.addWidget(QLabel("Solid %:"), 2, 0)
-        self.solid_percent_spin = QDoubleSpinBox()
-        self.solid_percent_spin.setRange(0, 50)
-        self.solid_percent_spin.setValue(15)
-        chemical_layout.addWidget(self.solid_percent_spin, 2, 1)
-        
-        chemical_layout.addWidget(QLabel("Oil %:"), 2, 2)
-        self.oil_percent_spin = QDoubleSpinBox()
-        self.oil_percent_spin.setRange(0, 100)
-        chemical_layout.addWidget(self.oil_percent_spin, 2, 3)
-        
-        chemical_layout.addWidget(QLabel("Water %:"), 2, 4)
-        self.water_percent_spin = QDoubleSpinBox()
-        self.water_percent_spin.setRange(0, 100)
-        self.water_percent_spin.setValue(85)
-        chemical_layout.addWidget(self.water_percent_spin, 2, 5)
-        
-        # Row 4
-        chemical_layout.addWidget(QLabel("Glycol %:"), 3, 0)
-        self.glycol_percent_spin = QDoubleSpinBox()
-        self.glycol_percent_spin.setRange(0, 100)
-        chemical_layout.addWidget(self.glycol_percent_spin, 3, 1)
-        
-        chemical_layout.addWidget(QLabel("Temp (°C):"), 3, 2)
-        self.temp_spin = QDoubleSpinBox()
-        self.temp_spin.setRange(0, 200)
-        self.temp_spin.setValue(60)
-        chemical_layout.addWidget(self.temp_spin, 3, 3)
-        
-        chemical_layout.addWidget(QLabel("Pf:"), 3, 4)
-        self.pf_spin = QDoubleSpinBox()
-        self.pf_spin.setRange(0, 14)
-        chemical_layout.addWidget(self.pf_spin, 3, 5)
-        
-        chemical_layout.addWidget(QLabel("Mf:"), 3, 6)
-        self.mf_spin = QDoubleSpinBox()
-        self.mf_spin.setRange(0, 14)
-        chemical_layout.addWidget(self.mf_spin, 3, 7)
+        add_spin_grid(self, chemical_layout, [
+            ("ca_spin", "Ca (ppm):", 0, 5000, "", None),
+            ("cl_spin", "Cl (ppm):", 0, 200000, "", None),
+            ("kcl_spin", "KCl (ppm):", 0, 50000, "", None),
+            ("ph_spin", "pH:", 0, 14, "", 9.5),
+            ("hardness_spin", "Hardness:", 0, 1000, "", None),
+            ("mbt_spin", "MBT (lb/bbl):", 0, 50, "", None),
+            ("solid_percent_spin", "Solid %:", 0, 50, "", 15),
+            ("oil_percent_spin", "Oil %:", 0, 100, "", None),
+            ("water_percent_spin", "Water %:", 0, 100, "", 85),
+        ], columns=3)
+        add_spin_grid(self, chemical_layout, [
+            ("glycol_percent_spin", "Glycol %:", 0, 100, "", None),
+            ("temp_spin", "Temp (°C):", 0, 200, "", 60),
+            ("pf_spin", "Pf:", 0, 14, "", None),
+            ("mf_spin", "Mf:", 0, 14, "", None),
+        ], columns=4, start_row=3)
         
         chemical_group.setLayout(chemical_layout)
         form_layout.addRow(chemical_group)
@@ -2901,27 +4005,12 @@ class MudReportWidget(QWidget):
         volumes_group = QGroupBox("Mud Volumes")
         volumes_layout = QGridLayout()
         
-        # Row 1
-        volumes_layout.addWidget(QLabel("Vol. in Hole (bbl):"), 0, 0)
-        self.vol_in_hole_spin = QDoubleSpinBox()
-        self.vol_in_hole_spin.setRange(0, 5000)
-        volumes_layout.addWidget(self.vol_in_hole_spin, 0, 1)
-        
-        volumes_layout.addWidget(QLabel("Total Circulated (bbl):"), 0, 2)
-        self.total_circulated_spin = QDoubleSpinBox()
-        self.total_circulated_spin.setRange(0, 10000)
-        volumes_layout.addWidget(self.total_circulated_spin, 0, 3)
-        
-        # Row 2
-        volumes_layout.addWidget(QLabel("Downhole Loss (bbl):"), 1, 0)
-        self.downhole_loss_spin = QDoubleSpinBox()
-        self.downhole_loss_spin.setRange(0, 1000)
-        volumes_layout.addWidget(self.downhole_loss_spin, 1, 1)
-        
-        volumes_layout.addWidget(QLabel("Surface Loss (bbl):"), 1, 2)
-        self.surface_loss_spin = QDoubleSpinBox()
-        self.surface_loss_spin.setRange(0, 1000)
-        volumes_layout.addWidget(self.surface_loss_spin, 1, 3)
+        add_spin_grid(self, volumes_layout, [
+            ("vol_in_hole_spin", "Vol. in Hole (bbl):", 0, 5000, "", None),
+            ("total_circulated_spin", "Total Circulated (bbl):", 0, 10000, "", None),
+            ("downhole_loss_spin", "Downhole Loss (bbl):", 0, 1000, "", None),
+            ("surface_loss_spin", "Surface Loss (bbl):", 0, 1000, "", None),
+        ], columns=2)
         
         volumes_group.setLayout(volumes_layout)
         form_layout.addRow(volumes_group)
@@ -2930,22 +4019,10 @@ class MudReportWidget(QWidget):
         tanks_group = QGroupBox("Tank Volumes")
         tanks_layout = QGridLayout()
         
-        tanks = [
-            ("Suction Tank", "suction_tank_spin"),
-            ("Reserve Tank", "reserve_tank_spin"),
-            ("Degasser", "degasser_spin"),
-            ("Desander", "desander_spin"),
-            ("Desilter", "desilter_spin"),
-            ("Middle Tank", "middle_tank_spin"),
-            ("T-Tank", "total_tank_spin"),
-            ("Sand Trap", "sand_trap_spin")
-        ]
-        
         row, col = 0, 0
-        for name, attr_name in tanks:
+        for name, attr_name in self.TANKS:
             label = QLabel(f"{name} (bbl):")
-            spin = QDoubleSpinBox()
-            spin.setRange(0, 2000)
+            spin = make_double_spin(0, 2000)
             setattr(self, attr_name, spin)
             
             tanks_layout.addWidget(label, row, col * 2)
@@ -2972,10 +4049,8 @@ class MudReportWidget(QWidget):
         
         # Chemicals table
         self.chemicals_table = QTableWidget()
-        self.chemicals_table.setColumnCount(5)
-        self.chemicals_table.setHorizontalHeaderLabels([
-            "Product Type", "Received", "Used", "Stock", "Unit"
-        ])
+        self.chemicals_table.setColumnCount(len(self.CHEMICALS_HEADERS))
+        self.chemicals_table.setHorizontalHeaderLabels(self.CHEMICALS_HEADERS)
         
         # Add/Remove buttons
         button_layout = QHBoxLayout()
@@ -3005,10 +4080,7 @@ class MudReportWidget(QWidget):
         
         equipment_layout.addWidget(QLabel("Equipment:"), 0, 0)
         self.equipment_combo = QComboBox()
-        self.equipment_combo.addItems([
-            "Shale Shaker", "Desander", "Desilter", 
-            "Centrifuge", "Degasser", "Mud Cleaner"
-        ])
+        self.equipment_combo.setModel(shared_combo_model("solid_control_equipment"))
         equipment_layout.addWidget(self.equipment_combo, 0, 1)
         
         equipment_layout.addWidget(QLabel("Feed Rate (bbl/hr):"), 0, 2)
@@ -3082,8 +4154,34 @@ class MudReportWidget(QWidget):
         tab.setLayout(layout)
         return tab
 
+class _ThumbSignals(QObject):
+    """Signals for _ThumbTask (QRunnable is not a QObject)"""
+    ready = Signal(str, float, QImage)
+
+class _ThumbTask(QRunnable):
+    """Decode an image at preview size on a pool thread"""
+    def __init__(self, path, mtime, max_size):
+        super().__init__()
+        self.path = path
+        self.mtime = mtime
+        self.max_size = max_size
+        self.signals = _ThumbSignals()
+    
+    def run(self):
+        # Let the decoder downsample instead of decoding full resolution
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            reader.setScaledSize(size.scaled(self.max_size, Qt.KeepAspectRatio))
+        self.signals.ready.emit(self.path, self.mtime, reader.read())
+
 class BitReportWidget(QWidget):
     """Bit record and report widget"""
+    THUMB_SIZE = QSize(300, 300)
+    THUMB_CACHE_LIMIT = 32
+    _thumb_cache = {}  # (path, mtime) -> QPixmap, shared by all instances
+    
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
@@ -3097,145 +4195,77 @@ class BitReportWidget(QWidget):
         title_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
         main_layout.addWidget(title_label)
         
-        # Tab widget for different sections
-        tabs = QTabWidget()
-        
-        # Bit Information tab
-        info_tab = self.create_bit_info_tab()
-        tabs.addTab(info_tab, "Bit Information")
-        
-        # Performance tab
-        perf_tab = self.create_performance_tab()
-        tabs.addTab(perf_tab, "Performance Data")
-        
-        # Photos tab
-        photos_tab = self.create_photos_tab()
-        tabs.addTab(photos_tab, "Photos")
+        # Tab widget for different sections; performance and photos are built on first visit
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.create_bit_info_tab(), "Bit Information")
+        self.tabs.addTab(QWidget(), "Performance Data")
+        self.tabs.addTab(QWidget(), "Photos")
+        self._tab_builders = {
+            1: self.create_performance_tab,
+            2: self.create_photos_tab,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab)
         
-        main_layout.addWidget(tabs)
+        main_layout.addWidget(self.tabs)
         
         # Save button
         save_button = QPushButton("Save Bit Record")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e67e22;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #d35400;
-            }
-        """)
+        save_button.setObjectName("saveBit")
         main_layout.addWidget(save_button)
         
         self.setLayout(main_layout)
     
+    def _ensure_tab(self, index):
+        """Build the tab at index if it is still a placeholder"""
+        build_lazy_tab(self.tabs, self._tab_builders, index)
+    
     def create_bit_info_tab(self):
         """Create bit information tab"""
         tab = QWidget()
         layout = QVBoxLayout()
         
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        
-        container = QWidget()
-        form_layout = QFormLayout()
+        scroll, form_layout = make_scroll_form()
         
         # Basic Information group
         basic_group = QGroupBox("Basic Information")
-        basic_layout = QGridLayout()
-        
-        # Row 1
-        basic_layout.addWidget(QLabel("Bit No:"), 0, 0)
         self.bit_no_input = QLineEdit()
         self.bit_no_input.setPlaceholderText("e.g., BIT-001")
-        basic_layout.addWidget(self.bit_no_input, 0, 1)
-        
-        basic_layout.addWidget(QLabel("Size (inch):"), 0, 2)
-        self.size_spin = QDoubleSpinBox()
-        self.size_spin.setRange(0, 50)
-        self.size_spin.setValue(8.5)
-        basic_layout.addWidget(self.size_spin, 0, 3)
-        
-        # Row 2
-        basic_layout.addWidget(QLabel("Manufacturer:"), 1, 0)
+        self.size_spin = make_double_spin(0, 50, value=8.5)
         self.manufacturer_combo = QComboBox()
-        self.manufacturer_combo.addItems([
-            "Baker Hughes", "Halliburton", "Schlumberger", 
-            "Weatherford", "NOV", "Varel", "Other"
-        ])
-        basic_layout.addWidget(self.manufacturer_combo, 1, 1)
-        
-        basic_layout.addWidget(QLabel("Type:"), 1, 2)
+        self.manufacturer_combo.setModel(shared_combo_model("bit_manufacturers"))
         self.type_combo = QComboBox()
-        self.type_combo.addItems([
-            "PDC", "Tricone", "Diamond", "Impregnated",
-            "Roller Cone", "Fixed Cutter", "Hybrid"
-        ])
-        basic_layout.addWidget(self.type_combo, 1, 3)
-        
-        # Row 3
-        basic_layout.addWidget(QLabel("Serial No:"), 2, 0)
+        self.type_combo.setModel(shared_combo_model("bit_types"))
         self.serial_no_input = QLineEdit()
-        basic_layout.addWidget(self.serial_no_input, 2, 1)
-        
-        basic_layout.addWidget(QLabel("IADC Code:"), 2, 2)
         self.iadc_code_input = QLineEdit()
         self.iadc_code_input.setPlaceholderText("e.g., M323")
-        basic_layout.addWidget(self.iadc_code_input, 2, 3)
-        
-        basic_group.setLayout(basic_layout)
+        basic_group.setLayout(make_form_columns([
+            ("Bit No:", self.bit_no_input), ("Size (inch):", self.size_spin),
+            ("Manufacturer:", self.manufacturer_combo), ("Type:", self.type_combo),
+            ("Serial No:", self.serial_no_input), ("IADC Code:", self.iadc_code_input),
+        ]))
         form_layout.addRow(basic_group)
         
         # Dull Grading group
         dull_group = QGroupBox("Dull Grading & Pull Reason")
-        dull_layout = QGridLayout()
-        
-        # Row 1
-        dull_layout.addWidget(QLabel("Dull Grading:"), 0, 0)
         self.dull_grading_combo = QComboBox()
-        self.dull_grading_combo.addItems([
-            "1-1-1", "1-2-1", "2-1-1", "2-2-1", "3-1-1", "3-2-1",
-            "4-1-1", "4-2-1", "5-1-1", "5-2-1", "6-1-1", "6-2-1",
-            "7-1-1", "7-2-1", "8-1-1", "8-2-1"
-        ])
-        dull_layout.addWidget(self.dull_grading_combo, 0, 1)
-        
-        dull_layout.addWidget(QLabel("Reason Pulled:"), 0, 2)
+        self.dull_grading_combo.setModel(shared_combo_model("dull_grades"))
         self.reason_pulled_combo = QComboBox()
-        self.reason_pulled_combo.addItems([
-            "TD Reached", "ROP Drop", "Torque Increase",
-            "WOB Increase", "Bearing Failure", "Cutter Damage",
-            "Gauge Wear", "Other"
-        ])
-        dull_layout.addWidget(self.reason_pulled_combo, 0, 3)
-        
-        dull_group.setLayout(dull_layout)
+        self.reason_pulled_combo.setModel(shared_combo_model("reasons_pulled"))
+        dull_group.setLayout(make_form_columns([
+            ("Dull Grading:", self.dull_grading_combo), ("Reason Pulled:", self.reason_pulled_combo),
+        ]))
         form_layout.addRow(dull_group)
         
         # Formation Information group
         formation_group = QGroupBox("Formation Information")
-        formation_layout = QGridLayout()
-        
-        formation_layout.addWidget(QLabel("Formation:"), 0, 0)
         self.formation_input = QLineEdit()
-        formation_layout.addWidget(self.formation_input, 0, 1)
-        
-        formation_layout.addWidget(QLabel("Lithology:"), 0, 2)
         self.lithology_combo = QComboBox()
-        self.lithology_combo.addItems([
-            "Sandstone", "Shale", "Limestone", "Dolomite",
-            "Claystone", "Siltstone", "Conglomerate", "Evaporite"
-        ])
-        formation_layout.addWidget(self.lithology_combo, 0, 3)
-        
-        formation_group.setLayout(formation_layout)
+        self.lithology_combo.setModel(shared_combo_model("lithologies"))
+        formation_group.setLayout(make_form_columns([
+            ("Formation:", self.formation_input), ("Lithology:", self.lithology_combo),
+        ]))
         form_layout.addRow(formation_group)
         
-        container.setLayout(form_layout)
-        scroll.setWidget(container)
         layout.addWidget(scroll)
         
         tab.setLayout(layout)
@@ -3246,116 +4276,49 @@ class BitReportWidget(QWidget):
         tab = QWidget()
         layout = QVBoxLayout()
         
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        
-        container = QWidget()
-        form_layout = QFormLayout()
+        scroll, form_layout = make_scroll_form()
         
         # Depth Information group
         depth_group = QGroupBox("Depth Information")
-        depth_layout = QGridLayout()
-        
-        # Row 1
-        depth_layout.addWidget(QLabel("Depth In (m):"), 0, 0)
-        self.depth_in_spin = QDoubleSpinBox()
-        self.depth_in_spin.setRange(0, 50000)
-        depth_layout.addWidget(self.depth_in_spin, 0, 1)
-        
-        depth_layout.addWidget(QLabel("Depth Out (m):"), 0, 2)
-        self.depth_out_spin = QDoubleSpinBox()
-        self.depth_out_spin.setRange(0, 50000)
-        depth_layout.addWidget(self.depth_out_spin, 0, 3)
-        
-        # Row 2
-        depth_layout.addWidget(QLabel("Hours Run:"), 1, 0)
-        self.hours_spin = QDoubleSpinBox()
-        self.hours_spin.setRange(0, 1000)
-        depth_layout.addWidget(self.hours_spin, 1, 1)
-        
-        depth_layout.addWidget(QLabel("Cum. Drilled (m):"), 1, 2)
-        self.cum_drilled_spin = QDoubleSpinBox()
-        self.cum_drilled_spin.setRange(0, 50000)
-        depth_layout.addWidget(self.cum_drilled_spin, 1, 3)
-        
-        # Row 3
-        depth_layout.addWidget(QLabel("Cum. Hours:"), 2, 0)
-        self.cum_hours_spin = QDoubleSpinBox()
-        self.cum_hours_spin.setRange(0, 10000)
-        depth_layout.addWidget(self.cum_hours_spin, 2, 1)
-        
-        depth_layout.addWidget(QLabel("ROP (m/hr):"), 2, 2)
-        self.rop_spin = QDoubleSpinBox()
-        self.rop_spin.setRange(0, 500)
-        depth_layout.addWidget(self.rop_spin, 2, 3)
-        
-        depth_group.setLayout(depth_layout)
+        self.depth_in_spin = make_double_spin(0, 50000)
+        self.depth_out_spin = make_double_spin(0, 50000)
+        self.hours_spin = make_double_spin(0, 1000)
+        self.cum_drilled_spin = make_double_spin(0, 50000)
+        self.cum_hours_spin = make_double_spin(0, 10000)
+        self.rop_spin = make_double_spin(0, 500)
+        depth_group.setLayout(make_form_columns([
+            ("Depth In (m):", self.depth_in_spin), ("Depth Out (m):", self.depth_out_spin),
+            ("Hours Run:", self.hours_spin), ("Cum. Drilled (m):", self.cum_drilled_spin),
+            ("Cum. Hours:", self.cum_hours_spin), ("ROP (m/hr):", self.rop_spin),
+        ]))
         form_layout.addRow(depth_group)
         
         # Drilling Parameters group
         params_group = QGroupBox("Drilling Parameters (Average)")
-        params_layout = QGridLayout()
-        
-        # Row 1
-        params_layout.addWidget(QLabel("WOB (klb):"), 0, 0)
-        self.wob_avg_spin = QDoubleSpinBox()
-        self.wob_avg_spin.setRange(0, 100)
-        params_layout.addWidget(self.wob_avg_spin, 0, 1)
-        
-        params_layout.addWidget(QLabel("RPM:"), 0, 2)
-        self.rpm_avg_spin = QDoubleSpinBox()
-        self.rpm_avg_spin.setRange(0, 500)
-        params_layout.addWidget(self.rpm_avg_spin, 0, 3)
-        
-        # Row 2
-        params_layout.addWidget(QLabel("Flowrate (gpm):"), 1, 0)
-        self.flowrate_avg_spin = QDoubleSpinBox()
-        self.flowrate_avg_spin.setRange(0, 2000)
-        params_layout.addWidget(self.flowrate_avg_spin, 1, 1)
-        
-        params_layout.addWidget(QLabel("SPP (psi):"), 1, 2)
-        self.spp_avg_spin = QDoubleSpinBox()
-        self.spp_avg_spin.setRange(0, 5000)
-        params_layout.addWidget(self.spp_avg_spin, 1, 3)
-        
-        # Row 3
-        params_layout.addWidget(QLabel("PV (cp):"), 2, 0)
-        self.pv_avg_spin = QDoubleSpinBox()
-        self.pv_avg_spin.setRange(0, 100)
-        params_layout.addWidget(self.pv_avg_spin, 2, 1)
-        
-        params_layout.addWidget(QLabel("YP (lb/100ft²):"), 2, 2)
-        self.yp_avg_spin = QDoubleSpinBox()
-        self.yp_avg_spin.setRange(0, 50)
-        params_layout.addWidget(self.yp_avg_spin, 2, 3)
-        
-        params_group.setLayout(params_layout)
+        self.wob_avg_spin = make_double_spin(0, 100)
+        self.rpm_avg_spin = make_double_spin(0, 500)
+        self.flowrate_avg_spin = make_double_spin(0, 2000)
+        self.spp_avg_spin = make_double_spin(0, 5000)
+        self.pv_avg_spin = make_double_spin(0, 100)
+        self.yp_avg_spin = make_double_spin(0, 50)
+        params_group.setLayout(make_form_columns([
+            ("WOB (klb):", self.wob_avg_spin), ("RPM:", self.rpm_avg_spin),
+            ("Flowrate (gpm):", self.flowrate_avg_spin), ("SPP (psi):", self.spp_avg_spin),
+            ("PV (cp):", self.pv_avg_spin), ("YP (lb/100ft²):", self.yp_avg_spin),
+        ]))
         form_layout.addRow(params_group)
         
         # Technical Data group
         tech_group = QGroupBox("Technical Data")
-        tech_layout = QGridLayout()
-        
-        tech_layout.addWidget(QLabel("Cumulative Drilling (m):"), 0, 0)
-        self.cumulative_drilling_spin = QDoubleSpinBox()
-        self.cumulative_drilling_spin.setRange(0, 100000)
-        tech_layout.addWidget(self.cumulative_drilling_spin, 0, 1)
-        
-        tech_layout.addWidget(QLabel("Revolution:"), 0, 2)
-        self.revolution_spin = QDoubleSpinBox()
-        self.revolution_spin.setRange(0, 1000000)
-        tech_layout.addWidget(self.revolution_spin, 0, 3)
-        
-        tech_layout.addWidget(QLabel("TFA (in²):"), 1, 0)
-        self.tfa_spin = QDoubleSpinBox()
-        self.tfa_spin.setRange(0, 5)
-        tech_layout.addWidget(self.tfa_spin, 1, 1)
-        
-        tech_group.setLayout(tech_layout)
+        self.cumulative_drilling_spin = make_double_spin(0, 100000)
+        self.revolution_spin = make_double_spin(0, 1000000)
+        self.tfa_spin = make_double_spin(0, 5)
+        tech_group.setLayout(make_form_columns([
+            ("Cumulative Drilling (m):", self.cumulative_drilling_spin), ("Revolution:", self.revolution_spin),
+            ("TFA (in²):", self.tfa_spin),
+        ]))
         form_layout.addRow(tech_group)
         
-        container.setLayout(form_layout)
-        scroll.setWidget(container)
         layout.addWidget(scroll)
         
         tab.setLayout(layout)
@@ -3371,21 +4334,15 @@ class BitReportWidget(QWidget):
         before_layout = QVBoxLayout()
         
         self.before_photo_label = QLabel("No photo selected")
-        self.before_photo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.before_photo_label.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #cccccc;
-                padding: 20px;
-                background-color: #f8f9fa;
-            }
-        """)
+        self.before_photo_label.setAlignment(_ALIGN_CENTER)
+        self.before_photo_label.setObjectName("photoDrop")
         before_layout.addWidget(self.before_photo_label)
         
         before_button_layout = QHBoxLayout()
         before_browse_button = QPushButton("Browse Photo")
-        before_browse_button.clicked.connect(lambda: self.browse_photo("before"))
+        before_browse_button.clicked.connect(lambda _=False, lbl=self.before_photo_label: self.browse_photo(lbl, "Before"))
         before_clear_button = QPushButton("Clear")
-        before_clear_button.clicked.connect(lambda: self.clear_photo("before"))
+        before_clear_button.clicked.connect(lambda _=False, lbl=self.before_photo_label: self.clear_photo(lbl))
         
         before_button_layout.addWidget(before_browse_button)
         before_button_layout.addWidget(before_clear_button)
@@ -3400,21 +4357,15 @@ class BitReportWidget(QWidget):
         after_layout = QVBoxLayout()
         
         self.after_photo_label = QLabel("No photo selected")
-        self.after_photo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.after_photo_label.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #cccccc;
-                padding: 20px;
-                background-color: #f8f9fa;
-            }
-        """)
+        self.after_photo_label.setAlignment(_ALIGN_CENTER)
+        self.after_photo_label.setObjectName("photoDrop")
         after_layout.addWidget(self.after_photo_label)
         
         after_button_layout = QHBoxLayout()
         after_browse_button = QPushButton("Browse Photo")
-        after_browse_button.clicked.connect(lambda: self.browse_photo("after"))
+        after_browse_button.clicked.connect(lambda _=False, lbl=self.after_photo_label: self.browse_photo(lbl, "After"))
         after_clear_button = QPushButton("Clear")
-        after_clear_button.clicked.connect(lambda: self.clear_photo("after"))
+        after_clear_button.clicked.connect(lambda _=False, lbl=self.after_photo_label: self.clear_photo(lbl))
         
         after_button_layout.addWidget(after_browse_button)
         after_button_layout.addWidget(after_clear_button)
@@ -3440,32 +4391,130 @@ class BitReportWidget(QWidget):
         tab.setLayout(layout)
         return tab
     
-    def browse_photo(self, photo_type):
-        """Browse for photo file"""
+    def browse_photo(self, label, title):
+        """Browse for photo file and show it in label"""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
-            f"Select {photo_type.capitalize()} Photo",
+            f"Select {title} Photo",
             "",
             "Image Files (*.png *.jpg *.jpeg *.bmp *.gif)"
         )
         
         if file_path:
-            label = getattr(self, f"{photo_type}_photo_label")
-            label.setText(f"Photo: {Path(file_path).name}")
+            label.setText(f"Photo: {os.path.basename(file_path)}")
             label.setToolTip(file_path)
+            self.load_thumbnail(label, file_path)
     
-    def clear_photo(self, photo_type):
+    def load_thumbnail(self, label, file_path):
+        """Show a cached preview or decode one in the background"""
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            return
+        
+        pixmap = self._thumb_cache.get((file_path, mtime))
+        if pixmap is not None:
+            label.setPixmap(pixmap)
+            return
+        
+        task = _ThumbTask(file_path, mtime, self.THUMB_SIZE)
+        task.signals.ready.connect(lambda path, mt, image, lbl=label: self._on_thumb_ready(lbl, path, mt, image))
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_thumb_ready(self, label, path, mtime, image):
+        """Cache the decoded preview and show it if the label still wants it"""
+        if image.isNull():
+            return
+        
+        pixmap = QPixmap.fromImage(image)
+        cache = self._thumb_cache
+        if len(cache) >= self.THUMB_CACHE_LIMIT:
+            cache.pop(next(iter(cache)))
+        cache[(path, mtime)] = pixmap
+        
+        if label.toolTip() == path:
+            label.setPixmap(pixmap)
+    
+    def clear_photo(self, label):
         """Clear selected photo"""
-        label = getattr(self, f"{photo_type}_photo_label")
         label.setText("No photo selected")
         label.setToolTip("")
 
+class BHAComponentsModel(QAbstractTableModel):
+    """Table model over a BHAComponent list (shared with the owning widget)"""
+    HEADERS = ("Tool Type", "OD (in)", "ID (in)", "Length (m)", "Serial No", "Weight (kg)", "Remarks")
+    FIELDS = ("tool_type", "od", "id", "length", "serial_no", "weight", "remarks")
+    FORMATS = (None, "{:.2f}", "{:.2f}", "{:.2f}", None, "{:.1f}", None)
+    
+    def __init__(self, components, parent=None):
+        super().__init__(parent)
+        self._components = components
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._components)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.FIELDS)
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid() or role not in (_DISPLAY_ROLE, _EDIT_ROLE):
+            return None
+        value = getattr(self._components[index.row()], self.FIELDS[index.column()])
+        fmt = self.FORMATS[index.column()]
+        if role == _EDIT_ROLE or fmt is None:
+            return value
+        return fmt.format(value)
+    
+    def setData(self, index, value, role=_EDIT_ROLE):
+        if not index.isValid() or role != _EDIT_ROLE:
+            return False
+        column = index.column()
+        if self.FORMATS[column] is not None:
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return False
+        setattr(self._components[index.row()], self.FIELDS[column], value)
+        self.dataChanged.emit(index, index, _DISPLAY_EDIT_ROLES)
+        return True
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+    
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def append_component(self, component):
+        row = len(self._components)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._components.append(component)
+        self.endInsertRows()
+    
+    def remove_row(self, row):
+        if 0 <= row < len(self._components):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._components[row]
+            self.endRemoveRows()
+    
+    def swap_rows(self, row1, row2):
+        components = self._components
+        components[row1], components[row2] = components[row2], components[row1]
+        # One dataChanged over the span keeps selection and repaints only those rows
+        top = self.index(min(row1, row2), 0)
+        bottom = self.index(max(row1, row2), len(self.HEADERS) - 1)
+        self.dataChanged.emit(top, bottom, _DISPLAY_EDIT_ROLES)
+
 class BHAReportWidget(QWidget):
     """BHA report widget"""
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
         self.components = []
+        self._add_dialog = None  # built on first "Add Component" and reused
         self.init_ui()
     
     def init_ui(self):
@@ -3502,12 +4551,10 @@ class BHAReportWidget(QWidget):
         table_group = QGroupBox("BHA Components")
         table_layout = QVBoxLayout()
         
-        self.bha_table = QTableWidget()
-        self.bha_table.setColumnCount(7)
-        self.bha_table.setHorizontalHeaderLabels([
-            "Tool Type", "OD (in)", "ID (in)", "Length (m)", 
-            "Serial No", "Weight (kg)", "Remarks"
-        ])
+        self.bha_model = BHAComponentsModel(self.components, self)
+        self.bha_table = QTableView()
+        self.bha_table.setModel(self.bha_model)
+        self.bha_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         
         # Table buttons
         table_buttons = QHBoxLayout()
@@ -3552,36 +4599,32 @@ class BHAReportWidget(QWidget):
         
         # Save button
         save_button = QPushButton("Save BHA Report")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #16a085;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #138d75;
-            }
-        """)
+        save_button.setObjectName("saveBHA")
         save_button.clicked.connect(self.save_bha_report)
         main_layout.addWidget(save_button)
         
         self.setLayout(main_layout)
         
-        # Load wells
+        # Load wells, and reload only when the wells table changes
         self.load_wells()
+        self.db.wells_changed.connect(self.load_wells)
     
     def load_wells(self):
         """Load wells into combo box"""
         self.well_combo.clear()
-        wells = self.db.get_all_wells()
-        
-        for well in wells:
-            self.well_combo.addItem(f"{well.name} - {well.field}", well.id)
+        for well_id, label in self.db.get_well_choices():
+            self.well_combo.addItem(label, well_id)
     
     def add_component_dialog(self):
         """Show dialog to add BHA component"""
+        if self._add_dialog is None:
+            self._add_dialog = self.build_add_component_dialog()
+        else:
+            self.reset_add_component_dialog()
+        self._add_dialog.exec()
+    
+    def build_add_component_dialog(self):
+        """Create the add-component dialog once"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Add BHA Component")
         dialog.setMinimumWidth(500)
@@ -3591,26 +4634,18 @@ class BHAReportWidget(QWidget):
         
         # Tool Type
         self.component_tool_type = QComboBox()
-        self.component_tool_type.addItems([
-            "Bit", "Stabilizer", "Drill Collar", "Heavy Weight Drill Pipe",
-            "MWD", "LWD", "Motor", "RSS", "Cross Over", "Float Valve",
-            "Jar", "Shock Sub", "Reamer", "Underreamer", "Other"
-        ])
+        self.component_tool_type.setModel(shared_combo_model("bha_tool_types"))
         form.addRow("Tool Type:", self.component_tool_type)
         
         # Dimensions
-        dim_layout = QHBoxLayout()
-        self.component_od = QDoubleSpinBox()
-        self.component_od.setRange(0, 50)
-        self.component_od.setSuffix(" in")
+        dim_widget = QWidget()
+        dim_layout = QHBoxLayout(dim_widget)
+        dim_layout.setContentsMargins(0, 0, 0, 0)
+        self.component_od = make_double_spin(0, 50, " in")
         
-        self.component_id = QDoubleSpinBox()
-        self.component_id.setRange(0, 50)
-        self.component_id.setSuffix(" in")
+        self.component_id = make_double_spin(0, 50, " in")
         
-        self.component_length = QDoubleSpinBox()
-        self.component_length.setRange(0, 100)
-        self.component_length.setSuffix(" m")
+        self.component_length = make_double_spin(0, 100, " m")
         
         dim_layout.addWidget(QLabel("OD:"))
         dim_layout.addWidget(self.component_od)
@@ -3619,17 +4654,14 @@ class BHAReportWidget(QWidget):
         dim_layout.addWidget(QLabel("Length:"))
         dim_layout.addWidget(self.component_length)
         
-        form.addRow("Dimensions:", QWidget())
-        form.itemAt(form.rowCount()-1, QFormLayout.LabelRole).widget().setLayout(dim_layout)
+        form.addRow("Dimensions:", dim_widget)
         
         # Serial No and Weight
         self.component_serial = QLineEdit()
         self.component_serial.setPlaceholderText("Enter serial number")
         form.addRow("Serial No:", self.component_serial)
         
-        self.component_weight = QDoubleSpinBox()
-        self.component_weight.setRange(0, 10000)
-        self.component_weight.setSuffix(" kg")
+        self.component_weight = make_double_spin(0, 10000, " kg")
         form.addRow("Weight:", self.component_weight)
         
         # Remarks
@@ -3652,7 +4684,15 @@ class BHAReportWidget(QWidget):
         layout.addLayout(button_layout)
         
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
+    
+    def reset_add_component_dialog(self):
+        """Clear the reused add-component dialog's inputs"""
+        self.component_tool_type.setCurrentIndex(0)
+        for spin in (self.component_od, self.component_id, self.component_length, self.component_weight):
+            spin.setValue(0)
+        self.component_serial.clear()
+        self.component_remarks.clear()
     
     def add_component_to_table(self, dialog):
         """Add component to table"""
@@ -3666,26 +4706,14 @@ class BHAReportWidget(QWidget):
             remarks=self.component_remarks.toPlainText()
         )
         
-        # Add to table
-        row = self.bha_table.rowCount()
-        self.bha_table.insertRow(row)
-        
-        self.bha_table.setItem(row, 0, QTableWidgetItem(component.tool_type))
-        self.bha_table.setItem(row, 1, QTableWidgetItem(f"{component.od:.2f}"))
-        self.bha_table.setItem(row, 2, QTableWidgetItem(f"{component.id:.2f}"))
-        self.bha_table.setItem(row, 3, QTableWidgetItem(f"{component.length:.2f}"))
-        self.bha_table.setItem(row, 4, QTableWidgetItem(component.serial_no))
-        self.bha_table.setItem(row, 5, QTableWidgetItem(f"{component.weight:.1f}"))
-        self.bha_table.setItem(row, 6, QTableWidgetItem(component.remarks))
-        
-        # Add to internal list
-        self.components.append(component)
+        # Add to table and internal list in one model insert
+        self.bha_model.append_component(component)
         
         dialog.accept()
     
     def edit_component(self):
         """Edit selected component"""
-        selected_row = self.bha_table.currentRow()
+        selected_row = self.bha_table.currentIndex().row()
         if selected_row < 0:
             QMessageBox.warning(self, "Selection Error", "Please select a component to edit.")
             return
@@ -3695,37 +4723,25 @@ class BHAReportWidget(QWidget):
     
     def delete_component(self):
         """Delete selected component"""
-        selected_row = self.bha_table.currentRow()
-        if selected_row >= 0:
-            self.bha_table.removeRow(selected_row)
-            if selected_row < len(self.components):
-                del self.components[selected_row]
+        self.bha_model.remove_row(self.bha_table.currentIndex().row())
     
     def move_component_up(self):
         """Move component up in the table"""
-        selected_row = self.bha_table.currentRow()
+        selected_row = self.bha_table.currentIndex().row()
         if selected_row > 0:
             self.swap_rows(selected_row, selected_row - 1)
-            self.bha_table.setCurrentCell(selected_row - 1, 0)
+            self.bha_table.setCurrentIndex(self.bha_model.index(selected_row - 1, 0))
     
     def move_component_down(self):
         """Move component down in the table"""
-        selected_row = self.bha_table.currentRow()
-        if selected_row < self.bha_table.rowCount() - 1:
+        selected_row = self.bha_table.currentIndex().row()
+        if 0 <= selected_row < self.bha_model.rowCount() - 1:
             self.swap_rows(selected_row, selected_row + 1)
-            self.bha_table.setCurrentCell(selected_row + 1, 0)
+            self.bha_table.setCurrentIndex(self.bha_model.index(selected_row + 1, 0))
     
     def swap_rows(self, row1, row2):
-        """Swap two rows in the table"""
-        for col in range(self.bha_table.columnCount()):
-            item1 = self.bha_table.takeItem(row1, col)
-            item2 = self.bha_table.takeItem(row2, col)
-            self.bha_table.setItem(row2, col, item1)
-            self.bha_table.setItem(row1, col, item2)
-        
-        # Swap in components list
-        if row1 < len(self.components) and row2 < len(self.components):
-            self.components[row1], self.components[row2] = self.components[row2], self.components[row1]
+        """Swap two components"""
+        self.bha_model.swap_rows(row1, row2)
     
     def save_bha_report(self):
         """Save BHA report to database"""
@@ -3748,53 +4764,215 @@ class BHAReportWidget(QWidget):
             components=self.components
         )
         
-        # TODO: Save to database
-        QMessageBox.information(self, "Success", "BHA report saved successfully!")
+        if self.db.save_bha_run(bha_run) > 0:
+            QMessageBox.information(self, "Success", "BHA report saved successfully!")
+        else:
+            QMessageBox.warning(self, "Error", "Failed to save BHA report.")
+
+class SurveyModel(QAbstractTableModel):
+    """Survey stations stored column-wise: one contiguous float64 row per numeric column"""
+    HEADERS = (
+        "MD (m)", "Inc (°)", "Azi (°)", "TVD (m)", "North (m)",
+        "East (m)", "VS (m)", "HD (m)", "DLS (°/30m)", "Tool"
+    )
+    NUMERIC_COLUMNS = 9
+    TOOL_COLUMN = 9
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = np.zeros((self.NUMERIC_COLUMNS, 0), dtype=np.float64)
+        self._tools = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tools)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid() or role not in (_DISPLAY_ROLE, _EDIT_ROLE):
+            return None
+        row, column = index.row(), index.column()
+        if column == self.TOOL_COLUMN:
+            return self._tools[row]
+        value = float(self._columns[column, row])
+        return value if role == _EDIT_ROLE else f"{value:.2f}"
+    
+    def setData(self, index, value, role=_EDIT_ROLE):
+        if not index.isValid() or role != _EDIT_ROLE:
+            return False
+        row, column = index.row(), index.column()
+        if column == self.TOOL_COLUMN:
+            self._tools[row] = str(value)
+        else:
+            try:
+                self._columns[column, row] = float(value)
+            except (TypeError, ValueError):
+                return False
+        self.dataChanged.emit(index, index, _DISPLAY_EDIT_ROLES)
+        if column < 3:
+            # MD/Inc/Azi drive every derived column below this station
+            self.recalculate()
+        return True
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+    
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def append_station(self, md=0.0, inc=0.0, azi=0.0, tool=""):
+        row = len(self._tools)
+        station = np.zeros((self.NUMERIC_COLUMNS, 1), dtype=np.float64)
+        station[:3, 0] = (md, inc, azi)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._columns = np.hstack((self._columns, station))
+        self._tools.append(tool)
+        self.endInsertRows()
+    
+    def recalculate(self, vs_azimuth=0.0):
+        """Recompute TVD..DLS from MD/Inc/Azi for all stations in one pass"""
+        if not self._tools:
+            return
+        columns = self._columns
+        columns[3:9] = minimum_curvature(columns[0], columns[1], columns[2], vs_azimuth)
+        self.dataChanged.emit(
+            self.index(0, 3), self.index(len(self._tools) - 1, 8), _DISPLAY_EDIT_ROLES
+        )
+    
+    def set_array(self, values, tools=None):
+        """Replace all stations; values has MD/Inc/Azi first and up to 9 numeric columns"""
+        values = np.asarray(values, dtype=np.float64)
+        rows, column_count = values.shape
+        self.beginResetModel()
+        self._columns = np.zeros((self.NUMERIC_COLUMNS, rows), dtype=np.float64)
+        self._columns[:column_count] = values.T[:self.NUMERIC_COLUMNS]
+        self._tools = list(tools) if tools is not None else [""] * rows
+        if column_count < self.NUMERIC_COLUMNS and rows:
+            # Derive positions before views hear of the new data
+            columns = self._columns
+            columns[3:9] = minimum_curvature(columns[0], columns[1], columns[2], 0.0)
+        self.endResetModel()
+    
+    def column_arrays(self, *columns):
+        """Copies of the requested numeric columns (surface tie-on point first)"""
+        return [np.concatenate(([0.0], self._columns[column])) for column in columns]
+    
+    @classmethod
+    def read_csv(cls, path):
+        """Parse a survey CSV with a header row into (values, tools); safe off the GUI thread"""
+        with open(path, encoding="utf-8") as f:
+            column_count = len(f.readline().split(","))
+        numeric_count = min(column_count, cls.NUMERIC_COLUMNS)
+        values = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=2, usecols=range(numeric_count))
+        tools = None
+        if column_count > cls.TOOL_COLUMN:
+            tools = np.loadtxt(path, delimiter=",", skiprows=1, ndmin=1, usecols=cls.TOOL_COLUMN, dtype=str)
+        return values, tools
+    
+    def save_csv(self, path):
+        """Write all stations to a CSV file with a header row"""
+        records = np.rec.fromarrays([*self._columns, np.array(self._tools, dtype=str)])
+        np.savetxt(
+            path, records, delimiter=",", header=",".join(self.HEADERS), comments="", encoding="utf-8",
+            fmt=",".join(["%.4f"] * self.NUMERIC_COLUMNS + ["%s"])
+        )
+    
+    def remove_row(self, row):
+        if 0 <= row < len(self._tools):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self._columns = np.delete(self._columns, row, axis=1)
+            del self._tools[row]
+            self.endRemoveRows()
+
+class WellPathView(QWidget):
+    """Well path plot painted straight from survey arrays (vertical section or plan view)"""
+    MARGIN = 30
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setMinimumHeight(250)
+        self._x = np.zeros(0)
+        self._y = np.zeros(0)
+        self._polygon = None  # scaled to the current size, rebuilt lazily
+    
+    def set_path(self, x, y):
+        """Plot y (downwards) against x; both are float arrays of equal length"""
+        self._x = np.asarray(x, dtype=np.float64)
+        self._y = np.asarray(y, dtype=np.float64)
+        self._polygon = None
+        self.update()
+    
+    def resizeEvent(self, event):
+        self._polygon = None
+        super().resizeEvent(event)
+    
+    def _scaled_polygon(self):
+        # One vectorized transform per data/size change; paints reuse the polygon
+        area = self.rect().adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        x, y = self._x, self._y
+        span = max(np.ptp(x), np.ptp(y), 1e-9)
+        scale = min(area.width(), area.height()) / span
+        px = area.left() + (x - x.min()) * scale
+        py = area.top() + (y - y.min()) * scale
+        return QPolygonF([QPointF(a, b) for a, b in zip(px.tolist(), py.tolist())])
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        
+        if len(self._x) < 2:
+            painter.drawText(self.rect(), _ALIGN_CENTER, "Calculate the survey to plot the well path.")
+            return
+        
+        if self._polygon is None:
+            self._polygon = self._scaled_polygon()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor("#2c3e50"), 2))
+        painter.drawPolyline(self._polygon)
 
 class SurveyDataWidget(QWidget):
     """Survey data and formation tops widget"""
+    FORMATION_HEADERS = ("Formation Name", "Lithology", "MD (m)", "TVD (m)", "Description")
+    
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
         self.init_ui()
     
     def init_ui(self):
-        # Tab widget for survey and formation data
-        tabs = QTabWidget()
-        
-        # Survey Data tab
-        survey_tab = self.create_survey_tab()
-        tabs.addTab(survey_tab, "Survey Data")
-        
-        # Formation Tops tab
-        formation_tab = self.create_formation_tab()
-        tabs.addTab(formation_tab, "Formation Tops")
-        
-        # Visualization tab
-        viz_tab = self.create_visualization_tab()
-        tabs.addTab(viz_tab, "Visualization")
+        # Tab widget for survey and formation data; later tabs are built on first visit
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.create_survey_tab(), "Survey Data")
+        self.tabs.addTab(QWidget(), "Formation Tops")
+        self.tabs.addTab(QWidget(), "Visualization")
+        self._tab_builders = {
+            1: self.create_formation_tab,
+            2: self.create_visualization_tab,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab)
         
         main_layout = QVBoxLayout()
-        main_layout.addWidget(tabs)
+        main_layout.addWidget(self.tabs)
         
         # Save button
         save_button = QPushButton("Save Survey Data")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #34495e;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2c3e50;
-            }
-        """)
+        save_button.setObjectName("saveSurvey")
         main_layout.addWidget(save_button)
         
         self.setLayout(main_layout)
     
+    def _ensure_tab(self, index):
+        """Build the tab at index if it is still a placeholder"""
+        build_lazy_tab(self.tabs, self._tab_builders, index)
+    
     def create_survey_tab(self):
         """Create survey data tab"""
         tab = QWidget()
@@ -3820,20 +4998,22 @@ class SurveyDataWidget(QWidget):
         table_group = QGroupBox("Survey Stations")
         table_layout = QVBoxLayout()
         
-        self.survey_table = QTableWidget()
-        self.survey_table.setColumnCount(10)
-        self.survey_table.setHorizontalHeaderLabels([
-            "MD (m)", "Inc (°)", "Azi (°)", "TVD (m)", "North (m)", 
-            "East (m)", "VS (m)", "HD (m)", "DLS (°/30m)", "Tool"
-        ])
+        self.survey_model = SurveyModel(self)
+        self.survey_table = QTableView()
+        self.survey_table.setModel(self.survey_model)
         
         # Table buttons
         table_buttons = QHBoxLayout()
         add_button = QPushButton("Add Station")
+        add_button.clicked.connect(self.add_survey_station)
         delete_button = QPushButton("Delete Selected")
+        delete_button.clicked.connect(self.delete_survey_station)
         calculate_button = QPushButton("Calculate")
+        calculate_button.clicked.connect(self.calculate_survey)
         import_button = QPushButton("Import CSV")
+        import_button.clicked.connect(self.import_survey_csv)
         export_button = QPushButton("Export CSV")
+        export_button.clicked.connect(self.export_survey_csv)
         
         table_buttons.addWidget(add_button)
         table_buttons.addWidget(delete_button)
@@ -3849,35 +5029,68 @@ class SurveyDataWidget(QWidget):
         
         # Survey information
         info_group = QGroupBox("Survey Information")
-        info_layout = QGridLayout()
-        
-        info_layout.addWidget(QLabel("Survey Date:"), 0, 0)
         self.survey_date_edit = QDateEdit()
         self.survey_date_edit.setCalendarPopup(True)
         self.survey_date_edit.setDate(QDate.currentDate())
-        info_layout.addWidget(self.survey_date_edit, 0, 1)
-        
-        info_layout.addWidget(QLabel("Survey Company:"), 0, 2)
         self.survey_company_input = QLineEdit()
-        info_layout.addWidget(self.survey_company_input, 0, 3)
-        
-        info_layout.addWidget(QLabel("Tool Type:"), 1, 0)
         self.survey_tool_combo = QComboBox()
-        self.survey_tool_combo.addItems([
-            "Gyro", "MEMS", "MWD", "Single Shot", "Multi Shot", "Other"
-        ])
-        info_layout.addWidget(self.survey_tool_combo, 1, 1)
-        
-        info_layout.addWidget(QLabel("Surveyor:"), 1, 2)
+        self.survey_tool_combo.setModel(shared_combo_model("survey_tools"))
         self.surveyor_input = QLineEdit()
-        info_layout.addWidget(self.surveyor_input, 1, 3)
-        
-        info_group.setLayout(info_layout)
+        info_group.setLayout(make_form_columns([
+            ("Survey Date:", self.survey_date_edit), ("Survey Company:", self.survey_company_input),
+            ("Tool Type:", self.survey_tool_combo), ("Surveyor:", self.surveyor_input),
+        ]))
         layout.addWidget(info_group)
         
         tab.setLayout(layout)
         return tab
     
+    def add_survey_station(self):
+        """Append an empty survey station using the selected tool type"""
+        self.survey_model.append_station(tool=self.survey_tool_combo.currentText())
+    
+    def calculate_survey(self):
+        """Recompute survey positions with minimum curvature"""
+        self.survey_model.recalculate()
+    
+    def delete_survey_station(self):
+        """Delete selected survey station"""
+        self.survey_model.remove_row(self.survey_table.currentIndex().row())
+    
+    def import_survey_csv(self):
+        """Import survey stations from CSV (MD, Inc, Azi, ... [, Tool]) in the background"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import Survey", "", "CSV Files (*.csv)")
+        if not file_path:
+            return
+        
+        start_task(
+            SurveyModel.read_csv, file_path,
+            on_finished=self._on_survey_csv_loaded,
+            on_failed=lambda message: QMessageBox.warning(
+                self, "Import Error", f"Could not import survey:\n{message}"
+            ),
+        )
+    
+    def _on_survey_csv_loaded(self, result):
+        """Show imported stations (positions are derived if the file only had MD/Inc/Azi)"""
+        values, tools = result
+        self.survey_model.set_array(values, tools)
+    
+    def export_survey_csv(self):
+        """Export survey stations to CSV"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Survey", "survey.csv", "CSV Files (*.csv)")
+        if not file_path:
+            return
+        
+        try:
+            self.survey_model.save_csv(file_path)
+        except OSError as e:
+            QMessageBox.warning(self, "Export Error", f"Could not export survey:\n{e}")
+    
+    def load_formation_wells(self):
+        """Load wells into the formation tops combo box"""
+        fill_well_combo(self.formation_well_combo, self.db)
+    
     def create_formation_tab(self):
         """Create formation tops tab"""
         tab = QWidget()
@@ -3888,8 +5101,12 @@ class SurveyDataWidget(QWidget):
         well_layout.addWidget(QLabel("Well:"))
         
         self.formation_well_combo = QComboBox()
+        self.load_formation_wells()
+        # A bound method, so Qt drops the connection when this widget is destroyed
+        self.db.wells_changed.connect(self.load_formation_wells)
         
         load_button = QPushButton("Load Formation Tops")
+        load_button.clicked.connect(self.load_formation_tops)
         import_button = QPushButton("Import from Plan")
         
         well_layout.addWidget(self.formation_well_combo)
@@ -3903,11 +5120,8 @@ class SurveyDataWidget(QWidget):
         table_group = QGroupBox("Formation Tops")
         table_layout = QVBoxLayout()
         
-        self.formation_table = QTableWidget()
-        self.formation_table.setColumnCount(5)
-        self.formation_table.setHorizontalHeaderLabels([
-            "Formation Name", "Lithology", "MD (m)", "TVD (m)", "Description"
-        ])
+        self.formation_model = RowTableModel(self.FORMATION_HEADERS, self, intern_columns=(1,))
+        self.formation_table = make_table_view(self.formation_model)
         
         # Table buttons
         table_buttons = QHBoxLayout()
@@ -3929,7 +5143,7 @@ class SurveyDataWidget(QWidget):
         notes_group = QGroupBox("Formation Notes")
         notes_layout = QVBoxLayout()
         
-        self.formation_notes_text = QTextEdit()
+        self.formation_notes_text = QPlainTextEdit()
         self.formation_notes_text.setPlaceholderText("Add notes about formations...")
         self.formation_notes_text.setMaximumHeight(100)
         notes_layout.addWidget(self.formation_notes_text)
@@ -3940,6 +5154,16 @@ class SurveyDataWidget(QWidget):
         tab.setLayout(layout)
         return tab
     
+    def load_formation_tops(self):
+        """Load the selected well's formation tops"""
+        well_id = self.formation_well_combo.currentData()
+        if well_id is None:
+            return
+        replace_view_rows(self.formation_table, [
+            (top.name, top.lithology, top.md, top.tvd, top.description)
+            for top in self.db.get_formation_tops(well_id)
+        ])
+    
     def create_visualization_tab(self):
         """Create visualization tab"""
         tab = QWidget()
@@ -3951,15 +5175,12 @@ class SurveyDataWidget(QWidget):
         
         controls_layout.addWidget(QLabel("View Type:"), 0, 0)
         self.view_type_combo = QComboBox()
-        self.view_type_combo.addItems([
-            "Vertical Section", "Plan View", "3D View", 
-            "TVD vs MD", "Dogleg Plot"
-        ])
+        self.view_type_combo.setModel(shared_combo_model("survey_view_types"))
         controls_layout.addWidget(self.view_type_combo, 0, 1)
         
         controls_layout.addWidget(QLabel("Color Scheme:"), 0, 2)
         self.color_scheme_combo = QComboBox()
-        self.color_scheme_combo.addItems(["Rainbow", "Blue-Red", "Green-Brown", "Grayscale"])
+        self.color_scheme_combo.setModel(shared_combo_model("survey_color_schemes"))
         controls_layout.addWidget(self.color_scheme_combo, 0, 3)
         
         controls_layout.addWidget(QLabel("Show:"), 1, 0)
@@ -3982,18 +5203,17 @@ class SurveyDataWidget(QWidget):
         viz_area_group = QGroupBox("Visualization")
         viz_area_layout = QVBoxLayout()
         
-        self.viz_label = QLabel("Visualization Area\n\n3D well path visualization will appear here.")
-        self.viz_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.viz_label.setStyleSheet("""
-            QLabel {
-                border: 2px solid #cccccc;
-                padding: 50px;
-                background-color: #f8f9fa;
-                font-size: 14px;
-            }
-        """)
+        self.well_path_view = WellPathView()
+        self.well_path_view.setObjectName("vizArea")
+        self.update_well_path()
+        
+        # Replot whenever the stations or the chosen view change
+        self.survey_model.dataChanged.connect(self.update_well_path)
+        self.survey_model.modelReset.connect(self.update_well_path)
+        self.survey_model.rowsRemoved.connect(self.update_well_path)
+        self.view_type_combo.currentIndexChanged.connect(self.update_well_path)
         
-        viz_area_layout.addWidget(self.viz_label)
+        viz_area_layout.addWidget(self.well_path_view)
         viz_area_group.setLayout(viz_area_layout)
         layout.addWidget(viz_area_group)
         
@@ -4012,92 +5232,141 @@ class SurveyDataWidget(QWidget):
         
         tab.setLayout(layout)
         return tab
+    
+    def update_well_path(self, *_):
+        """Feed the plot from the survey model's column arrays"""
+        if self.view_type_combo.currentText() == "Plan View":
+            east, north = self.survey_model.column_arrays(5, 4)
+            self.well_path_view.set_path(east, -north)  # north up
+        else:
+            vs, tvd = self.survey_model.column_arrays(6, 3)
+            self.well_path_view.set_path(vs, tvd)
 
 class PersonnelLogisticsWidget(QWidget):
     """Personnel and logistics widget"""
+    PERSONNEL_HEADERS = (
+        "Company", "Name", "Position", "Arrival Date", "Departure Date",
+        "POB", "Contact", "Emergency Contact", "Status"
+    )
+    COMPANY_POB_HEADERS = ("Company", "On Board", "Total")
+    POB_HISTORY_HEADERS = ("Date", "POB Count", "Change")
+    BOATS_HEADERS = ("Boat Name", "Arrival", "Departure", "Status", "Cargo", "Remarks")
+    HELI_HEADERS = ("Flight No", "Arrival", "Departure", "PAX IN", "PAX OUT")
+    WEATHER_HISTORY_HEADERS = ("Time", "Wind Speed", "Direction", "Temp", "Visibility", "Sea State")
+    
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
+        # Table action buttons all connect to one slot that looks up this command table
+        self._commands = {
+            "personnel.delete": partial(self._remove_selected, "personnel"),
+            "personnel.import": self.import_personnel_csv,
+            "personnel.export": self.export_personnel_csv,
+            "boats.remove": partial(self._remove_selected, "boats"),
+            "heli.remove": partial(self._remove_selected, "heli"),
+            "weather.record": self.record_current_weather,
+        }
         self.init_ui()
     
     def init_ui(self):
-        # Tab widget for different sections
-        tabs = QTabWidget()
-        
-        # Personnel tab
-        personnel_tab = self.create_personnel_tab()
-        tabs.addTab(personnel_tab, "Personnel")
-        
-        # POB tab
-        pob_tab = self.create_pob_tab()
-        tabs.addTab(pob_tab, "POB Status")
-        
-        # Transport tab
-        transport_tab = self.create_transport_tab()
-        tabs.addTab(transport_tab, "Transport")
-        
-        # Weather tab
-        weather_tab = self.create_weather_tab()
-        tabs.addTab(weather_tab, "Weather")
+        # Tab widget for different sections; every tab (tables included) is built
+        # on first visit, and the first one only once the widget is shown
+        self.tabs = QTabWidget()
+        self.tabs.addTab(QWidget(), "Personnel")
+        self.tabs.addTab(QWidget(), "POB Status")
+        self.tabs.addTab(QWidget(), "Transport")
+        self.tabs.addTab(QWidget(), "Weather")
+        self._tab_builders = {
+            0: self.create_personnel_tab,
+            1: self.create_pob_tab,
+            2: self.create_transport_tab,
+            3: self.create_weather_tab,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab)
+        
+        # Well selection shared by all tabs, so POB and weather work before the crew list is built
+        well_layout = QHBoxLayout()
+        well_layout.addWidget(QLabel("Well:"))
+        self.well_combo = QComboBox()
+        self.load_wells()
+        self.db.wells_changed.connect(self.load_wells)
+        self.well_combo.currentIndexChanged.connect(self._on_well_changed)
+        well_layout.addWidget(self.well_combo)
+        well_layout.addStretch()
         
         main_layout = QVBoxLayout()
-        main_layout.addWidget(tabs)
+        main_layout.addLayout(well_layout)
+        main_layout.addWidget(self.tabs)
         
         # Save button
         save_button = QPushButton("Save Logistics Data")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #7f8c8d;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #6c7b7d;
-            }
-        """)
+        save_button.setObjectName("saveLogistics")
         main_layout.addWidget(save_button)
         
         self.setLayout(main_layout)
     
+    def load_wells(self):
+        """Load wells into the shared well combo"""
+        fill_well_combo(self.well_combo, self.db)
+    
+    def _on_well_changed(self, _index):
+        """Show the newly selected well's weather history if that tab is built"""
+        if hasattr(self, "weather_history_model"):
+            self.load_weather_history()
+    
+    def _command_button(self, text, command):
+        """Push button whose clicks go to the shared command slot; its object name is the command"""
+        button = QPushButton(text)
+        button.setObjectName(command)
+        button.clicked.connect(self._dispatch_command)
+        return button
+    
+    def _dispatch_command(self, _checked=False):
+        """Run the handler registered for the clicked button's command"""
+        self._commands[self.sender().objectName()]()
+    
+    def _remove_selected(self, name):
+        """Remove the current row of the <name>_table view and its RowTableModel"""
+        table = getattr(self, f"{name}_table")
+        getattr(self, f"{name}_model").remove_row(table.currentIndex().row())
+    
+    def showEvent(self, event):
+        """Build the current tab the first time the widget is shown"""
+        self._ensure_tab(self.tabs.currentIndex())
+        super().showEvent(event)
+    
+    def _ensure_tab(self, index):
+        """Build the tab at index if it is still a placeholder"""
+        build_lazy_tab(self.tabs, self._tab_builders, index)
+    
     def create_personnel_tab(self):
         """Create personnel management tab"""
         tab = QWidget()
         layout = QVBoxLayout()
         
-        # Well selection
-        well_layout = QHBoxLayout()
-        well_layout.addWidget(QLabel("Well:"))
-        
-        self.personnel_well_combo = QComboBox()
-        
+        # Load the crew list of the well selected above the tabs
+        load_layout = QHBoxLayout()
         load_button = QPushButton("Load Personnel")
+        load_button.clicked.connect(self.load_personnel)
+        load_layout.addWidget(load_button)
+        load_layout.addStretch()
         
-        well_layout.addWidget(self.personnel_well_combo)
-        well_layout.addWidget(load_button)
-        well_layout.addStretch()
-        
-        layout.addLayout(well_layout)
+        layout.addLayout(load_layout)
         
         # Personnel table
         table_group = QGroupBox("Crew List")
         table_layout = QVBoxLayout()
         
-        self.personnel_table = QTableWidget()
-        self.personnel_table.setColumnCount(9)
-        self.personnel_table.setHorizontalHeaderLabels([
-            "Company", "Name", "Position", "Arrival Date", 
-            "Departure Date", "POB", "Contact", "Emergency Contact", "Status"
-        ])
+        self.personnel_model = RowTableModel(self.PERSONNEL_HEADERS, self, intern_columns=(0, 2, 5, 8))
+        self.personnel_table = make_table_view(self.personnel_model)
         
         # Table buttons
         table_buttons = QHBoxLayout()
         add_button = QPushButton("Add Person")
         edit_button = QPushButton("Edit Selected")
-        delete_button = QPushButton("Delete Selected")
-        import_button = QPushButton("Import CSV")
-        export_button = QPushButton("Export CSV")
+        delete_button = self._command_button("Delete Selected", "personnel.delete")
+        import_button = self._command_button("Import CSV", "personnel.import")
+        export_button = self._command_button("Export CSV", "personnel.export")
         
         table_buttons.addWidget(add_button)
         table_buttons.addWidget(edit_button)
@@ -4131,6 +5400,53 @@ class PersonnelLogisticsWidget(QWidget):
         tab.setLayout(layout)
         return tab
     
+    def _personnel_rows(self, well_id):
+        """Crew list rows of a well as shown in the personnel table"""
+        return [
+            (
+                person.company, person.name, person.position,
+                person.arrival_date, person.departure_date,
+                "Yes" if person.pob_status else "No",
+                person.contact, person.emergency_contact,
+                "On Board" if person.pob_status else "Off Board",
+            )
+            for person in self.db.get_personnel(well_id)
+        ]
+    
+    def load_personnel(self):
+        """Load the selected well's crew list"""
+        well_id = self.well_combo.currentData()
+        if well_id is None:
+            return
+        replace_view_rows(self.personnel_table, self._personnel_rows(well_id))
+    
+    def import_personnel_csv(self):
+        """Read a crew list CSV in the background and show it in the personnel table"""
+        file_path, _ = QFileDialog.getOpenFileName(self, "Import Personnel", "", "CSV Files (*.csv)")
+        if not file_path:
+            return
+        
+        start_task(
+            read_csv_rows, file_path, len(self.PERSONNEL_HEADERS),
+            on_finished=lambda rows: replace_view_rows(self.personnel_table, rows),
+            on_failed=lambda message: QMessageBox.warning(
+                self, "Import Error", f"Could not import personnel:\n{message}"
+            ),
+        )
+    
+    def export_personnel_csv(self):
+        """Write the personnel table to CSV in the background"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Personnel", "personnel.csv", "CSV Files (*.csv)")
+        if not file_path:
+            return
+        
+        start_task(
+            write_csv_rows, file_path, self.PERSONNEL_HEADERS, self.personnel_model.rows(),
+            on_failed=lambda message: QMessageBox.warning(
+                self, "Export Error", f"Could not export personnel:\n{message}"
+            ),
+        )
+    
     def create_pob_tab(self):
         """Create POB status tab"""
         tab = QWidget()
@@ -4152,6 +5468,7 @@ class PersonnelLogisticsWidget(QWidget):
         controls_layout.addWidget(self.max_capacity_spin, 0, 3)
         
         update_button = QPushButton("Update POB")
+        update_button.clicked.connect(self.update_pob)
         controls_layout.addWidget(update_button, 1, 0, 1, 4)
         
         controls_group.setLayout(controls_layout)
@@ -4161,9 +5478,8 @@ class PersonnelLogisticsWidget(QWidget):
         company_group = QGroupBox("POB by Company")
         company_layout = QVBoxLayout()
         
-        self.company_pob_table = QTableWidget()
-        self.company_pob_table.setColumnCount(3)
-        self.company_pob_table.setHorizontalHeaderLabels(["Company", "On Board", "Total"])
+        self.company_pob_model = RowTableModel(self.COMPANY_POB_HEADERS, self)
+        self.company_pob_table = make_table_view(self.company_pob_model)
         
         company_layout.addWidget(self.company_pob_table)
         company_group.setLayout(company_layout)
@@ -4173,9 +5489,8 @@ class PersonnelLogisticsWidget(QWidget):
         history_group = QGroupBox("POB History (Last 7 Days)")
         history_layout = QVBoxLayout()
         
-        self.pob_history_table = QTableWidget()
-        self.pob_history_table.setColumnCount(3)
-        self.pob_history_table.setHorizontalHeaderLabels(["Date", "POB Count", "Change"])
+        self.pob_history_model = RowTableModel(self.POB_HISTORY_HEADERS, self)
+        self.pob_history_table = make_table_view(self.pob_history_model)
         
         history_layout.addWidget(self.pob_history_table)
         history_group.setLayout(history_layout)
@@ -4184,6 +5499,42 @@ class PersonnelLogisticsWidget(QWidget):
         tab.setLayout(layout)
         return tab
     
+    def update_pob(self):
+        """Recount POB, the per-company split and the last 7 days from the personnel table"""
+        if hasattr(self, "personnel_model"):
+            rows = self.personnel_model.rows()
+        else:
+            # Crew list tab not built yet: count the selected well's saved crew
+            well_id = self.well_combo.currentData()
+            rows = self._personnel_rows(well_id) if well_id is not None else []
+        # CSV imports can leave rows short of the POB column
+        rows = [row for row in rows if len(row) > 5]
+        on_board = [row for row in rows if row[5] == "Yes"]
+        self.current_pob_label.setText(str(len(on_board)))
+        
+        companies = {}
+        for row in rows:
+            counts = companies.setdefault(row[0], [0, 0])
+            counts[0] += row[5] == "Yes"
+            counts[1] += 1
+        self.company_pob_model.set_rows(
+            (company, on, total) for company, (on, total) in sorted(companies.items())
+        )
+        
+        history = []
+        previous = None
+        today = QDate.currentDate()
+        for offset in range(6, -1, -1):
+            day = today.addDays(-offset).toString("yyyy-MM-dd")
+            count = sum(
+                1 for row in rows
+                if row[3] and row[3] <= day and (not row[4] or row[4] >= day)
+            )
+            change = "" if previous is None else f"{count - previous:+d}"
+            history.append((day, count, change))
+            previous = count
+        self.pob_history_model.feed_rows(reversed(history))
+    
     def create_transport_tab(self):
         """Create transport log tab"""
         tab = QWidget()
@@ -4193,15 +5544,12 @@ class PersonnelLogisticsWidget(QWidget):
         boats_group = QGroupBox("Boats Log")
         boats_layout = QVBoxLayout()
         
-        self.boats_table = QTableWidget()
-        self.boats_table.setColumnCount(6)
-        self.boats_table.setHorizontalHeaderLabels([
-            "Boat Name", "Arrival", "Departure", "Status", "Cargo", "Remarks"
-        ])
+        self.boats_model = RowTableModel(self.BOATS_HEADERS, self)
+        self.boats_table = make_table_view(self.boats_model)
         
         boats_buttons = QHBoxLayout()
         add_boat_button = QPushButton("Add Boat")
-        remove_boat_button = QPushButton("Remove Selected")
+        remove_boat_button = self._command_button("Remove Selected", "boats.remove")
         
         boats_buttons.addWidget(add_boat_button)
         boats_buttons.addWidget(remove_boat_button)
@@ -4216,15 +5564,12 @@ class PersonnelLogisticsWidget(QWidget):
         heli_group = QGroupBox("Helicopter Log")
         heli_layout = QVBoxLayout()
         
-        self.heli_table = QTableWidget()
-        self.heli_table.setColumnCount(5)
-        self.heli_table.setHorizontalHeaderLabels([
-            "Flight No", "Arrival", "Departure", "PAX IN", "PAX OUT"
-        ])
+        self.heli_model = RowTableModel(self.HELI_HEADERS, self)
+        self.heli_table = make_table_view(self.heli_model)
         
         heli_buttons = QHBoxLayout()
         add_heli_button = QPushButton("Add Flight")
-        remove_heli_button = QPushButton("Remove Selected")
+        remove_heli_button = self._command_button("Remove Selected", "heli.remove")
         
         heli_buttons.addWidget(add_heli_button)
         heli_buttons.addWidget(remove_heli_button)
@@ -4239,7 +5584,7 @@ class PersonnelLogisticsWidget(QWidget):
         notes_group = QGroupBox("Transport Notes")
         notes_layout = QVBoxLayout()
         
-        self.transport_notes_text = QTextEdit()
+        self.transport_notes_text = QPlainTextEdit()
         self.transport_notes_text.setPlaceholderText("Add transport notes...")
         self.transport_notes_text.setMaximumHeight(80)
         notes_layout.addWidget(self.transport_notes_text)
@@ -4257,50 +5602,24 @@ class PersonnelLogisticsWidget(QWidget):
         
         # Current weather
         current_group = QGroupBox("Current Weather")
-        current_layout = QGridLayout()
-        
-        current_layout.addWidget(QLabel("Wind Speed:"), 0, 0)
-        self.wind_speed_spin = QDoubleSpinBox()
-        self.wind_speed_spin.setRange(0, 200)
-        self.wind_speed_spin.setSuffix(" knots")
-        current_layout.addWidget(self.wind_speed_spin, 0, 1)
+        current_layout = QVBoxLayout()
         
-        current_layout.addWidget(QLabel("Wind Direction:"), 0, 2)
+        self.wind_speed_spin = make_double_spin(0, 200, " knots")
         self.wind_direction_combo = QComboBox()
-        self.wind_direction_combo.addItems([
-            "N", "NE", "E", "SE", "S", "SW", "W", "NW"
-        ])
-        current_layout.addWidget(self.wind_direction_combo, 0, 3)
-        
-        current_layout.addWidget(QLabel("Temperature:"), 1, 0)
-        self.temperature_spin = QDoubleSpinBox()
-        self.temperature_spin.setRange(-50, 60)
-        self.temperature_spin.setSuffix(" °C")
-        self.temperature_spin.setValue(25)
-        current_layout.addWidget(self.temperature_spin, 1, 1)
-        
-        current_layout.addWidget(QLabel("Visibility:"), 1, 2)
-        self.visibility_spin = QDoubleSpinBox()
-        self.visibility_spin.setRange(0, 100)
-        self.visibility_spin.setSuffix(" km")
-        current_layout.addWidget(self.visibility_spin, 1, 3)
-        
-        current_layout.addWidget(QLabel("Sea State:"), 2, 0)
+        self.wind_direction_combo.setModel(shared_combo_model("wind_directions"))
+        self.temperature_spin = make_double_spin(-50, 60, " °C", value=25)
+        self.visibility_spin = make_double_spin(0, 100, " km")
         self.sea_state_combo = QComboBox()
-        self.sea_state_combo.addItems([
-            "Calm", "Smooth", "Slight", "Moderate", 
-            "Rough", "Very Rough", "High", "Very High"
-        ])
-        current_layout.addWidget(self.sea_state_combo, 2, 1)
-        
-        current_layout.addWidget(QLabel("Wave Height:"), 2, 2)
-        self.wave_height_spin = QDoubleSpinBox()
-        self.wave_height_spin.setRange(0, 30)
-        self.wave_height_spin.setSuffix(" m")
-        current_layout.addWidget(self.wave_height_spin, 2, 3)
+        self.sea_state_combo.setModel(shared_combo_model("sea_states"))
+        self.wave_height_spin = make_double_spin(0, 30, " m")
+        current_layout.addLayout(make_form_columns([
+            ("Wind Speed:", self.wind_speed_spin), ("Wind Direction:", self.wind_direction_combo),
+            ("Temperature:", self.temperature_spin), ("Visibility:", self.visibility_spin),
+            ("Sea State:", self.sea_state_combo), ("Wave Height:", self.wave_height_spin),
+        ]))
         
-        record_button = QPushButton("Record Current Weather")
-        current_layout.addWidget(record_button, 3, 0, 1, 4)
+        record_button = self._command_button("Record Current Weather", "weather.record")
+        current_layout.addWidget(record_button)
         
         current_group.setLayout(current_layout)
         layout.addWidget(current_group)
@@ -4309,11 +5628,12 @@ class PersonnelLogisticsWidget(QWidget):
         history_group = QGroupBox("Weather History (Last 24 Hours)")
         history_layout = QVBoxLayout()
         
-        self.weather_history_table = QTableWidget()
-        self.weather_history_table.setColumnCount(6)
-        self.weather_history_table.setHorizontalHeaderLabels([
-            "Time", "Wind Speed", "Direction", "Temp", "Visibility", "Sea State"
-        ])
+        self.weather_history_model = RowTableModel(self.WEATHER_HISTORY_HEADERS, self)
+        self.weather_history_table = make_table_view(self.weather_history_model)
+        self.load_weather_history()
+        self.weather_history_table.doubleClicked.connect(
+            lambda index: self.load_weather(self.weather_history_model.row(index.row()))
+        )
         
         history_layout.addWidget(self.weather_history_table)
         history_group.setLayout(history_layout)
@@ -4323,7 +5643,7 @@ class PersonnelLogisticsWidget(QWidget):
         forecast_group = QGroupBox("Weather Forecast")
         forecast_layout = QVBoxLayout()
         
-        self.forecast_text = QTextEdit()
+        self.forecast_text = QPlainTextEdit()
         self.forecast_text.setPlaceholderText("Enter weather forecast information...")
         self.forecast_text.setMaximumHeight(100)
         forecast_layout.addWidget(self.forecast_text)
@@ -4333,6 +5653,54 @@ class PersonnelLogisticsWidget(QWidget):
         
         tab.setLayout(layout)
         return tab
+    
+    def load_weather_history(self):
+        """Show the selected well's weather observations of the last 24 hours"""
+        well_id = self.well_combo.currentData()
+        self.weather_history_model.set_rows(
+            self.db.get_weather_history(well_id) if well_id is not None else []
+        )
+    
+    def record_current_weather(self):
+        """Save the current weather inputs for the selected well and refresh the history"""
+        well_id = self.well_combo.currentData()
+        if well_id is None:
+            QMessageBox.warning(self, "Error", "Please select a well.")
+            return
+        
+        weather = WeatherData(
+            wind_speed=self.wind_speed_spin.value(),
+            wind_direction=self.wind_direction_combo.currentText(),
+            temperature=self.temperature_spin.value(),
+            visibility=self.visibility_spin.value(),
+            sea_state=self.sea_state_combo.currentText(),
+            wave_height=self.wave_height_spin.value(),
+        )
+        if self.db.save_weather_record(well_id, weather) < 0:
+            QMessageBox.warning(
+                self, "Error",
+                "Failed to record weather. Save a daily report for this well first."
+            )
+            return
+        self.load_weather_history()
+    
+    def load_weather(self, record):
+        """Load a weather history row into the current weather inputs"""
+        _, wind_speed, wind_direction, temperature, visibility, sea_state = record
+        # Hold change signals so the form is filled without per-field cascades
+        blockers = [QSignalBlocker(widget) for widget in (
+            self.wind_speed_spin, self.wind_direction_combo, self.temperature_spin,
+            self.visibility_spin, self.sea_state_combo,
+        )]
+        try:
+            self.wind_speed_spin.setValue(wind_speed or 0)
+            self.wind_direction_combo.setCurrentText(wind_direction or "")
+            self.temperature_spin.setValue(temperature or 0)
+            self.visibility_spin.setValue(visibility or 0)
+            self.sea_state_combo.setCurrentText(sea_state or "")
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
 
 # ============================================
 # MAIN APPLICATION WINDOW
@@ -4340,326 +5708,243 @@ class PersonnelLogisticsWidget(QWidget):
 
 class MainWindow(QMainWindow):
     """Main application window with ribbon interface"""
-    def __init__(self, user):
+    # Ribbon layout: (tab label, ((group title, ((button, handler, tooltip), ...)), ...)).
+    # A handler is a MainWindow method name, or the index of the module tab to show.
+    RIBBON_SPEC = (
+        ("🏠 Home", (
+            ("Well", (
+                ("New Well", "new_well", "Create new well"),
+                ("Open Well", "open_well", "Open existing well"),
+                ("Save Well", "save_well", "Save current well"),
+            )),
+            ("Reports", (
+                ("Daily Report", 1, "Open daily report"),
+                ("Drilling Params", 2, "Open drilling parameters"),
+                ("Mud Report", 3, "Open mud report"),
+            )),
+            ("Export", (
+                ("Export PDF", "export_pdf", "Export to PDF"),
+                ("Export Excel", "export_excel", "Export to Excel"),
+            )),
+            ("User", (
+                ("Preferences", "show_preferences", "User preferences"),
+                ("Logout", "logout", "Logout from system"),
+            )),
+        )),
+        ("🗓 Daily Ops", (
+            ("Time Log", (
+                ("Add Entry", "add_time_entry", "Add time log entry"),
+                ("Edit Entry", "edit_time_entry", "Edit time log entry"),
+                ("NPT Report", "show_npt_report", "Non-productive time report"),
+            )),
+            ("Planning", (
+                ("7-Day Lookahead", "show_lookahead", "7 days lookahead plan"),
+                ("Activity Codes", "show_codes", "Activity code management"),
+            )),
+            ("Analysis", (
+                ("Time Analysis", "time_analysis", "Time breakdown analysis"),
+                ("Productivity", "productivity", "Productivity analysis"),
+            )),
+        )),
+        ("⚙️ Drilling", (
+            ("Drilling", (
+                ("Parameters", 2, "Drilling parameters"),
+                ("Mud Report", 3, "Mud properties and volumes"),
+                ("Bit Record", 4, "Bit records and reports"),
+            )),
+            ("Equipment", (
+                ("BHA Report", 5, "Bottom hole assembly"),
+                ("Downhole Eq", "show_downhole", "Downhole equipment"),
+                ("Drill Pipe", "show_drill_pipe", "Drill pipe specifications"),
+            )),
+            ("Cementing", (
+                ("Cement Data", "show_cement", "Cement and additives"),
+                ("Casing Data", "show_casing", "Casing specifications"),
+            )),
+            ("Solid Control", (
+                ("Equipment", "show_solid_control", "Solid control equipment"),
+                ("Performance", "solid_performance", "Solid control performance"),
+            )),
+        )),
+        ("📈 Data & Eval", (
+            ("Survey", (
+                ("Survey Data", 6, "Well survey data"),
+                ("Formation Tops", "show_formations", "Formation tops"),
+                ("Trajectory", "show_trajectory", "Well trajectory"),
+            )),
+            ("Evaluation", (
+                ("ROP Analysis", "rop_analysis", "Rate of penetration analysis"),
+                ("Formation Eval", "formation_eval", "Formation evaluation"),
+            )),
+            ("Charts", (
+                ("Drilling Chart", "drilling_chart", "Drilling parameters chart"),
+                ("Survey Chart", "survey_chart", "Survey visualization"),
+                ("Mud Chart", "mud_chart", "Mud properties chart"),
+            )),
+        )),
+        ("🧰 Logistics", (
+            ("Personnel", (
+                ("Crew List", 7, "Personnel management"),
+                ("POB Status", "show_pob", "Person on board status"),
+            )),
+            ("Inventory", (
+                ("Inventory", "show_inventory", "Inventory management"),
+                ("Material Request", "show_material", "Material handling"),
+            )),
+            ("Services", (
+                ("Service Cos", "show_services", "Service company log"),
+                ("Boats/Chopper", "show_transport", "Transport log"),
+            )),
+            ("Weather", (
+                ("Weather Data", "show_weather", "Weather conditions"),
+                ("Forecast", "show_forecast", "Weather forecast"),
+            )),
+        )),
+        ("🦺 Safety", (
+            ("Safety", (
+                ("Safety & BOP", "show_safety", "Safety and BOP records"),
+                ("Drills", "show_drills", "Safety drills"),
+            )),
+            ("Environment", (
+                ("Waste Mgmt", "show_waste", "Waste management"),
+                ("Spill Report", "spill_report", "Spill reporting"),
+            )),
+            ("Compliance", (
+                ("Inspections", "show_inspections", "Safety inspections"),
+                ("Incidents", "show_incidents", "Incident reporting"),
+            )),
+        )),
+        ("📤 Reports", (
+            ("Generation", (
+                ("Daily Report", "generate_daily", "Generate daily report"),
+                ("Weekly Report", "generate_weekly", "Generate weekly report"),
+                ("EOW Report", "generate_eow", "End of well report"),
+            )),
+            ("Export", (
+                ("PDF", "export_pdf", "Export to PDF"),
+                ("Excel", "export_excel", "Export to Excel"),
+                ("CSV", "export_csv", "Export to CSV"),
+            )),
+            ("Templates", (
+                ("Save Template", "save_template", "Save report template"),
+                ("Load Template", "load_template", "Load report template"),
+            )),
+            ("KPIs", (
+                ("NPT Analysis", "npt_analysis", "NPT analysis report"),
+                ("Cost Analysis", "cost_analysis", "Cost analysis report"),
+            )),
+        )),
+    )
+    
+    def __init__(self, user, db_manager=None):
         super().__init__()
         self.user = user
-        self.db = DatabaseManager()
+        # Share the login's manager so the schema check and read cache are not repeated
+        self.db = db_manager if db_manager is not None else DatabaseManager()
         self.current_well_id = -1
-        self.init_ui()
-    
-    def init_ui(self):
-        # Window settings
-        self.setWindowTitle(f"Nikan Drill Master - Logged in as: {self.user.full_name}")
-        self.setGeometry(100, 100, 1400, 900)
-        
-        # Create central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        # Main layout
-        main_layout = QVStackLayout()
         
-        # Create ribbon
-        self.create_ribbon()
-        main_layout.addWidget(self.ribbon_widget)
+        # Status messages are debounced so bursts of ribbon clicks repaint once
+        self._pending_status = ""
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(lambda: self.status_bar.showMessage(self._pending_status))
         
-        # Create tab widget for modules
-        self.tab_widget = QTabWidget()
-        self.tab_widget.setTabPosition(QTabWidget.TabPosition.North)
-        self.tab_widget.setMovable(True)
-        
-        # Initialize modules
-        self.init_modules()
-        
-        main_layout.addWidget(self.tab_widget)
-        central_widget.setLayout(main_layout)
-        
-        # Create status bar
-        self.status_bar = QStatusBar()
-        self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage(f"Ready - User: {self.user.role.capitalize()}")
-        
-        # Initialize with Well Info tab
-        self.tab_widget.setCurrentIndex(0)
-    
-    def create_ribbon(self):
-        """Create ribbon interface"""
-        self.ribbon_widget = QWidget()
-        ribbon_layout = QVBoxLayout()
-        
-        # Ribbon tabs
-        self.ribbon_tabs = QTabWidget()
-        self.ribbon_tabs.setTabPosition(QTabWidget.TabPosition.North)
-        self.ribbon_tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                background-color: #f8f9fa;
-            }
-            QTabBar::tab {
-                padding: 8px 16px;
-                background-color: #e9ecef;
-                border: 1px solid #dee2e6;
-                border-bottom: none;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #f8f9fa;
-                border-bottom: 2px solid #007bff;
-            }
-            QTabBar::tab:hover {
-                background-color: #dee2e6;
-            }
-        """)
-        
-        # Home tab
-        home_tab = self.create_ribbon_home_tab()
-        self.ribbon_tabs.addTab(home_tab, "🏠 Home")
-        
-        # Daily Operations tab
-        daily_tab = self.create_ribbon_daily_tab()
-        self.ribbon_tabs.addTab(daily_tab, "🗓 Daily Ops")
-        
-        # Drilling tab
-        drilling_tab = self.create_ribbon_drilling_tab()
-        self.ribbon_tabs.addTab(drilling_tab, "⚙️ Drilling")
-        
-        # Data & Evaluation tab
-        data_tab = self.create_ribbon_data_tab()
-        self.ribbon_tabs.addTab(data_tab, "📈 Data & Eval")
-        
-        # Logistics tab
-        logistics_tab = self.create_ribbon_logistics_tab()
-        self.ribbon_tabs.addTab(logistics_tab, "🧰 Logistics")
-        
-        # Safety tab
-        safety_tab = self.create_ribbon_safety_tab()
-        self.ribbon_tabs.addTab(safety_tab, "🦺 Safety")
-        
-        # Reports tab
-        reports_tab = self.create_ribbon_reports_tab()
-        self.ribbon_tabs.addTab(reports_tab, "📤 Reports")
-        
-        ribbon_layout.addWidget(self.ribbon_tabs)
-        self.ribbon_widget.setLayout(ribbon_layout)
-    
-    def create_ribbon_home_tab(self):
-        """Create Home ribbon tab"""
-        tab = QWidget()
-        layout = QHBoxLayout()
-        
-        # Well group
-        well_group = RibbonGroup("Well")
-        well_group.add_button("New Well", None, self.new_well, "Create new well")
-        well_group.add_button("Open Well", None, self.open_well, "Open existing well")
-        well_group.add_button("Save Well", None, self.save_well, "Save current well")
-        layout.addWidget(well_group)
-        
-        # Reports group
-        reports_group = RibbonGroup("Reports")
-        reports_group.add_button("Daily Report", None, lambda: self.show_module(1), "Open daily report")
-        reports_group.add_button("Drilling Params", None, lambda: self.show_module(2), "Open drilling parameters")
-        reports_group.add_button("Mud Report", None, lambda: self.show_module(3), "Open mud report")
-        layout.addWidget(reports_group)
-        
-        # Export group
-        export_group = RibbonGroup("Export")
-        export_group.add_button("Export PDF", None, self.export_pdf, "Export to PDF")
-        export_group.add_button("Export Excel", None, self.export_excel, "Export to Excel")
-        layout.addWidget(export_group)
-        
-        # User group
-        user_group = RibbonGroup("User")
-        user_group.add_button("Preferences", None, self.show_preferences, "User preferences")
-        user_group.add_button("Logout", None, self.logout, "Logout from system")
-        layout.addWidget(user_group)
-        
-        layout.addStretch()
-        tab.setLayout(layout)
-        return tab
-    
-    def create_ribbon_daily_tab(self):
-        """Create Daily Operations ribbon tab"""
-        tab = QWidget()
-        layout = QHBoxLayout()
-        
-        # Time Log group
-        time_group = RibbonGroup("Time Log")
-        time_group.add_button("Add Entry", None, self.add_time_entry, "Add time log entry")
-        time_group.add_button("Edit Entry", None, self.edit_time_entry, "Edit time log entry")
-        time_group.add_button("NPT Report", None, self.show_npt_report, "Non-productive time report")
-        layout.addWidget(time_group)
-        
-        # Planning group
-        plan_group = RibbonGroup("Planning")
-        plan_group.add_button("7-Day Lookahead", None, self.show_lookahead, "7 days lookahead plan")
-        plan_group.add_button("Activity Codes", None, self.show_codes, "Activity code management")
-        layout.addWidget(plan_group)
-        
-        # Analysis group
-        analysis_group = RibbonGroup("Analysis")
-        analysis_group.add_button("Time Analysis", None, self.time_analysis, "Time breakdown analysis")
-        analysis_group.add_button("Productivity", None, self.productivity, "Productivity analysis")
-        layout.addWidget(analysis_group)
-        
-        layout.addStretch()
-        tab.setLayout(layout)
-        return tab
-    
-    def create_ribbon_drilling_tab(self):
-        """Create Drilling ribbon tab"""
-        tab = QWidget()
-        layout = QHBoxLayout()
+        # Message boxes are built once per kind and reused
+        self._message_boxes = {}
         
-        # Drilling group
-        drilling_group = RibbonGroup("Drilling")
-        drilling_group.add_button("Parameters", None, lambda: self.show_module(2), "Drilling parameters")
-        drilling_group.add_button("Mud Report", None, lambda: self.show_module(3), "Mud properties and volumes")
-        drilling_group.add_button("Bit Record", None, lambda: self.show_module(4), "Bit records and reports")
-        layout.addWidget(drilling_group)
-        
-        # Equipment group
-        equipment_group = RibbonGroup("Equipment")
-        equipment_group.add_button("BHA Report", None, lambda: self.show_module(5), "Bottom hole assembly")
-        equipment_group.add_button("Downhole Eq", None, self.show_downhole, "Downhole equipment")
-        equipment_group.add_button("Drill Pipe", None, self.show_drill_pipe, "Drill pipe specifications")
-        layout.addWidget(equipment_group)
-        
-        # Cementing group
-        cement_group = RibbonGroup("Cementing")
-        cement_group.add_button("Cement Data", None, self.show_cement, "Cement and additives")
-        cement_group.add_button("Casing Data", None, self.show_casing, "Casing specifications")
-        layout.addWidget(cement_group)
-        
-        # Solid Control group
-        solid_group = RibbonGroup("Solid Control")
-        solid_group.add_button("Equipment", None, self.show_solid_control, "Solid control equipment")
-        solid_group.add_button("Performance", None, self.solid_performance, "Solid control performance")
-        layout.addWidget(solid_group)
+        self.init_ui()
         
-        layout.addStretch()
-        tab.setLayout(layout)
-        return tab
+        # Compile the analysis kernels in the background before they are needed
+        start_task(warm_up_kernels)
     
-    def create_ribbon_data_tab(self):
-        """Create Data & Evaluation ribbon tab"""
-        tab = QWidget()
-        layout = QHBoxLayout()
+    def show_status(self, message):
+        """Show message in the status bar once the current burst settles"""
+        self._pending_status = message
+        self._status_timer.start()
+    
+    def init_ui(self):
+        # Window settings
+        self.setWindowTitle(f"Nikan Drill Master - Logged in as: {self.user.full_name}")
+        self.setGeometry(100, 100, 1400, 900)
         
-        # Survey group
-        survey_group = RibbonGroup("Survey")
-        survey_group.add_button("Survey Data", None, lambda: self.show_module(6), "Well survey data")
-        survey_group.add_button("Formation Tops", None, self.show_formations, "Formation tops")
-        survey_group.add_button("Trajectory", None, self.show_trajectory, "Well trajectory")
-        layout.addWidget(survey_group)
-        
-        # Evaluation group
-        eval_group = RibbonGroup("Evaluation")
-        eval_group.add_button("ROP Analysis", None, self.rop_analysis, "Rate of penetration analysis")
-        eval_group.add_button("Formation Eval", None, self.formation_eval, "Formation evaluation")
-        layout.addWidget(eval_group)
-        
-        # Charts group
-        charts_group = RibbonGroup("Charts")
-        charts_group.add_button("Drilling Chart", None, self.drilling_chart, "Drilling parameters chart")
-        charts_group.add_button("Survey Chart", None, self.survey_chart, "Survey visualization")
-        charts_group.add_button("Mud Chart", None, self.mud_chart, "Mud properties chart")
-        layout.addWidget(charts_group)
+        # Hold repaints while the ribbon and module tabs are assembled
+        self.setUpdatesEnabled(False)
         
-        layout.addStretch()
-        tab.setLayout(layout)
-        return tab
-    
-    def create_ribbon_logistics_tab(self):
-        """Create Logistics ribbon tab"""
-        tab = QWidget()
-        layout = QHBoxLayout()
+        # Create central widget; the layout is installed before children are added
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
         
-        # Personnel group
-        personnel_group = RibbonGroup("Personnel")
-        personnel_group.add_button("Crew List", None, lambda: self.show_module(7), "Personnel management")
-        personnel_group.add_button("POB Status", None, self.show_pob, "Person on board status")
-        layout.addWidget(personnel_group)
+        # Main layout
+        main_layout = QVBoxLayout()
+        central_widget.setLayout(main_layout)
         
-        # Inventory group
-        inventory_group = RibbonGroup("Inventory")
-        inventory_group.add_button("Inventory", None, self.show_inventory, "Inventory management")
-        inventory_group.add_button("Material Request", None, self.show_material, "Material handling")
-        layout.addWidget(inventory_group)
+        # Create ribbon
+        self.create_ribbon()
+        main_layout.addWidget(self.ribbon_widget)
+        
+        # Create tab widget for modules
+        self.tab_widget = QTabWidget()
+        self.tab_widget.setTabPosition(QTabWidget.TabPosition.North)
+        self.tab_widget.setMovable(True)
+        # Module widgets are built the first time their tab is selected; builders
+        # are keyed by placeholder since movable tabs change indices
+        self._module_builders = {}
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         
-        # Services group
-        services_group = RibbonGroup("Services")
-        services_group.add_button("Service Cos", None, self.show_services, "Service company log")
-        services_group.add_button("Boats/Chopper", None, self.show_transport, "Transport log")
-        layout.addWidget(services_group)
+        # Initialize modules
+        self.init_modules()
         
-        # Weather group
-        weather_group = RibbonGroup("Weather")
-        weather_group.add_button("Weather Data", None, self.show_weather, "Weather conditions")
-        weather_group.add_button("Forecast", None, self.show_forecast, "Weather forecast")
-        layout.addWidget(weather_group)
+        main_layout.addWidget(self.tab_widget)
         
-        layout.addStretch()
-        tab.setLayout(layout)
-        return tab
-    
-    def create_ribbon_safety_tab(self):
-        """Create Safety ribbon tab"""
-        tab = QWidget()
-        layout = QHBoxLayout()
+        # Create status bar
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        self.status_bar.showMessage(f"Ready - User: {self.user.role.capitalize()}")
         
-        # Safety group
-        safety_group = RibbonGroup("Safety")
-        safety_group.add_button("Safety & BOP", None, self.show_safety, "Safety and BOP records")
-        safety_group.add_button("Drills", None, self.show_drills, "Safety drills")
-        layout.addWidget(safety_group)
+        # Initialize with Well Info tab
+        self.tab_widget.setCurrentIndex(0)
         
-        # Environment group
-        env_group = RibbonGroup("Environment")
-        env_group.add_button("Waste Mgmt", None, self.show_waste, "Waste management")
-        env_group.add_button("Spill Report", None, self.spill_report, "Spill reporting")
-        layout.addWidget(env_group)
+        self.setUpdatesEnabled(True)
+    
+    def create_ribbon(self):
+        """Create ribbon interface"""
+        self.ribbon_widget = QWidget()
+        ribbon_layout = QVBoxLayout()
         
-        # Compliance group
-        compliance_group = RibbonGroup("Compliance")
-        compliance_group.add_button("Inspections", None, self.show_inspections, "Safety inspections")
-        compliance_group.add_button("Incidents", None, self.show_incidents, "Incident reporting")
-        layout.addWidget(compliance_group)
+        # Ribbon tabs
+        self.ribbon_tabs = QTabWidget()
+        self.ribbon_tabs.setTabPosition(QTabWidget.TabPosition.North)
+        self.ribbon_tabs.setObjectName("ribbonTabs")
+        
+        # Home is built now; the other ribbon tabs when first selected
+        home_label, home_groups = self.RIBBON_SPEC[0]
+        add_icon_tab(self.ribbon_tabs, self.build_ribbon_tab(home_groups), home_label)
+        self._ribbon_builders = {}
+        for label, groups in self.RIBBON_SPEC[1:]:
+            index = add_icon_tab(self.ribbon_tabs, QWidget(), label)
+            self._ribbon_builders[index] = lambda groups=groups: self.build_ribbon_tab(groups)
+        self.ribbon_tabs.currentChanged.connect(
+            lambda index: build_lazy_tab(self.ribbon_tabs, self._ribbon_builders, index)
+        )
         
-        layout.addStretch()
-        tab.setLayout(layout)
-        return tab
+        ribbon_layout.addWidget(self.ribbon_tabs)
+        self.ribbon_widget.setLayout(ribbon_layout)
     
-    def create_ribbon_reports_tab(self):
-        """Create Reports ribbon tab"""
+    def build_ribbon_tab(self, groups):
+        """Build one ribbon tab from its RIBBON_SPEC groups"""
         tab = QWidget()
         layout = QHBoxLayout()
         
-        # Generation group
-        gen_group = RibbonGroup("Generation")
-        gen_group.add_button("Daily Report", None, self.generate_daily, "Generate daily report")
-        gen_group.add_button("Weekly Report", None, self.generate_weekly, "Generate weekly report")
-        gen_group.add_button("EOW Report", None, self.generate_eow, "End of well report")
-        layout.addWidget(gen_group)
-        
-        # Export group
-        export_group = RibbonGroup("Export")
-        export_group.add_button("PDF", None, self.export_pdf, "Export to PDF")
-        export_group.add_button("Excel", None, self.export_excel, "Export to Excel")
-        export_group.add_button("CSV", None, self.export_csv, "Export to CSV")
-        layout.addWidget(export_group)
-        
-        # Templates group
-        template_group = RibbonGroup("Templates")
-        template_group.add_button("Save Template", None, self.save_template, "Save report template")
-        template_group.add_button("Load Template", None, self.load_template, "Load report template")
-        layout.addWidget(template_group)
-        
-        # KPI group
-        kpi_group = RibbonGroup("KPIs")
-        kpi_group.add_button("NPT Analysis", None, self.npt_analysis, "NPT analysis report")
-        kpi_group.add_button("Cost Analysis", None, self.cost_analysis, "Cost analysis report")
-        layout.addWidget(kpi_group)
+        for title, buttons in groups:
+            group = RibbonGroup(title)
+            for text, handler, tooltip in buttons:
+                if isinstance(handler, int):
+                    callback = lambda checked=False, index=handler: self.show_module(index)
+                else:
+                    callback = getattr(self, handler)
+                group.add_button(text, None, callback, tooltip)
+            layout.addWidget(group)
         
         layout.addStretch()
         tab.setLayout(layout)
@@ -4667,41 +5952,39 @@ class MainWindow(QMainWindow):
     
     def init_modules(self):
         """Initialize all application modules"""
-        # Well Information
+        # Well Information is the start tab and the ribbon's well actions use it
         self.well_info_widget = WellInfoWidget(self.db)
-        self.tab_widget.addTab(self.well_info_widget, "🏠 Well Info")
-        
-        # Daily Report
-        self.daily_report_widget = DailyReportWidget(self.db)
-        self.tab_widget.addTab(self.daily_report_widget, "🗓 Daily Report")
-        
-        # Drilling Parameters
-        self.drilling_params_widget = DrillingParametersWidget(self.db)
-        self.tab_widget.addTab(self.drilling_params_widget, "⚙️ Drilling Params")
-        
-        # Mud Report
-        self.mud_report_widget = MudReportWidget(self.db)
-        self.tab_widget.addTab(self.mud_report_widget, "🧪 Mud Report")
+        add_icon_tab(self.tab_widget, self.well_info_widget, "🏠 Well Info")
         
-        # Bit Report
-        self.bit_report_widget = BitReportWidget(self.db)
-        self.tab_widget.addTab(self.bit_report_widget, "🔩 Bit Report")
-        
-        # BHA Report
-        self.bha_report_widget = BHAReportWidget(self.db)
-        self.tab_widget.addTab(self.bha_report_widget, "🛠️ BHA Report")
-        
-        # Survey Data
-        self.survey_widget = SurveyDataWidget(self.db)
-        self.tab_widget.addTab(self.survey_widget, "📈 Survey Data")
-        
-        # Personnel & Logistics
-        self.personnel_widget = PersonnelLogisticsWidget(self.db)
-        self.tab_widget.addTab(self.personnel_widget, "👥 Personnel & Logistics")
+        self.add_module_tab("🗓 Daily Report", DailyReportWidget, "daily_report_widget")
+        self.add_module_tab("⚙️ Drilling Params", DrillingParametersWidget, "drilling_params_widget")
+        self.add_module_tab("🧪 Mud Report", MudReportWidget, "mud_report_widget")
+        self.add_module_tab("🔩 Bit Report", BitReportWidget, "bit_report_widget")
+        self.add_module_tab("🛠️ BHA Report", BHAReportWidget, "bha_report_widget")
+        self.add_module_tab("📈 Survey Data", SurveyDataWidget, "survey_widget")
+        self.add_module_tab("👥 Personnel & Logistics", PersonnelLogisticsWidget, "personnel_widget")
         
         # Add placeholders for other modules
         self.add_placeholder_tabs()
     
+    def add_module_tab(self, title, widget_class, attr_name=None):
+        """Add a tab whose widget_class(self.db) is only built when first selected"""
+        def build():
+            widget = widget_class(self.db)
+            if attr_name:
+                setattr(self, attr_name, widget)
+            return widget
+        
+        placeholder = QWidget()
+        self._module_builders[placeholder] = build
+        return add_icon_tab(self.tab_widget, placeholder, title)
+    
+    def _materialize_tab(self, index):
+        """Replace the placeholder at index with its module widget"""
+        builder = self._module_builders.pop(self.tab_widget.widget(index), None)
+        if builder is not None:
+            build_lazy_tab(self.tab_widget, {index: builder}, index)
+    
     def add_placeholder_tabs(self):
         """Add placeholder tabs for remaining modules"""
         modules = [
@@ -4720,16 +6003,7 @@ class MainWindow(QMainWindow):
         ]
         
         for title, description in modules:
-            placeholder = QWidget()
-            layout = QVBoxLayout()
-            
-            label = QLabel(f"{title}\n\n{description}\n\n(This module will be implemented in the next phase)")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setStyleSheet("font-size: 16px; color: #7f8c8d;")
-            
-            layout.addWidget(label)
-            placeholder.setLayout(layout)
-            self.tab_widget.addTab(placeholder, title)
+            self.add_module_tab(title, lambda db, t=title, d=description: make_placeholder_page(t, d))
     
     def show_module(self, index):
         """Show specific module by index"""
@@ -4749,79 +6023,164 @@ class MainWindow(QMainWindow):
         """Save current well"""
         self.well_info_widget.save_well_info()
     
+    def _message_box(self, icon, buttons, title, text):
+        """Show the pooled message box for (icon, buttons) and return the clicked button"""
+        box = self._message_boxes.get((icon, buttons))
+        if box is None:
+            box = QMessageBox(icon, title, text, buttons, self)
+            self._message_boxes[(icon, buttons)] = box
+        else:
+            box.setWindowTitle(title)
+            box.setText(text)
+        box.exec()
+        return box.standardButton(box.clickedButton())
+    
+    def _info(self, title, text):
+        self._message_box(QMessageBox.Icon.Information, QMessageBox.StandardButton.Ok, title, text)
+    
+    DAILY_PDF_HEADERS = ("Well", "Date", "Rig Day", "Depth 00:00", "Depth 24:00", "Progress", "Summary")
+    
     def export_pdf(self):
-        """Export to PDF"""
-        # TODO: Implement PDF export
-        QMessageBox.information(self, "Export", "PDF export will be implemented.")
+        """Export the daily report summary to PDF"""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export PDF", "daily_reports.pdf", "PDF Files (*.pdf)")
+        if not file_path:
+            return
+        
+        # Rows are fetched and painted a batch at a time on the thread pool
+        self.show_status("Exporting PDF...")
+        start_task(
+            write_table_pdf, file_path, "Daily Reports", self.DAILY_PDF_HEADERS,
+            self.db.iter_daily_report_rows(self.current_well_id), (3, 2, 1, 2, 2, 2, 8),
+            on_finished=lambda _: self.show_status(f"Exported {file_path}"),
+            on_failed=lambda message: self._info("Export", f"PDF export failed:\n{message}"),
+        )
     
     def export_excel(self):
         """Export to Excel"""
         # TODO: Implement Excel export
-        QMessageBox.information(self, "Export", "Excel export will be implemented.")
+        self._info("Export", "Excel export will be implemented.")
     
     def show_preferences(self):
         """Show preferences dialog"""
         # TODO: Implement preferences
-        QMessageBox.information(self, "Preferences", "Preferences will be implemented.")
+        self._info("Preferences", "Preferences will be implemented.")
+    
+    def rop_analysis(self):
+        """Average ROP per 100 m interval from daily footage and drilling time"""
+        self.show_status("Running ROP analysis...")
+        start_task(
+            self._rop_summary, self.current_well_id,
+            on_finished=lambda text: self._info("ROP Analysis", text),
+            on_failed=lambda message: self._info("ROP Analysis", f"Analysis failed:\n{message}"),
+        )
+    
+    def _rop_summary(self, well_id):
+        rows = self.db.get_drilling_progress(well_id)
+        data = np.array([row for row in rows if row[2] > 0], dtype=np.float64).reshape(-1, 3)
+        if not len(data):
+            return "No drilling time logged yet."
+        tops, rop = rop_depth_bins(data[:, 1], data[:, 1] - data[:, 0], data[:, 2] / 60.0, 100.0)
+        lines = [
+            f"{top:,.0f} - {top + 100:,.0f} m: {value:.1f} m/h"
+            for top, value in zip(tops, rop) if value > 0
+        ]
+        if not lines:
+            return "No footage drilled in the logged drilling time."
+        return "\n".join(lines)
+    
+    def npt_analysis(self):
+        """NPT events and hours per main code"""
+        self.show_status("Running NPT analysis...")
+        start_task(
+            self._npt_summary, self.current_well_id,
+            on_finished=lambda text: self._info("NPT Analysis", text),
+            on_failed=lambda message: self._info("NPT Analysis", f"Analysis failed:\n{message}"),
+        )
+    
+    def _npt_summary(self, well_id):
+        rows = self.db.get_npt_durations(well_id)
+        if not rows:
+            return "No NPT recorded."
+        codes = {}
+        code_ids = np.array([codes.setdefault(row[0] or "Other", len(codes)) for row in rows], dtype=np.int64)
+        minutes = np.array([row[1] or 0 for row in rows], dtype=np.float64)
+        counts, totals = npt_breakdown(code_ids, minutes, len(codes))
+        return "\n".join(
+            f"{code}: {counts[i]} events, {totals[i] / 60.0:.1f} h"
+            for code, i in sorted(codes.items(), key=lambda item: -totals[item[1]])
+        )
     
     def logout(self):
         """Logout from application"""
-        reply = QMessageBox.question(
-            self, "Logout",
-            "Are you sure you want to logout?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        reply = self._message_box(
+            QMessageBox.Icon.Question,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            "Logout", "Are you sure you want to logout?"
         )
         
         if reply == QMessageBox.StandardButton.Yes:
             self.close()
-    
-    # Ribbon button handlers (placeholders)
-    def add_time_entry(self): self.status_bar.showMessage("Add time entry - To be implemented")
-    def edit_time_entry(self): self.status_bar.showMessage("Edit time entry - To be implemented")
-    def show_npt_report(self): self.status_bar.showMessage("NPT report - To be implemented")
-    def show_lookahead(self): self.status_bar.showMessage("7-day lookahead - To be implemented")
-    def show_codes(self): self.status_bar.showMessage("Activity codes - To be implemented")
-    def time_analysis(self): self.status_bar.showMessage("Time analysis - To be implemented")
-    def productivity(self): self.status_bar.showMessage("Productivity analysis - To be implemented")
-    def show_downhole(self): self.status_bar.showMessage("Downhole equipment - To be implemented")
-    def show_drill_pipe(self): self.status_bar.showMessage("Drill pipe specs - To be implemented")
-    def show_cement(self): self.status_bar.showMessage("Cement data - To be implemented")
-    def show_casing(self): self.status_bar.showMessage("Casing data - To be implemented")
-    def show_solid_control(self): self.status_bar.showMessage("Solid control - To be implemented")
-    def solid_performance(self): self.status_bar.showMessage("Solid performance - To be implemented")
-    def show_formations(self): self.status_bar.showMessage("Formations - To be implemented")
-    def show_trajectory(self): self.status_bar.showMessage("Trajectory - To be implemented")
-    def rop_analysis(self): self.status_bar.showMessage("ROP analysis - To be implemented")
-    def formation_eval(self): self.status_bar.showMessage("Formation eval - To be implemented")
-    def drilling_chart(self): self.status_bar.showMessage("Drilling chart - To be implemented")
-    def survey_chart(self): self.status_bar.showMessage("Survey chart - To be implemented")
-    def mud_chart(self): self.status_bar.showMessage("Mud chart - To be implemented")
-    def show_pob(self): self.status_bar.showMessage("POB status - To be implemented")
-    def show_inventory(self): self.status_bar.showMessage("Inventory - To be implemented")
-    def show_material(self): self.status_bar.showMessage("Material handling - To be implemented")
-    def show_services(self): self.status_bar.showMessage("Service companies - To be implemented")
-    def show_transport(self): self.status_bar.showMessage("Transport log - To be implemented")
-    def show_weather(self): self.status_bar.showMessage("Weather data - To be implemented")
-    def show_forecast(self): self.status_bar.showMessage("Forecast - To be implemented")
-    def show_safety(self): self.status_bar.showMessage("Safety & BOP - To be implemented")
-    def show_drills(self): self.status_bar.showMessage("Safety drills - To be implemented")
-    def show_waste(self): self.status_bar.showMessage("Waste management - To be implemented")
-    def spill_report(self): self.status_bar.showMessage("Spill report - To be implemented")
-    def show_inspections(self): self.status_bar.showMessage("Inspections - To be implemented")
-    def show_incidents(self): self.status_bar.showMessage("Incidents - To be implemented")
-    def generate_daily(self): self.status_bar.showMessage("Generate daily report - To be implemented")
-    def generate_weekly(self): self.status_bar.showMessage("Generate weekly report - To be implemented")
-    def generate_eow(self): self.status_bar.showMessage("Generate EOW report - To be implemented")
-    def export_csv(self): self.status_bar.showMessage("Export CSV - To be implemented")
-    def save_template(self): self.status_bar.showMessage("Save template - To be implemented")
-    def load_template(self): self.status_bar.showMessage("Load template - To be implemented")
-    def npt_analysis(self): self.status_bar.showMessage("NPT analysis - To be implemented")
-    def cost_analysis(self): self.status_bar.showMessage("Cost analysis - To be implemented")
+
+# Ribbon button handlers that only report the feature as pending
+_PLACEHOLDER_ACTIONS = (
+    ("add_time_entry", "Add time entry - To be implemented"),
+    ("edit_time_entry", "Edit time entry - To be implemented"),
+    ("show_npt_report", "NPT report - To be implemented"),
+    ("show_lookahead", "7-day lookahead - To be implemented"),
+    ("show_codes", "Activity codes - To be implemented"),
+    ("time_analysis", "Time analysis - To be implemented"),
+    ("productivity", "Productivity analysis - To be implemented"),
+    ("show_downhole", "Downhole equipment - To be implemented"),
+    ("show_drill_pipe", "Drill pipe specs - To be implemented"),
+    ("show_cement", "Cement data - To be implemented"),
+    ("show_casing", "Casing data - To be implemented"),
+    ("show_solid_control", "Solid control - To be implemented"),
+    ("solid_performance", "Solid performance - To be implemented"),
+    ("show_formations", "Formations - To be implemented"),
+    ("show_trajectory", "Trajectory - To be implemented"),
+    ("formation_eval", "Formation eval - To be implemented"),
+    ("drilling_chart", "Drilling chart - To be implemented"),
+    ("survey_chart", "Survey chart - To be implemented"),
+    ("mud_chart", "Mud chart - To be implemented"),
+    ("show_pob", "POB status - To be implemented"),
+    ("show_inventory", "Inventory - To be implemented"),
+    ("show_material", "Material handling - To be implemented"),
+    ("show_services", "Service companies - To be implemented"),
+    ("show_transport", "Transport log - To be implemented"),
+    ("show_weather", "Weather data - To be implemented"),
+    ("show_forecast", "Forecast - To be implemented"),
+    ("show_safety", "Safety & BOP - To be implemented"),
+    ("show_drills", "Safety drills - To be implemented"),
+    ("show_waste", "Waste management - To be implemented"),
+    ("spill_report", "Spill report - To be implemented"),
+    ("show_inspections", "Inspections - To be implemented"),
+    ("show_incidents", "Incidents - To be implemented"),
+    ("generate_daily", "Generate daily report - To be implemented"),
+    ("generate_weekly", "Generate weekly report - To be implemented"),
+    ("generate_eow", "Generate EOW report - To be implemented"),
+    ("export_csv", "Export CSV - To be implemented"),
+    ("save_template", "Save template - To be implemented"),
+    ("load_template", "Load template - To be implemented"),
+    ("cost_analysis", "Cost analysis - To be implemented"),
+)
+
+def _placeholder_handler(message):
+    def handler(self):
+        self.show_status(message)
+    return handler
+
+for _name, _message in _PLACEHOLDER_ACTIONS:
+    setattr(MainWindow, _name, _placeholder_handler(_message))
+del _name, _message
 
 # ============================================
 # LOGIN DIALOG
 # ============================================
 
+# Usernames outside this shape cannot exist, so they are rejected without a DB lookup
+_USERNAME_RE = re.compile(r"\A[A-Za-z0-9_.@-]{1,64}\Z")
+MAX_PASSWORD_LENGTH = 128
+
 class LoginDialog(QDialog):
     """Login dialog for user authentication"""
     def __init__(self, db_manager):
@@ -4840,12 +6199,7 @@ class LoginDialog(QDialog):
         # Application title
         title_label = QLabel("Nikan Drill Master")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-            padding: 20px;
-        """)
+        title_label.setObjectName("loginTitle")
         layout.addWidget(title_label)
         
         # Login form
@@ -4865,26 +6219,15 @@ class LoginDialog(QDialog):
         
         # Error message
         self.error_label = QLabel("")
-        self.error_label.setStyleSheet("color: #e74c3c;")
+        self.error_label.setObjectName("loginError")
         self.error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.error_label)
         
         # Buttons
         button_layout = QHBoxLayout()
         
-        login_button = QPushButton("Login")
-        login_button.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #219653;
-            }
-        """)
+        self.login_button = login_button = QPushButton("Login")
+        login_button.setObjectName("loginPrimary")
         login_button.clicked.connect(self.authenticate)
         
         exit_button = QPushButton("Exit")
@@ -4898,7 +6241,7 @@ class LoginDialog(QDialog):
         # Version info
         version_label = QLabel("Version 1.0.0")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version_label.setStyleSheet("color: #95a5a6; font-size: 10px;")
+        version_label.setObjectName("loginVersion")
         layout.addWidget(version_label)
         
         self.setLayout(layout)
@@ -4912,13 +6255,33 @@ class LoginDialog(QDialog):
             self.error_label.setText("Please enter both username and password")
             return
         
-        user = self.db.authenticate_user(username, password)
+        if not _USERNAME_RE.match(username) or len(password) > MAX_PASSWORD_LENGTH:
+            self.error_label.setText("Invalid username or password")
+            self.password_input.clear()
+            return
+        
+        # Hash check and lookup run on the thread pool so the dialog keeps painting
+        self.login_button.setEnabled(False)
+        self.error_label.setText("")
+        start_task(
+            self.db.authenticate_user, username, password,
+            on_finished=self._on_authenticated,
+            on_failed=self._on_authenticated_failed,
+        )
+    
+    def _on_authenticated(self, user):
+        """Accept the dialog or report a failed login"""
+        self.login_button.setEnabled(True)
         if user:
             self.user = user
             self.accept()
         else:
             self.error_label.setText("Invalid username or password")
             self.password_input.clear()
+    
+    def _on_authenticated_failed(self, message):
+        self.login_button.setEnabled(True)
+        self.error_label.setText(f"Login error: {message}")
 
 # ============================================
 # APPLICATION ENTRY POINT
@@ -4928,25 +6291,11 @@ def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
     
-    # Set application style
-    app.setStyle("Fusion")
-    
-    # Create palette for dark/light theme
-    palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Link, QColor(41, 128, 185))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(41, 128, 185))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-    app.setPalette(palette)
+    # Set application style (NDM_SKIP_STYLE=1 keeps the platform defaults)
+    if os.environ.get("NDM_SKIP_STYLE") != "1":
+        app.setStyle("Fusion")
+        app.setPalette(build_palette())
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Initialize database
     db = DatabaseManager()
@@ -4955,7 +6304,7 @@ def main():
     login_dialog = LoginDialog(db)
     if login_dialog.exec() == QDialog.DialogCode.Accepted:
         # Login successful, show main window
-        window = MainWindow(login_dialog.user)
+        window = MainWindow(login_dialog.user, db)
         window.show()
         sys.exit(app.exec())
     else:
@@ -4969,12 +6318,123 @@ if __name__ == "__main__":
 # INVENTORY WIDGET
 # ============================================
 
+class InventoryTableModel(QAbstractTableModel):
+    """Table model over an InventoryItem list (shared with the owning widget)"""
+    HEADERS = ("Item", "Category", "Opening", "Received", "Used", "Remaining", "Unit", "Last Updated")
+    FIELDS = ("item", "category", "opening", "received", "used", "remaining", "unit", "last_updated")
+    FORMATS = (None, None, "{:.2f}", "{:.2f}", "{:.2f}", "{:.2f}", None, None)
+    STOCK_FIELDS = ("opening", "received", "used", "remaining")
+    FETCH_BATCH = 200
+    
+    def __init__(self, items, parent=None):
+        super().__init__(parent)
+        self._items = items
+        # Rows exposed to views so far; the rest are handed out through fetchMore
+        self._loaded = len(items)
+        # Quantities mirrored row-wise in a float64 buffer for vectorized summaries;
+        # capacity grows by doubling so appends stay amortized O(1)
+        self._stock = np.zeros((16, len(self.STOCK_FIELDS)), dtype=np.float64)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.FIELDS)
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._items)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self._items) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid() or role not in (_DISPLAY_ROLE, _EDIT_ROLE):
+            return None
+        value = getattr(self._items[index.row()], self.FIELDS[index.column()])
+        fmt = self.FORMATS[index.column()]
+        if role == _EDIT_ROLE or fmt is None:
+            return value
+        return fmt.format(value)
+    
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def set_items(self, items):
+        """Replace the contents of the shared list with one model reset"""
+        self.beginResetModel()
+        self._items[:] = items
+        self._stock = np.zeros((max(16, len(self._items)), len(self.STOCK_FIELDS)), dtype=np.float64)
+        for row, item in enumerate(self._items):
+            self._store_stock(row, item)
+        self._loaded = min(self.FETCH_BATCH, len(self._items))
+        self.endResetModel()
+    
+    def append_item(self, item):
+        # A new item goes last, so expose the unfetched rows before it first
+        while self.canFetchMore():
+            self.fetchMore()
+        row = len(self._items)
+        if row == len(self._stock):
+            self._stock = np.vstack((self._stock, np.zeros_like(self._stock)))
+        self._store_stock(row, item)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(item)
+        self._loaded += 1
+        self.endInsertRows()
+    
+    def remove_row(self, row):
+        if 0 <= row < self._loaded:
+            count = len(self._items)
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._items[row]
+            self._stock[row:count - 1] = self._stock[row + 1:count]
+            self._loaded -= 1
+            self.endRemoveRows()
+    
+    def item_changed(self, row, first_column=0, last_column=None):
+        """Repaint the given column span of one row after its item was mutated"""
+        if last_column is None:
+            last_column = len(self.FIELDS) - 1
+        self._store_stock(row, self._items[row])
+        self.dataChanged.emit(self.index(row, first_column), self.index(row, last_column), _DISPLAY_EDIT_ROLES)
+    
+    def _store_stock(self, row, item):
+        self._stock[row] = (item.opening, item.received, item.used, item.remaining)
+    
+    def stock(self):
+        """(rows, 4) view of opening/received/used/remaining for the current items"""
+        return self._stock[:len(self._items)]
+
 class InventoryWidget(QWidget):
     """Inventory management widget"""
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
         self.inventory_items = []
+        # Well the listed items belong to; saves go here, not to the combo's selection
+        self._loaded_well_id = None
+        # id() of the items currently flagged low / critical, kept up to date per
+        # edit; a full reclassification only runs after a reload or level change
+        self._low_set = set()
+        self._crit_set = set()
+        self._levels_dirty = True
+        self._last_summary_key = None
+        
+        # Summary recomputes coalesced so spin box ticks and typing run it once
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(50)
+        self._summary_timer.timeout.connect(self._do_update_inventory_summary)
+        
         self.init_ui()
     
     def init_ui(self):
@@ -4982,7 +6442,7 @@ class InventoryWidget(QWidget):
         
         # Title
         title_label = QLabel("Inventory Management")
-        title_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
+        title_label.setObjectName("inventoryTitle")
         main_layout.addWidget(title_label)
         
         # Well selection
@@ -5003,12 +6463,8 @@ class InventoryWidget(QWidget):
         table_group = QGroupBox("Inventory Items")
         table_layout = QVBoxLayout()
         
-        self.inventory_table = QTableWidget()
-        self.inventory_table.setColumnCount(8)
-        self.inventory_table.setHorizontalHeaderLabels([
-            "Item", "Category", "Opening", "Received", 
-            "Used", "Remaining", "Unit", "Last Updated"
-        ])
+        self.inventory_model = InventoryTableModel(self.inventory_items, self)
+        self.inventory_table = make_table_view(self.inventory_model)
         
         # Table buttons
         table_buttons = QHBoxLayout()
@@ -5054,7 +6510,7 @@ class InventoryWidget(QWidget):
         self.reorder_level_spin = QSpinBox()
         self.reorder_level_spin.setRange(0, 100)
         self.reorder_level_spin.setValue(20)
-        self.reorder_level_spin.valueChanged.connect(self.update_inventory_summary)
+        self.reorder_level_spin.valueChanged.connect(self._on_levels_changed)
         summary_layout.addWidget(self.reorder_level_spin, 1, 1)
         
         # Critical level input
@@ -5062,7 +6518,7 @@ class InventoryWidget(QWidget):
         self.critical_level_spin = QSpinBox()
         self.critical_level_spin.setRange(0, 100)
         self.critical_level_spin.setValue(10)
-        self.critical_level_spin.valueChanged.connect(self.update_inventory_summary)
+        self.critical_level_spin.valueChanged.connect(self._on_levels_changed)
         summary_layout.addWidget(self.critical_level_spin, 1, 3)
         
         summary_group.setLayout(summary_layout)
@@ -5078,38 +6534,31 @@ class InventoryWidget(QWidget):
         low_stock_layout.addWidget(self.low_stock_message)
         low_stock_layout.addStretch()
         self.low_stock_widget.setLayout(low_stock_layout)
-        self.low_stock_widget.setStyleSheet("background-color: #fff3cd; border: 1px solid #ffeaa7; padding: 5px;")
+        self.low_stock_widget.setObjectName("lowStockAlert")
+        # A plain QWidget only paints a stylesheet background with this attribute
+        self.low_stock_widget.setAttribute(Qt.WA_StyledBackground, True)
         main_layout.addWidget(self.low_stock_widget)
         
         # Save button
-        save_button = QPushButton("Save Inventory")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                padding: 10px 20px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
-        save_button.clicked.connect(self.save_inventory)
-        main_layout.addWidget(save_button)
+        self.save_button = QPushButton("Save Inventory")
+        self.save_button.setObjectName("saveInventory")
+        self.save_button.clicked.connect(self.save_inventory)
+        main_layout.addWidget(self.save_button)
         
         self.setLayout(main_layout)
         
-        # Load wells
+        # Load wells, and reload only when the wells table changes
         self.load_wells()
+        self.db.wells_changed.connect(self.load_wells)
     
     def load_wells(self):
         """Load wells into combo box"""
-        self.inventory_well_combo.clear()
-        wells = self.db.get_all_wells()
-        
-        for well in wells:
-            self.inventory_well_combo.addItem(f"{well.name} - {well.field}", well.id)
+        fill_well_combo(self.inventory_well_combo, self.db)
+    
+    def _set_busy(self, busy):
+        """Disable Load and Save together so a load never races a save"""
+        self.load_button.setEnabled(not busy)
+        self.save_button.setEnabled(not busy)
     
     def load_inventory(self):
         """Load inventory for selected well"""
@@ -5118,41 +6567,26 @@ class InventoryWidget(QWidget):
             QMessageBox.warning(self, "Error", "Please select a well.")
             return
         
-        # TODO: Load inventory from database
-        self.inventory_table.setRowCount(0)
-        self.inventory_items.clear()
-        
-        # Add sample data for demonstration
-        sample_items = [
-            ("Drill Pipe 5\"", "Pipe", 1000, 500, 300, 1200, "ft", "2024-01-15"),
-            ("Casing 9 5/8\"", "Casing", 500, 200, 100, 600, "ft", "2024-01-15"),
-            ("Cement Class G", "Cement", 1000, 500, 400, 1100, "sack", "2024-01-15"),
-            ("Barite", "Mud Chemical", 5000, 2000, 1500, 5500, "lb", "2024-01-15"),
-            ("Bentonite", "Mud Chemical", 3000, 1000, 800, 3200, "lb", "2024-01-15"),
-        ]
-        
-        for item in sample_items:
-            row = self.inventory_table.rowCount()
-            self.inventory_table.insertRow(row)
-            
-            for col, value in enumerate(item):
-                self.inventory_table.setItem(row, col, QTableWidgetItem(str(value)))
-            
-            # Add to internal list
-            inventory_item = InventoryItem(
-                item=item[0],
-                category=item[1],
-                opening=item[2],
-                received=item[3],
-                used=item[4],
-                remaining=item[5],
-                unit=item[6],
-                last_updated=item[7]
-            )
-            self.inventory_items.append(inventory_item)
-        
+        well_id = self.inventory_well_combo.itemData(well_index)
+        self._set_busy(True)
+        start_task(
+            self.db.get_inventory_many, well_id,
+            on_finished=lambda items: self._on_inventory_loaded(well_id, items),
+            on_failed=self._on_inventory_load_failed,
+        )
+    
+    def _on_inventory_loaded(self, well_id, items):
+        """Show items fetched on the thread pool"""
+        self._set_busy(False)
+        self._loaded_well_id = well_id
+        self.inventory_model.set_items(items)
+        self._levels_dirty = True
         self.update_inventory_summary()
     
+    def _on_inventory_load_failed(self, message):
+        self._set_busy(False)
+        QMessageBox.warning(self, "Error", f"Failed to load inventory:\n{message}")
+    
     def add_inventory_item_dialog(self):
         """Show dialog to add inventory item"""
         dialog = QDialog(self)
@@ -5245,25 +6679,6 @@ class InventoryWidget(QWidget):
             QMessageBox.warning(self, "Error", "Please enter item name.")
             return
         
-        # Add to table
-        row = self.inventory_table.rowCount()
-        self.inventory_table.insertRow(row)
-        
-        item_data = [
-            item_name,
-            self.new_item_category.currentText(),
-            str(self.new_item_opening.value()),
-            str(self.new_item_received.value()),
-            str(self.new_item_used.value()),
-            str(self.new_item_remaining.value()),
-            self.new_item_unit.currentText(),
-            QDate.currentDate().toString("yyyy-MM-dd")
-        ]
-        
-        for col, value in enumerate(item_data):
-            self.inventory_table.setItem(row, col, QTableWidgetItem(value))
-        
-        # Add to internal list
         inventory_item = InventoryItem(
             item=item_name,
             category=self.new_item_category.currentText(),
@@ -5274,14 +6689,15 @@ class InventoryWidget(QWidget):
             unit=self.new_item_unit.currentText(),
             last_updated=QDate.currentDate().toString("yyyy-MM-dd")
         )
-        self.inventory_items.append(inventory_item)
+        self.inventory_model.append_item(inventory_item)
+        self._classify_item(inventory_item)
         
         self.update_inventory_summary()
         dialog.accept()
     
     def edit_inventory_item(self):
         """Edit selected inventory item"""
-        selected_row = self.inventory_table.currentRow()
+        selected_row = self.inventory_table.currentIndex().row()
         if selected_row < 0:
             QMessageBox.warning(self, "Error", "Please select an item to edit.")
             return
@@ -5291,16 +6707,17 @@ class InventoryWidget(QWidget):
     
     def delete_inventory_item(self):
         """Delete selected inventory item"""
-        selected_row = self.inventory_table.currentRow()
+        selected_row = self.inventory_table.currentIndex().row()
         if selected_row >= 0:
-            self.inventory_table.removeRow(selected_row)
-            if selected_row < len(self.inventory_items):
-                del self.inventory_items[selected_row]
+            item = self.inventory_items[selected_row]
+            self._low_set.discard(id(item))
+            self._crit_set.discard(id(item))
+            self.inventory_model.remove_row(selected_row)
             self.update_inventory_summary()
     
     def adjust_stock_dialog(self):
         """Show dialog to adjust stock"""
-        selected_row = self.inventory_table.currentRow()
+        selected_row = self.inventory_table.currentIndex().row()
         if selected_row < 0:
             QMessageBox.warning(self, "Error", "Please select an item to adjust.")
             return
@@ -5312,8 +6729,9 @@ class InventoryWidget(QWidget):
         layout = QVBoxLayout()
         form = QFormLayout()
         
-        item_name = self.inventory_table.item(selected_row, 0).text()
-        current_stock = float(self.inventory_table.item(selected_row, 5).text())
+        selected_item = self.inventory_items[selected_row]
+        item_name = selected_item.item
+        current_stock = selected_item.remaining
         
         form.addRow("Item:", QLabel(item_name))
         form.addRow("Current Stock:", QLabel(f"{current_stock}"))
@@ -5359,11 +6777,13 @@ class InventoryWidget(QWidget):
         if quantity <= 0:
             QMessageBox.warning(self, "Error", "Quantity must be greater than zero.")
             return
+        if row >= len(self.inventory_items):
+            dialog.reject()  # the list was reloaded while the dialog was open
+            return
         
-        # Get current values
-        received = float(self.inventory_table.item(row, 3).text())
-        used = float(self.inventory_table.item(row, 4).text())
-        remaining = float(self.inventory_table.item(row, 5).text())
+        # Get current values straight from the item
+        item = self.inventory_items[row]
+        received, used, remaining = item.received, item.used, item.remaining
         
         # Apply adjustment
         if adjustment_type == "Receive":
@@ -5379,74 +6799,125 @@ class InventoryWidget(QWidget):
             # Direct adjustment to remaining
             remaining = quantity
         
-        # Update table
-        self.inventory_table.setItem(row, 3, QTableWidgetItem(str(received)))
-        self.inventory_table.setItem(row, 4, QTableWidgetItem(str(used)))
-        self.inventory_table.setItem(row, 5, QTableWidgetItem(str(remaining)))
-        self.inventory_table.setItem(row, 7, QTableWidgetItem(QDate.currentDate().toString("yyyy-MM-dd")))
-        
-        # Update internal list
-        if row < len(self.inventory_items):
-            self.inventory_items[row].received = received
-            self.inventory_items[row].used = used
-            self.inventory_items[row].remaining = remaining
-            self.inventory_items[row].last_updated = QDate.currentDate().toString("yyyy-MM-dd")
+        # Update the item and repaint its changed cells
+        item.received, item.used, item.remaining = received, used, remaining
+        item.last_updated = QDate.currentDate().toString("yyyy-MM-dd")
+        self.inventory_model.item_changed(row, 3, 7)
+        self._classify_item(item)
         
         self.update_inventory_summary()
         dialog.accept()
     
     def update_inventory_summary(self):
-        """Update inventory summary information"""
-        total_items = self.inventory_table.rowCount()
-        self.total_items_label.setText(f"Total Items: {total_items}")
-        
-        # Calculate low and critical stock items
-        low_stock_count = 0
-        critical_count = 0
-        low_stock_items = []
-        
+        """Schedule a summary refresh (debounced)"""
+        self._summary_timer.start()
+    
+    def _on_levels_changed(self):
+        self._levels_dirty = True
+        self.update_inventory_summary()
+    
+    def _classify_item(self, item):
+        """Move one item into the low / critical set matching its current stock"""
+        key = id(item)
+        self._low_set.discard(key)
+        self._crit_set.discard(key)
+        initial_stock = item.opening + item.received
+        if initial_stock <= 0:
+            return  # items with no initial stock are never flagged
+        stock_percentage = item.remaining / initial_stock
+        if stock_percentage <= self.critical_level_spin.value() / 100:
+            self._crit_set.add(key)
+        elif stock_percentage <= self.reorder_level_spin.value() / 100:
+            self._low_set.add(key)
+    
+    def _classify_all(self):
+        """Rebuild the low / critical sets in one pass over the stock buffer"""
         reorder_level = self.reorder_level_spin.value() / 100
         critical_level = self.critical_level_spin.value() / 100
         
-        for row in range(total_items):
-            item_name = self.inventory_table.item(row, 0).text()
-            opening = float(self.inventory_table.item(row, 2).text())
-            received = float(self.inventory_table.item(row, 3).text())
-            used = float(self.inventory_table.item(row, 4).text())
-            remaining = float(self.inventory_table.item(row, 5).text())
-            
-            initial_stock = opening + received
-            if initial_stock > 0:
-                stock_percentage = remaining / initial_stock
-                
-                if stock_percentage <= critical_level:
-                    critical_count += 1
-                    low_stock_items.append(f"{item_name} ({remaining:.0f})")
-                elif stock_percentage <= reorder_level:
-                    low_stock_count += 1
-                    low_stock_items.append(f"{item_name} ({remaining:.0f})")
+        stock = self.inventory_model.stock()
+        initial_stock = stock[:, 0] + stock[:, 1]
+        remaining = stock[:, 3]
+        stock_percentage = np.divide(
+            remaining, initial_stock, out=np.full_like(remaining, np.inf), where=initial_stock > 0
+        )
+        critical_mask = stock_percentage <= critical_level
+        low_mask = (stock_percentage <= reorder_level) & ~critical_mask
+        items = self.inventory_items
+        self._crit_set = {id(items[row]) for row in np.flatnonzero(critical_mask)}
+        self._low_set = {id(items[row]) for row in np.flatnonzero(low_mask)}
+    
+    def _do_update_inventory_summary(self):
+        """Update inventory summary information"""
+        if self._levels_dirty:
+            self._classify_all()
+            self._levels_dirty = False
+        
+        total_items = len(self.inventory_items)
+        low_stock_count = len(self._low_set)
+        critical_count = len(self._crit_set)
+        flagged_count = low_stock_count + critical_count
+        
+        flagged = []
+        if flagged_count:
+            low_set, crit_set = self._low_set, self._crit_set
+            for item in self.inventory_items:
+                if id(item) in crit_set or id(item) in low_set:
+                    flagged.append(f"{item.item} ({item.remaining:.0f})")
+                    if len(flagged) == 5:  # Show first 5 items
+                        break
+        
+        # Identical text would still relayout and repaint the labels
+        key = (total_items, low_stock_count, critical_count, tuple(flagged))
+        if key == self._last_summary_key:
+            return
+        self._last_summary_key = key
         
+        self.total_items_label.setText(f"Total Items: {total_items}")
         self.low_stock_label.setText(f"Low Stock Items: {low_stock_count}")
         self.critical_items_label.setText(f"Critical Items: {critical_count}")
         
         # Show/hide low stock alert
-        if low_stock_items:
+        if flagged:
             self.low_stock_widget.setVisible(True)
-            items_text = ", ".join(low_stock_items[:5])  # Show first 5 items
-            if len(low_stock_items) > 5:
-                items_text += f" and {len(low_stock_items) - 5} more..."
+            items_text = ", ".join(flagged)
+            if flagged_count > 5:
+                items_text += f" and {flagged_count - 5} more..."
             self.low_stock_message.setText(f"Low stock items: {items_text}")
         else:
             self.low_stock_widget.setVisible(False)
     
     def save_inventory(self):
         """Save inventory to database"""
-        well_index = self.inventory_well_combo.currentIndex()
-        if well_index < 0:
-            QMessageBox.warning(self, "Error", "Please select a well.")
+        well_id = self._loaded_well_id
+        if well_id is None:
+            # Nothing loaded yet: the list was built from scratch for the selected well
+            well_index = self.inventory_well_combo.currentIndex()
+            if well_index < 0:
+                QMessageBox.warning(self, "Error", "Please select a well.")
+                return
+            well_id = self.inventory_well_combo.itemData(well_index)
+        
+        # Snapshot the list so edits made while saving don't shift the returned ids
+        items = list(self.inventory_items)
+        self._set_busy(True)
+        start_task(
+            self.db.bulk_upsert_inventory, well_id, items,
+            on_finished=lambda ids: self._on_inventory_saved(well_id, items, ids),
+            on_failed=lambda message: self._on_inventory_saved(well_id, items, None),
+        )
+    
+    def _on_inventory_saved(self, well_id, items, ids):
+        """Record the ids assigned by the database"""
+        self._set_busy(False)
+        if ids is None:
+            QMessageBox.warning(self, "Error", "Failed to save inventory.")
             return
         
-        # TODO: Save to database
+        for item, item_id in zip(items, ids):
+            item.id = item_id
+            item.well_id = well_id
+        self._loaded_well_id = well_id
         QMessageBox.information(self, "Success", "Inventory saved successfully!")
 
 # ============================================
@@ -6286,6 +7757,7 @@ class SafetyBOPWidget(QWidget):
     def __init__(self, db_manager):
         super().__init__()
         self.db = db_manager
+        self._startup_date = QDate.currentDate()  # shared by the drill/test date defaults
         self.init_ui()
     
     def init_ui(self):
@@ -6359,7 +7831,7 @@ class SafetyBOPWidget(QWidget):
         fire_layout = QHBoxLayout()
         self.fire_drill_date = QDateEdit()
         self.fire_drill_date.setCalendarPopup(True)
-        self.fire_drill_date.setDate(QDate.currentDate().addDays(-7))
+        self.fire_drill_date.setDate(self._startup_date.addDays(-7))
         
         self.fire_drill_result = QComboBox()
         self.fire_drill_result.addItems(["Pass", "Fail", "Scheduled", "Cancelled"])
@@ -6377,7 +7849,7 @@ class SafetyBOPWidget(QWidget):
         bop_layout = QHBoxLayout()
         self.bop_drill_date = QDateEdit()
         self.bop_drill_date.setCalendarPopup(True)
-        self.bop_drill_date.setDate(QDate.currentDate().addDays(-14))
+        self.bop_drill_date.setDate(self._startup_date.addDays(-14))
         
         self.bop_drill_result = QComboBox()
         self.bop_drill_result.addItems(["Pass", "Fail", "Scheduled", "Cancelled"])
@@ -6395,7 +7867,7 @@ class SafetyBOPWidget(QWidget):
         h2s_layout = QHBoxLayout()
         self.h2s_drill_date = QDateEdit()
         self.h2s_drill_date.setCalendarPopup(True)
-        self.h2s_drill_date.setDate(QDate.currentDate().addDays(-21))
+        self.h2s_drill_date.setDate(self._startup_date.addDays(-21))
         
         self.h2s_drill_result = QComboBox()
         self.h2s_drill_result.addItems(["Pass", "Fail", "Scheduled", "Cancelled"])
@@ -6508,7 +7980,7 @@ class SafetyBOPWidget(QWidget):
         last_test_layout = QHBoxLayout()
         self.last_test_date = QDateEdit()
         self.last_test_date.setCalendarPopup(True)
-        self.last_test_date.setDate(QDate.currentDate().addDays(-30))
+        self.last_test_date.setDate(self._startup_date.addDays(-30))
         
         self.test_pressure = QDoubleSpinBox()
         self.test_pressure.setRange(0, 50000)
@@ -6534,7 +8006,7 @@ class SafetyBOPWidget(QWidget):
         next_test_layout = QHBoxLayout()
         self.next_test_due = QDateEdit()
         self.next_test_due.setCalendarPopup(True)
-        self.next_test_due.setDate(QDate.currentDate().addDays(30))
+        self.next_test_due.setDate(self._startup_date.addDays(30))
         
         self.test_frequency = QComboBox()
         self.test_frequency.addItems(["Weekly", "Bi-weekly", "Monthly", "Quarterly", "As Required"])
@@ -6791,25 +8263,11 @@ def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
     
-    # Set application style
-    app.setStyle("Fusion")
-    
-    # Create palette for dark/light theme
-    palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Link, QColor(41, 128, 185))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(41, 128, 185))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-    app.setPalette(palette)
+    # Set application style (NDM_SKIP_STYLE=1 keeps the platform defaults)
+    if os.environ.get("NDM_SKIP_STYLE") != "1":
+        app.setStyle("Fusion")
+        app.setPalette(build_palette())
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Initialize database
     db = DatabaseManager()
@@ -6818,7 +8276,7 @@ def main():
     login_dialog = LoginDialog(db)
     if login_dialog.exec() == QDialog.DialogCode.Accepted:
         # Login successful, show main window
-        window = MainWindow(login_dialog.user)
+        window = MainWindow(login_dialog.user, db)
         
         # Replace module initialization with updated version
         window.init_modules = lambda: init_modules_updated(window)
@@ -8391,25 +9849,11 @@ def main():
     """Main application entry point"""
     app = QApplication(sys.argv)
     
-    # Set application style
-    app.setStyle("Fusion")
-    
-    # Create palette for dark/light theme
-    palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Link, QColor(41, 128, 185))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(41, 128, 185))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-    app.setPalette(palette)
+    # Set application style (NDM_SKIP_STYLE=1 keeps the platform defaults)
+    if os.environ.get("NDM_SKIP_STYLE") != "1":
+        app.setStyle("Fusion")
+        app.setPalette(build_palette())
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Set application font
     font = QFont("Segoe UI", 10)
@@ -8422,7 +9866,7 @@ def main():
     login_dialog = LoginDialog(db)
     if login_dialog.exec() == QDialog.DialogCode.Accepted:
         # Login successful, show main window
-        window = MainWindow(login_dialog.user)
+        window = MainWindow(login_dialog.user, db)
         
         # Replace module initialization with complete version
         window.init_modules = lambda: init_modules_complete(window)
@@ -9870,78 +11314,29 @@ def init_modules_all(self):
     """Initialize all application modules - Full version"""
     # Well Information
     self.well_info_widget = WellInfoWidget(self.db)
-    self.tab_widget.addTab(self.well_info_widget, "🏠 Well Info")
-    
-    # Daily Report
-    self.daily_report_widget = DailyReportWidget(self.db)
-    self.tab_widget.addTab(self.daily_report_widget, "🗓 Daily Report")
-    
-    # Drilling Parameters
-    self.drilling_params_widget = DrillingParametersWidget(self.db)
-    self.tab_widget.addTab(self.drilling_params_widget, "⚙️ Drilling Params")
-    
-    # Mud Report
-    self.mud_report_widget = MudReportWidget(self.db)
-    self.tab_widget.addTab(self.mud_report_widget, "🧪 Mud Report")
-    
-    # Bit Report
-    self.bit_report_widget = BitReportWidget(self.db)
-    self.tab_widget.addTab(self.bit_report_widget, "🔩 Bit Report")
-    
-    # BHA Report
-    self.bha_report_widget = BHAReportWidget(self.db)
-    self.tab_widget.addTab(self.bha_report_widget, "🛠️ BHA Report")
-    
-    # Survey Data
-    self.survey_widget = SurveyDataWidget(self.db)
-    self.tab_widget.addTab(self.survey_widget, "📈 Survey Data")
-    
-    # Personnel & Logistics
-    self.personnel_widget = PersonnelLogisticsWidget(self.db)
-    self.tab_widget.addTab(self.personnel_widget, "👥 Personnel & Logistics")
-    
-    # Inventory Management
-    self.inventory_widget = InventoryWidget(self.db)
-    self.tab_widget.addTab(self.inventory_widget, "📦 Inventory")
-    
-    # Service Company Log
-    self.service_widget = ServiceCompanyWidget(self.db)
-    self.tab_widget.addTab(self.service_widget, "🏢 Service Cos")
-    
-    # Material Handling
-    self.material_widget = MaterialHandlingWidget(self.db)
-    self.tab_widget.addTab(self.material_widget, "📝 Material Handling")
-    
-    # Safety & BOP
-    self.safety_widget = SafetyBOPWidget(self.db)
-    self.tab_widget.addTab(self.safety_widget, "🦺 Safety & BOP")
-    
-    # Waste Management
-    self.waste_widget = WasteManagementWidget(self.db)
-    self.tab_widget.addTab(self.waste_widget, "♻️ Waste Mgmt")
-    
-    # Cement & Casing
-    self.cement_widget = CementCasingWidget(self.db)
-    self.tab_widget.addTab(self.cement_widget, "🏗️ Cement & Casing")
-    
-    # Downhole Equipment
-    self.downhole_widget = DownholeEquipmentWidget(self.db)
-    self.tab_widget.addTab(self.downhole_widget, "⚙️ Downhole Eq")
-    
-    # Drill Pipe Specs
-    self.drill_pipe_widget = DrillPipeWidget(self.db)
-    self.tab_widget.addTab(self.drill_pipe_widget, "🔧 Drill Pipe")
-    
-    # Solid Control
-    self.solid_control_widget = SolidControlWidget(self.db)
-    self.tab_widget.addTab(self.solid_control_widget, "🌀 Solid Control")
-    
-    # Fuel & Water
-    self.fuel_water_widget = FuelWaterWidget(self.db)
-    self.tab_widget.addTab(self.fuel_water_widget, "⛽ Fuel & Water")
+    add_icon_tab(self.tab_widget, self.well_info_widget, "🏠 Well Info")
+    
+    # Remaining modules are built on first visit
+    self.add_module_tab("🗓 Daily Report", DailyReportWidget, "daily_report_widget")
+    self.add_module_tab("⚙️ Drilling Params", DrillingParametersWidget, "drilling_params_widget")
+    self.add_module_tab("🧪 Mud Report", MudReportWidget, "mud_report_widget")
+    self.add_module_tab("🔩 Bit Report", BitReportWidget, "bit_report_widget")
+    self.add_module_tab("🛠️ BHA Report", BHAReportWidget, "bha_report_widget")
+    self.add_module_tab("📈 Survey Data", SurveyDataWidget, "survey_widget")
+    self.add_module_tab("👥 Personnel & Logistics", PersonnelLogisticsWidget, "personnel_widget")
+    self.add_module_tab("📦 Inventory", InventoryWidget, "inventory_widget")
+    self.add_module_tab("🏢 Service Cos", ServiceCompanyWidget, "service_widget")
+    self.add_module_tab("📝 Material Handling", MaterialHandlingWidget, "material_widget")
+    self.add_module_tab("🦺 Safety & BOP", SafetyBOPWidget, "safety_widget")
+    self.add_module_tab("♻️ Waste Mgmt", WasteManagementWidget, "waste_widget")
+    self.add_module_tab("🏗️ Cement & Casing", CementCasingWidget, "cement_widget")
+    self.add_module_tab("⚙️ Downhole Eq", DownholeEquipmentWidget, "downhole_widget")
+    self.add_module_tab("🔧 Drill Pipe", DrillPipeWidget, "drill_pipe_widget")
+    self.add_module_tab("🌀 Solid Control", SolidControlWidget, "solid_control_widget")
+    self.add_module_tab("⛽ Fuel & Water", FuelWaterWidget, "fuel_water_widget")
     
     # Add placeholders for remaining modules
-    self.add_placeholder_tabs_all()
+    add_placeholder_tabs_all(self)
 
 def add_placeholder_tabs_all(self):
     """Add placeholder tabs for remaining modules - Full version"""
@@ -9951,16 +11346,7 @@ def add_placeholder_tabs_all(self):
     ]
     
     for title, description in modules:
-        placeholder = QWidget()
-        layout = QVBoxLayout()
-        
-        label = QLabel(f"{title}\n\n{description}\n\n(This module will be implemented in the next phase)")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet("font-size: 16px; color: #7f8c8d;")
-        
-        layout.addWidget(label)
-        placeholder.setLayout(layout)
-        self.tab_widget.addTab(placeholder, title)
+        self.add_module_tab(title, lambda db, t=title, d=description: make_placeholder_page(t, d))
 
 # ============================================
 # APPLICATION ENTRY POINT - FINAL VERSION
@@ -9970,25 +11356,11 @@ def main():
     """Main application entry point - Final version"""
     app = QApplication(sys.argv)
     
-    # Set application style
-    app.setStyle("Fusion")
-    
-    # Create palette for dark/light theme
-    palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Base, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Text, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 240))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(0, 0, 0))
-    palette.setColor(QPalette.ColorRole.BrightText, QColor(255, 255, 255))
-    palette.setColor(QPalette.ColorRole.Link, QColor(41, 128, 185))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(41, 128, 185))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(255, 255, 255))
-    app.setPalette(palette)
+    # Set application style (NDM_SKIP_STYLE=1 keeps the platform defaults)
+    if os.environ.get("NDM_SKIP_STYLE") != "1":
+        app.setStyle("Fusion")
+        app.setPalette(build_palette())
+    app.setStyleSheet(APP_STYLESHEET)
     
     # Set application font
     font = QFont("Segoe UI", 10)
@@ -10001,7 +11373,7 @@ def main():
     login_dialog = LoginDialog(db)
     if login_dialog.exec() == QDialog.DialogCode.Accepted:
         # Login successful, show main window
-        window = MainWindow(login_dialog.user)
+        window = MainWindow(login_dialog.user, db)
         
         # Replace module initialization with full version
         window.init_modules = lambda: init_modules_all(window)